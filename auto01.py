@@ -12,24 +12,45 @@ import sys
 import json
 import time
 import re
+import random
 import logging
-from datetime import datetime
+import threading
+import asyncio
+import signal
+import argparse
+import atexit
+import math
+import queue
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
 import hashlib
+import sqlite3
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from bisect import bisect_left
 
 # ==================== THIRD PARTY ====================
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+# Selenium/undetected_chromedriver, requests, httpx and lxml are imported
+# where they are first used: a run that ends on an HTTP 304 never loads
+# Selenium, and the bot serving on-disk data loads none of them.
+try:
+    import psutil
+except ImportError:  # optional: only used for memory figures
+    psutil = None
+
+if TYPE_CHECKING:
+    import httpx
 
 # ==================== CONFIG ====================
+TELEGRAM_API_BASE = "https://api.telegram.org"
+
+
 @dataclass
 class Config:
     bot_token: str
@@ -41,12 +62,37 @@ class Config:
     timeout: int
     data_dir: Path
     logs_dir: Path
+    current_file: str = "current.json"
+    previous_file: str = "previous.json"
+    history_db: str = "history.sqlite3"
+    extraction_mode: str = "script"
+    page_load_timeout: int = 60
+    scroll_delay_min: float = 2
+    scroll_delay_max: float = 4
+    readiness_quiet_ms: int = 300
+    subscriber_chat_ids: List[str] = field(default_factory=list)
+    telegram_api_base: str = TELEGRAM_API_BASE
+    telegram_global_rate: float = 25.0
+    telegram_per_chat_rate: float = 1.0
+    telegram_retry_file: str = "telegram_retry.jsonl"
+    driver_pool: Dict = field(default_factory=dict)
+    schedule: Dict = field(default_factory=dict)
+    targets: List[Dict] = field(default_factory=list)
+    pipeline: Dict = field(default_factory=dict)
+    metrics: Dict = field(default_factory=dict)
+    chrome_settings: Dict = field(default_factory=dict)
+    log_settings: Dict = field(default_factory=dict)
+    allowed_domains: List[str] = field(default_factory=list)
 
     @classmethod
     def from_file(cls, path="config.json"):
         with open(path, "r", encoding="utf-8") as f:
             d = json.load(f)
 
+        mode = d["scraping"].get("extraction_mode", "script")
+        if mode not in EXTRACTORS:
+            raise ValueError(f"scraping.extraction_mode must be one of {sorted(EXTRACTORS)}, got {mode!r}")
+
         return cls(
             bot_token=d["telegram"]["bot_token"],
             chat_id=d["telegram"]["chat_id"],
@@ -57,27 +103,114 @@ class Config:
             timeout=d["scraping"].get("request_timeout", 30),
             data_dir=Path(d.get("paths", {}).get("data_dir", "data")),
             logs_dir=Path(d.get("paths", {}).get("logs_dir", "logs")),
+            current_file=d.get("paths", {}).get("current_file", "current.json"),
+            previous_file=d.get("paths", {}).get("previous_file", "previous.json"),
+            history_db=d.get("paths", {}).get("history_db", "history.sqlite3"),
+            extraction_mode=mode,
+            page_load_timeout=d["scraping"].get("page_load_timeout", 60),
+            scroll_delay_min=d["scraping"].get("scroll_delay_min", 2),
+            scroll_delay_max=d["scraping"].get("scroll_delay_max", 4),
+            readiness_quiet_ms=d["scraping"].get("readiness_quiet_ms", 300),
+            subscriber_chat_ids=d["telegram"].get("subscriber_chat_ids", []),
+            telegram_api_base=d["telegram"].get("api_base", TELEGRAM_API_BASE),
+            telegram_global_rate=d["telegram"].get("global_rate", 25.0),
+            telegram_per_chat_rate=d["telegram"].get("per_chat_rate", 1.0),
+            telegram_retry_file=d.get("paths", {}).get("telegram_retry_file", "telegram_retry.jsonl"),
+            driver_pool=d.get("driver_pool", {}),
+            schedule=d.get("schedule", {}),
+            targets=d["scraping"].get("targets", []),
+            pipeline=d.get("pipeline", {}),
+            metrics=d.get("metrics", {}),
+            chrome_settings=d["chrome"],
+            log_settings=d.get("logging", {}),
+            allowed_domains=d.get("security", {}).get("allowed_domains", []),
         )
 
 # ==================== LOGGING ====================
-def setup_logging(logs_dir: Path):
-    logs_dir.mkdir(exist_ok=True)
-    log_file = logs_dir / f"auto01_{datetime.now():%Y%m%d}.log"
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout),
-        ],
+LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, LOG_DATEFMT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue with the message merged but unformatted: the listener thread formats"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def stop_logging():
+    """Flush queued records and stop the writer thread (registered with atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(logs_dir: Path, settings: Optional[Dict] = None, name: str = "auto01",
+                  banner: Optional[str] = "AUTO01 SECURE - MotoGP Monitoring Bot Started"):
+    """
+    Send every record through a queue; one listener thread formats them and
+    writes stdout plus logs/<name>.log, which rotates at logging.max_bytes
+    keeping logging.backup_count old files. logging.json writes the file as
+    JSON lines. Callers never wait on disk or console I/O.
+    """
+    settings = settings or {}
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    stop_logging()
+
+    file_handler = RotatingFileHandler(
+        logs_dir / f"{name}.log",
+        maxBytes=settings.get("max_bytes", 10 * 1024 * 1024),
+        backupCount=settings.get("backup_count", 5),
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(
+        JsonLineFormatter() if settings.get("json") else logging.Formatter(LOG_FORMAT, LOG_DATEFMT)
     )
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+
+    global _listener
+    records = queue.SimpleQueue()
+    _listener = QueueListener(records, file_handler, console, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(records))
+    root.setLevel(settings.get("level", "INFO"))
 
     logger = logging.getLogger(__name__)
-    logger.info("=" * 70)
-    logger.info("AUTO01 SECURE - MotoGP Monitoring Bot Started")
-    logger.info("=" * 70)
+    if banner:
+        logger.info("=" * 70)
+        logger.info(banner)
+        logger.info("=" * 70)
     return logger
 
 # ==================== SECURITY ====================
@@ -86,55 +219,839 @@ class SecurityValidator:
     def sanitize(text: str) -> str:
         return re.sub(r"[<>'\"{}();\\]", "", text).strip()
 
-# ==================== TELEGRAM ====================
-class SecureTelegramClient:
-    def __init__(self, token: str, chat_id: str):
-        self.chat_id = chat_id
-        self.api_url = f"https://api.telegram.org/bot{token}/sendMessage"
-        self.session = requests.Session()
-        retry = Retry(total=3, backoff_factor=1)
-        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+# ==================== METRICS ====================
+# Histogram upper bounds in seconds; anything slower lands in +Inf
+PHASE_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+
+class PhaseHistogram:
+    """Fixed-bucket latency histogram: constant memory however many observations"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(PHASE_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(PHASE_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation, capped at max"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(PHASE_BUCKETS[i], self.max) if i < len(PHASE_BUCKETS) else self.max
+        return self.max
+
+
+class _PhaseTimer:
+    """Context manager behind PhaseMetrics.timer(); a plain class is cheaper than a generator"""
+
+    __slots__ = ("metrics", "phase", "labels", "start")
+
+    def __init__(self, metrics: "PhaseMetrics", phase: str, labels: Dict):
+        self.metrics = metrics
+        self.phase = phase
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.phase, time.perf_counter() - self.start, **self.labels)
+
+
+def _label_text(labels: Tuple) -> str:
+    return ",".join(str(v) for _, v in labels)
+
+
+def _prom_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    def escape(v) -> str:
+        return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels) + "}"
+
+
+class PhaseMetrics:
+    """
+    Process-wide phase timers, counters and gauges.
+
+    Cheap enough to leave on in production: an observation is one
+    perf_counter pair, a bisect and a short lock. Phases can carry labels
+    (e.g. command="top10"); per-run records are taken by diffing totals().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases: Dict[Tuple[str, Tuple], PhaseHistogram] = {}
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._gauges: Dict[str, Callable[[], Optional[float]]] = {}
+        self.started = time.time()
+
+    def observe(self, phase: str, seconds: float, **labels):
+        key = (phase, tuple(sorted(labels.items())) if labels else ())
+        with self._lock:
+            hist = self._phases.get(key)
+            if hist is None:
+                hist = self._phases[key] = PhaseHistogram()
+            hist.observe(seconds)
+
+    def timer(self, phase: str, **labels) -> "_PhaseTimer":
+        """with METRICS.timer("page_load"): ... (failures are timed too)"""
+        return _PhaseTimer(self, phase, labels)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())) if labels else ())
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def gauge(self, name: str, fn: Callable[[], Optional[float]]):
+        """Register a value read at export time (cache age, users, ...)"""
+        self._gauges[name] = fn
+
+    def reset(self):
+        with self._lock:
+            self._phases.clear()
+            self._counters.clear()
+
+    # ---------- export ----------
+    def _items(self) -> List[Tuple[Tuple[str, Tuple], PhaseHistogram]]:
+        with self._lock:
+            return sorted(
+                ((key, self._copy(h)) for key, h in self._phases.items()),
+                key=lambda item: item[0],
+            )
+
+    @staticmethod
+    def _copy(hist: PhaseHistogram) -> PhaseHistogram:
+        copy = PhaseHistogram()
+        copy.counts = list(hist.counts)
+        copy.count, copy.total, copy.max = hist.count, hist.total, hist.max
+        return copy
+
+    def _gauge_values(self) -> Dict[str, float]:
+        values = {}
+        for name, fn in list(self._gauges.items()):
+            try:
+                value = fn()
+            except Exception:
+                value = None
+            if value is not None:
+                values[name] = value
+        return values
+
+    def totals(self) -> Dict[str, Tuple[int, float]]:
+        """(count, seconds) per phase with labels folded in"""
+        totals: Dict[str, Tuple[int, float]] = {}
+        for (phase, _), hist in self._items():
+            count, seconds = totals.get(phase, (0, 0.0))
+            totals[phase] = (count + hist.count, seconds + hist.total)
+        return totals
+
+    @staticmethod
+    def run_phases(before: Dict[str, Tuple[int, float]],
+                   after: Dict[str, Tuple[int, float]]) -> Dict[str, Dict]:
+        """What happened between two totals() calls, in ms"""
+        phases = {}
+        for phase, (count, seconds) in after.items():
+            prev_count, prev_seconds = before.get(phase, (0, 0.0))
+            if count > prev_count:
+                phases[phase] = {
+                    "count": count - prev_count,
+                    "ms": round((seconds - prev_seconds) * 1000, 1),
+                }
+        return phases
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counters = sorted(self._counters.items())
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "phases": [
+                {
+                    "phase": phase,
+                    "labels": dict(labels),
+                    "count": hist.count,
+                    "sum_ms": round(hist.total * 1000, 3),
+                    "p50_ms": round(hist.quantile(0.5) * 1000, 3),
+                    "p95_ms": round(hist.quantile(0.95) * 1000, 3),
+                    "max_ms": round(hist.max * 1000, 3),
+                }
+                for (phase, labels), hist in self._items()
+            ],
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in counters
+            ],
+            "gauges": self._gauge_values(),
+        }
+
+    def prometheus(self, prefix: str = "motogp") -> str:
+        lines = [
+            f"# HELP {prefix}_phase_seconds Time spent per pipeline/bot phase",
+            f"# TYPE {prefix}_phase_seconds histogram",
+        ]
+        for (phase, labels), hist in self._items():
+            base = (("phase", phase),) + labels
+            cumulative = 0
+            for bound, n in zip(PHASE_BUCKETS + (float("inf"),), hist.counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(
+                    f"{prefix}_phase_seconds_bucket{_prom_labels(base + (('le', le),))} {cumulative}"
+                )
+            lines.append(f"{prefix}_phase_seconds_sum{_prom_labels(base)} {hist.total:.6f}")
+            lines.append(f"{prefix}_phase_seconds_count{_prom_labels(base)} {hist.count}")
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+        seen = set()
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total{_prom_labels(labels)} {value:g}")
+
+        for name, value in sorted(self._gauge_values().items()):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def summary_lines(self) -> List[str]:
+        """One line per phase for chat/log output"""
+        lines = []
+        for (phase, labels), hist in self._items():
+            name = f"{phase}[{_label_text(labels)}]" if labels else phase
+            lines.append(
+                f"{name}: {hist.count}x | p50 {hist.quantile(0.5) * 1000:.1f}ms | "
+                f"p95 {hist.quantile(0.95) * 1000:.1f}ms | max {hist.max * 1000:.1f}ms"
+            )
+        return lines
+
+
+METRICS = PhaseMetrics()
+
+
+class MetricsServer:
+    """Local /metrics (Prometheus text) and /metrics.json endpoint on a daemon thread"""
+
+    def __init__(self, metrics: PhaseMetrics = METRICS, host: str = "127.0.0.1", port: int = 9108):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
         self.logger = logging.getLogger(__name__)
+        self._server = None
 
-    def send(self, text: str):
+    @classmethod
+    def from_config(cls, settings: Dict, metrics: PhaseMetrics = METRICS) -> Optional["MetricsServer"]:
+        """A started server, or None when metrics.enabled is off"""
+        if not settings.get("enabled"):
+            return None
+        server = cls(metrics, settings.get("listen", "127.0.0.1"), settings.get("port", 9108))
         try:
-            r = self.session.post(
-                self.api_url,
-                json={"chat_id": self.chat_id, "text": text, "parse_mode": "HTML"},
-                timeout=10,
-            )
-            r.raise_for_status()
-            self.logger.info("✅ Telegram sent")
+            server.start()
+        except OSError as e:
+            server.logger.warning(f"Metrics endpoint not started: {e}")
+            return None
+        return server
+
+    def start(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    body = metrics.prometheus().encode("utf-8")
+                    ctype = "text/plain; version=0.0.4; charset=utf-8"
+                elif path == "/metrics.json":
+                    body = json.dumps(metrics.snapshot()).encode("utf-8")
+                    ctype = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.logger.info(f"📈 Metrics on http://{self.host}:{self.port}/metrics")
+
+    def close(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class RunLog:
+    """Per-run phase timings appended to a JSONL file (logs/runs.jsonl)"""
+
+    def __init__(self, path: Path, metrics: PhaseMetrics = METRICS):
+        self.path = path
+        self.metrics = metrics
+        self.logger = logging.getLogger(__name__)
+
+    @contextmanager
+    def run(self, **extra):
+        """Yields a dict the caller fills in (result, rows, ...); written on exit"""
+        before = self.metrics.totals()
+        start = time.perf_counter()
+        record: Dict = {"time": datetime.now().isoformat(timespec="seconds"), **extra}
+        try:
+            yield record
         except Exception as e:
-            self.logger.error(f"Telegram error: {e}")
+            record.setdefault("result", "error")
+            record["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record["seconds"] = round(time.perf_counter() - start, 3)
+            record["phases"] = self.metrics.run_phases(before, self.metrics.totals())
+            self._write(record)
+
+    def _write(self, record: Dict):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.logger.warning(f"Could not write run record: {e}")
+        self.logger.info(
+            "⏱️ Run phases: "
+            + (" | ".join(f"{k} {v['ms']:.0f}ms" for k, v in record["phases"].items()) or "none")
+        )
+
+# ==================== MODEL ====================
+class RiderStanding:
+    """One standings row; rider/team strings are interned so snapshots share them"""
+
+    __slots__ = ("position", "rider", "team", "points")
+
+    def __init__(self, position: int, rider: str, team: str, points: int):
+        self.position = position
+        self.rider = sys.intern(rider)
+        self.team = sys.intern(team)
+        self.points = points
+
+    def to_dict(self) -> Dict:
+        return {
+            "position": self.position,
+            "rider": self.rider,
+            "team": self.team,
+            "points": self.points,
+        }
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RiderStanding) and (
+            self.position, self.rider, self.team, self.points
+        ) == (other.position, other.rider, other.team, other.points)
+
+    def __repr__(self) -> str:
+        return f"RiderStanding({self.position}, {self.rider!r}, {self.team!r}, {self.points})"
+
+
+class Standings:
+    """
+    Compact standings table: a tuple of RiderStanding rows. Round-trips
+    losslessly to the JSON list-of-dicts format in data/*.json.
+    """
+
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: Iterable[RiderStanding] = ()):
+        self.rows = tuple(rows)
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[Dict]) -> "Standings":
+        return cls(
+            RiderStanding(int(d["position"]), str(d["rider"]), str(d["team"]), int(d["points"]))
+            for d in items
+        )
+
+    @classmethod
+    def coerce(cls, standings) -> "Standings":
+        """Accept a Standings or a list of dicts"""
+        return standings if isinstance(standings, Standings) else cls.from_dicts(standings)
+
+    def to_dicts(self) -> List[Dict]:
+        return [r.to_dict() for r in self.rows]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Standings(self.rows[index])
+        return self.rows[index]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Standings) and self.rows == other.rows
+
+    def __repr__(self) -> str:
+        return f"Standings({len(self.rows)} riders)"
+
+# ==================== TELEGRAM ====================
+# 4xx answers that will not change on retry (bad chat id, bot blocked/kicked)
+TELEGRAM_PERMANENT_ERRORS = {400, 401, 403, 404}
+
+
+class AsyncTokenBucket:
+    """Token bucket for asyncio: acquire() waits, FIFO, until a token is free"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def defer(self, seconds: float):
+        """
+        Hold back the next token for `seconds` (Telegram's retry_after).
+        Overlapping defers keep the longest hold instead of adding up.
+        """
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+@dataclass
+class DeliveryReport:
+    sent: int = 0
+    failed: int = 0
+    queued: int = 0
+    throttled: int = 0
+    retried_from_queue: int = 0
+    elapsed: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.sent} sent, {self.failed} failed ({self.queued} queued), "
+            f"{self.throttled} throttled, {self.elapsed:.2f}s"
+        )
+
+
+class TelegramDelivery:
+    """
+    Fans a report out to every subscriber chat over one pooled httpx
+    client. Sends are paced by a global token bucket plus one bucket per
+    chat, 429 answers pause the chat (and every chat, when retry_after is
+    longer than the per-chat interval) for Telegram's retry_after, and sends
+    that still fail are appended to a JSONL retry queue that the next
+    delivery drains first.
+    """
+
+    def __init__(self, token: str, chat_ids: Iterable[str], api_base: str = TELEGRAM_API_BASE,
+                 retry_path: Optional[Path] = None, global_rate: float = 25.0,
+                 per_chat_rate: float = 1.0, max_attempts: int = 4,
+                 retry_max_age: float = 86400, timeout: float = 10):
+        self.api_url = f"{api_base.rstrip('/')}/bot{token}/sendMessage"
+        self.chat_ids = list(dict.fromkeys(str(c) for c in chat_ids if c))
+        self.retry_path = retry_path
+        self.global_rate = global_rate
+        self.per_chat_rate = per_chat_rate
+        self.max_attempts = max_attempts
+        self.retry_max_age = retry_max_age
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "TelegramDelivery":
+        return cls(
+            config.bot_token,
+            [config.chat_id, *config.subscriber_chat_ids],
+            api_base=config.telegram_api_base,
+            retry_path=config.data_dir / config.telegram_retry_file,
+            global_rate=config.telegram_global_rate,
+            per_chat_rate=config.telegram_per_chat_rate,
+        )
+
+    def send(self, text: str) -> DeliveryReport:
+        """Blocking entry point for the one-shot script"""
+        return asyncio.run(self.deliver(text))
+
+    async def deliver(self, text: str) -> DeliveryReport:
+        with METRICS.timer("telegram_send"):
+            return await self._deliver(text)
+
+    async def _deliver(self, text: str) -> DeliveryReport:
+        import httpx
+
+        start = time.perf_counter()
+        report = DeliveryReport()
+        backlog = self._load_retry_queue()
+        report.retried_from_queue = len(backlog)
+        jobs = backlog + [
+            {"chat_id": chat_id, "text": text, "queued_at": time.time()}
+            for chat_id in self.chat_ids
+        ]
+
+        # Buckets hold an asyncio.Lock, so they belong to this event loop.
+        # Capacity 1 spaces sends evenly: no second ever exceeds global_rate.
+        global_bucket = AsyncTokenBucket(self.global_rate, capacity=1)
+        chat_buckets: Dict[str, AsyncTokenBucket] = {}
+        limits = httpx.Limits(
+            max_connections=max(1, int(self.global_rate)),
+            max_keepalive_connections=max(1, int(self.global_rate)),
+        )
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            results = await asyncio.gather(*(
+                self._send_one(client, job, global_bucket, chat_buckets, report)
+                for job in jobs
+            ))
+
+        failed = [job for job, error in zip(jobs, results) if error is not None]
+        retry = [job for job in failed if job.get("retryable", True)]
+        report.sent = len(jobs) - len(failed)
+        report.failed = len(failed)
+        report.queued = len(retry)
+        self._save_retry_queue(retry)
+        report.elapsed = time.perf_counter() - start
+
+        if failed:
+            self.logger.error(f"Telegram delivery incomplete: {report}")
+        else:
+            self.logger.info(f"✅ Telegram sent ({report})")
+        return report
+
+    async def _send_one(self, client: "httpx.AsyncClient", job: Dict,
+                        global_bucket: AsyncTokenBucket,
+                        chat_buckets: Dict[str, AsyncTokenBucket],
+                        report: DeliveryReport) -> Optional[str]:
+        """Send one message; returns None on success, else the last error"""
+        import httpx
+
+        chat_id = job["chat_id"]
+        bucket = chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = chat_buckets[chat_id] = AsyncTokenBucket(self.per_chat_rate)
+        payload = {"chat_id": chat_id, "text": job["text"], "parse_mode": "HTML"}
+        error = None
+
+        for attempt in range(1, self.max_attempts + 1):
+            await bucket.acquire()
+            await global_bucket.acquire()
+            try:
+                r = await client.post(self.api_url, json=payload)
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+                await self._backoff(attempt)
+                continue
+
+            if r.status_code == 200:
+                return None
+            try:
+                body = r.json()
+            except ValueError:
+                body = {}
+            error = f"HTTP {r.status_code}: {body.get('description', r.reason_phrase)}"
+
+            if r.status_code == 429:
+                report.throttled += 1
+                retry_after = float(body.get("parameters", {}).get("retry_after")
+                                    or r.headers.get("Retry-After") or 1)
+                bucket.defer(retry_after)
+                # A flood 429 limits the whole bot, so hold every chat back
+                # unless the wait is within this chat's own pacing
+                if retry_after > 1 / self.per_chat_rate:
+                    global_bucket.defer(retry_after)
+                continue
+            if r.status_code in TELEGRAM_PERMANENT_ERRORS:
+                job["retryable"] = False
+                break
+            await self._backoff(attempt)
+
+        self.logger.warning(f"Telegram send to {chat_id} failed: {error}")
+        job["error"] = error
+        return error
+
+    async def _backoff(self, attempt: int):
+        if attempt < self.max_attempts:
+            await asyncio.sleep(min(2 ** attempt, 30))
+
+    def _load_retry_queue(self) -> List[Dict]:
+        if not self.retry_path or not self.retry_path.exists():
+            return []
+        cutoff = time.time() - self.retry_max_age
+        jobs = []
+        with open(self.retry_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    job = json.loads(line)
+                except ValueError:
+                    continue
+                if job.get("queued_at", 0) >= cutoff:
+                    jobs.append(job)
+        return jobs
+
+    def _save_retry_queue(self, jobs: List[Dict]):
+        if not self.retry_path:
+            return
+        if not jobs:
+            self.retry_path.unlink(missing_ok=True)
+            return
+        self.retry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.retry_path.with_suffix(self.retry_path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for job in jobs:
+                f.write(json.dumps(
+                    {k: job[k] for k in ("chat_id", "text", "queued_at", "error") if k in job},
+                    ensure_ascii=False,
+                ) + "\n")
+        os.replace(tmp, self.retry_path)
 
 # ==================== CHROME ====================
+# Network.setBlockedURLs wildcards: nothing the standings table needs
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagservices.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*facebook.net*",
+    "*scorecardresearch.com*", "*amazon-adsystem.com*", "*adnxs.com*",
+    "*taboola.com*", "*outbrain.com*", "*hotjar.com*",
+)
+
+# Background work a one-page scrape never needs
+LEAN_CHROME_ARGS = (
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+)
+
+# Bytes over the wire for the current page (blocked requests count as 0)
+TRANSFER_STATS_JS = """
+const nav = performance.getEntriesByType("navigation")[0];
+const res = performance.getEntriesByType("resource");
+return {
+    bytes: (nav ? nav.transferSize : 0) + res.reduce((n, r) => n + (r.transferSize || 0), 0),
+    requests: res.length + 1,
+};
+"""
+
+
+@lru_cache(maxsize=None)
+def load_chromedriver():
+    """undetected_chromedriver (and all of Selenium), imported on first Chrome start"""
+    import undetected_chromedriver as uc
+
+    # disable UC destructor (fix WinError 6)
+    uc.Chrome.__del__ = lambda self: None
+    return uc
+
+
+@dataclass
+class ChromeProfile:
+    """
+    How scrape Chrome instances start. The lean profile loads no images,
+    runs no extensions or background services, uses a smaller window and
+    keeps its HTTP cache on disk between runs. Media, fonts and trackers
+    are blocked with CDP Network.setBlockedURLs, and with restrict_hosts
+    only hosts under security.allowed_domains resolve at all.
+    """
+
+    headless: bool = True
+    chrome_version: int = 145
+    lean: bool = True
+    window_size: str = "1280,800"
+    load_images: bool = False
+    cache_dir: Optional[Path] = None
+    block_resources: bool = True
+    blocked_urls: List[str] = field(default_factory=lambda: list(BLOCKED_URL_PATTERNS))
+    allowed_domains: List[str] = field(default_factory=list)
+    restrict_hosts: bool = True
+
+    @classmethod
+    def from_config(cls, config, name: str = "auto01") -> "ChromeProfile":
+        """From Config or auto02's BotConfig; `name` keeps each script's disk cache apart"""
+        chrome = config.chrome_settings
+        lean = chrome.get("lean_profile", True)
+        cache = chrome.get("disk_cache_dir", "chrome_cache")
+        return cls(
+            headless=config.headless,
+            chrome_version=config.chrome_version,
+            lean=lean,
+            window_size=chrome.get("window_size", "1280,800" if lean else "1920,1080"),
+            load_images=chrome.get("load_images", not lean),
+            cache_dir=config.data_dir / cache / name if cache else None,
+            block_resources=chrome.get("block_resources", lean),
+            blocked_urls=list(BLOCKED_URL_PATTERNS) + chrome.get("blocked_url_patterns", []),
+            allowed_domains=list(config.allowed_domains),
+            restrict_hosts=chrome.get("restrict_to_allowed_domains", lean),
+        )
+
+    def host_resolver_rules(self) -> Optional[str]:
+        """Chrome --host-resolver-rules: every host outside the allow-list fails to resolve"""
+        if not (self.restrict_hosts and self.allowed_domains):
+            return None
+        rules = ["MAP * ~NOTFOUND"]
+        for domain in self.allowed_domains:
+            rules += [f"EXCLUDE {domain}", f"EXCLUDE *.{domain}"]
+        return ", ".join(rules)
+
+    def options(self, cache_slot: Optional[int] = None, extra_args: Iterable[str] = ()):
+        uc = load_chromedriver()
+        options = uc.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"--window-size={self.window_size}")
+
+        if self.lean:
+            for arg in LEAN_CHROME_ARGS:
+                options.add_argument(arg)
+        if not self.load_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        if self.cache_dir and cache_slot is not None:
+            # One directory per live browser: Chrome's disk cache is single-writer
+            cache = self.cache_dir / f"slot{cache_slot}"
+            cache.mkdir(parents=True, exist_ok=True)
+            options.add_argument(f"--disk-cache-dir={cache.resolve()}")
+        rules = self.host_resolver_rules()
+        if rules:
+            options.add_argument(f"--host-resolver-rules={rules}")
+
+        for arg in extra_args:
+            options.add_argument(arg)
+        return options
+
+    def apply(self, driver):
+        """Install the URL block list on a freshly started driver"""
+        if self.block_resources and self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+
+
+class _CacheSlots:
+    """Lowest free cache slot per live browser, so parallel drivers never share one"""
+
+    def __init__(self):
+        self._used = set()
+        self._lock = threading.Lock()
+
+    def claim(self) -> int:
+        with self._lock:
+            slot = 0
+            while slot in self._used:
+                slot += 1
+            self._used.add(slot)
+            return slot
+
+    def release(self, slot: int):
+        with self._lock:
+            self._used.discard(slot)
+
+
+_CACHE_SLOTS = _CacheSlots()
+
+
+def start_chrome(profile: ChromeProfile, extra_args: Iterable[str] = ()):
+    """Start Chrome with `profile`; quitting the driver frees its cache slot"""
+    uc = load_chromedriver()
+    slot = _CACHE_SLOTS.claim() if profile.cache_dir else None
+    try:
+        with METRICS.timer("driver_start"):
+            driver = uc.Chrome(
+                version_main=profile.chrome_version,
+                options=profile.options(slot, extra_args),
+            )
+        profile.apply(driver)
+    except Exception:
+        if slot is not None:
+            _CACHE_SLOTS.release(slot)
+        raise
+
+    if slot is not None:
+        quit_driver = driver.quit
+
+        def quit():
+            try:
+                quit_driver()
+            finally:
+                _CACHE_SLOTS.release(slot)
+
+        driver.quit = quit
+    return driver
+
+
+def page_transfer_stats(driver) -> Dict:
+    """{"bytes", "requests"} for the page currently loaded in `driver`"""
+    try:
+        return driver.execute_script(TRANSFER_STATS_JS) or {}
+    except Exception:
+        return {}
+
+
 class SecureChromeDriver:
     def __init__(self, config: Config):
         self.config = config
+        self.profile = ChromeProfile.from_config(config)
         self.driver = None
         self.logger = logging.getLogger(__name__)
 
     def __enter__(self):
-        options = uc.ChromeOptions()
-        if self.config.headless:
-            options.add_argument("--headless=new")
-
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            f"user-agent=Mozilla/5.0 Chrome/{self.config.chrome_version}.0.0.0"
-        )
-
-        self.driver = uc.Chrome(
-            version_main=self.config.chrome_version,
-            options=options,
+        self.driver = start_chrome(
+            self.profile,
+            [f"user-agent=Mozilla/5.0 Chrome/{self.config.chrome_version}.0.0.0"],
         )
         self.driver.set_page_load_timeout(self.config.timeout)
         self.driver.set_script_timeout(self.config.timeout)
 
-        self.logger.info(f"✅ Chrome driver initialized (v{self.config.chrome_version})")
+        self.logger.info(
+            f"✅ Chrome driver initialized (v{self.config.chrome_version}"
+            f"{', lean profile' if self.profile.lean else ''}"
+            f"{f', {len(self.profile.blocked_urls)} URL patterns blocked' if self.profile.block_resources else ''})"
+        )
         return self.driver
 
     def __exit__(self, exc_type, exc, tb):
@@ -147,8 +1064,187 @@ class SecureChromeDriver:
                 self.driver = None
                 self.logger.info("✅ Chrome driver closed")
 
-# disable UC destructor (fix WinError 6)
-uc.Chrome.__del__ = lambda self: None
+# ==================== DRIVER POOL ====================
+def driver_rss_mb(driver) -> Optional[float]:
+    """RSS of one Chrome instance (browser + renderer/GPU children), in MB"""
+    pid = getattr(driver, "browser_pid", None)
+    if psutil is None or not pid:
+        return None
+    try:
+        proc = psutil.Process(pid)
+        total = 0
+        for p in [proc] + proc.children(recursive=True):
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+class _PooledDriver:
+    __slots__ = ("driver", "uses", "last_used")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.last_used = time.monotonic()
+
+
+class ChromeDriverPool:
+    """Bounded pool of warm Chrome drivers with health checks and recycling"""
+
+    def __init__(
+        self,
+        factory: Callable[[], object],
+        size: int = 1,
+        idle_timeout: float = 600,
+        max_uses: int = 50,
+        max_rss_mb: Optional[float] = None,
+        lease_timeout: float = 120,
+    ):
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle_timeout = idle_timeout
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.lease_timeout = lease_timeout
+        self.logger = logging.getLogger(__name__)
+
+        self._idle: List[_PooledDriver] = []
+        self._live = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reaper = None
+
+    @classmethod
+    def from_config(cls, factory: Callable[[], object], settings: Dict) -> "ChromeDriverPool":
+        return cls(
+            factory,
+            size=settings.get("size", 1),
+            idle_timeout=settings.get("idle_timeout", 600),
+            max_uses=settings.get("max_uses", 50),
+            max_rss_mb=settings.get("max_rss_mb"),
+            lease_timeout=settings.get("lease_timeout", 120),
+        )
+
+    # ---------- lease / return ----------
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """with pool.lease() as driver: ... (a driver that raised is discarded)"""
+        pooled = self.acquire(timeout)
+        broken = False
+        try:
+            yield pooled.driver
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    def acquire(self, timeout: Optional[float] = None) -> _PooledDriver:
+        deadline = time.monotonic() + (timeout or self.lease_timeout)
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                elif self._live < self.size:
+                    self._live += 1
+                    pooled = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("No Chrome driver available")
+                    self._cond.wait(remaining)
+                    continue
+
+            if pooled is None:
+                return self._create()
+            if self._healthy(pooled.driver):
+                return pooled
+            self.logger.warning("♻️ Pooled driver failed health check, replacing")
+            self._discard(pooled)
+
+    def release(self, pooled: _PooledDriver, broken: bool = False):
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+
+        reason = None
+        if broken:
+            reason = "error during lease"
+        elif self.max_uses and pooled.uses >= self.max_uses:
+            reason = f"{pooled.uses} uses"
+        elif self.max_rss_mb:
+            rss = driver_rss_mb(pooled.driver)
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f"rss {rss:.0f}MB > {self.max_rss_mb}MB"
+
+        if reason or self._closed:
+            if reason:
+                self.logger.info(f"♻️ Recycling Chrome driver ({reason})")
+            self._discard(pooled)
+            return
+
+        with self._cond:
+            self._idle.append(pooled)
+            self._cond.notify()
+
+    # ---------- lifecycle ----------
+    def _create(self) -> _PooledDriver:
+        try:
+            pooled = _PooledDriver(self.factory())
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        self.logger.info(f"🚗 Chrome driver started ({self._live}/{self.size} in pool)")
+        self._start_reaper()
+        return pooled
+
+    def _discard(self, pooled: _PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._live -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _healthy(driver) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _start_reaper(self):
+        if self._reaper or not self.idle_timeout:
+            return
+        self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._closed:
+            time.sleep(max(self.idle_timeout / 4, 1))
+            cutoff = time.monotonic() - self.idle_timeout
+            with self._cond:
+                expired = [p for p in self._idle if p.last_used < cutoff]
+                self._idle = [p for p in self._idle if p.last_used >= cutoff]
+            for pooled in expired:
+                self.logger.info("💤 Closing idle Chrome driver")
+                self._discard(pooled)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self._discard(pooled)
 
 # ==================== SCRAPER ====================
 class SecureMotoGPScraper:
@@ -160,66 +1256,21 @@ class SecureMotoGPScraper:
     def scrape(self, driver) -> List[Dict]:
         try:
             self.logger.info(f"🌐 Opening: {self.config.motogp_url}")
-            driver.get(self.config.motogp_url)
-
-            wait = WebDriverWait(driver, 40)
-
-            # DOM ready
-            wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+            with METRICS.timer("page_load", path="chrome"):
+                driver.get(self.config.motogp_url)
 
-            # trigger lazy load
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(3)
-            driver.execute_script("window.scrollTo(0, 0)")
-            time.sleep(1)
+            with METRICS.timer("readiness_wait"):
+                PageReadiness(driver, self.config).wait()
 
-            # wait for real table
-            wait.until(
-                EC.visibility_of_element_located(
-                    (By.CSS_SELECTOR, "table.ms-table--standings")
+            transfer = page_transfer_stats(driver)
+            if transfer:
+                METRICS.inc("chrome_transfer_bytes", transfer["bytes"])
+                self.logger.info(
+                    f"📦 Page transfer: {transfer['bytes'] / 1024:.0f}KB "
+                    f"in {transfer['requests']} requests"
                 )
-            )
-
-            wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "table.ms-table--standings tbody tr")
-                )
-            )
-
-            rows = driver.find_elements(
-                By.CSS_SELECTOR, "table.ms-table--standings tbody tr"
-            )
-
-            self.logger.info(f"Found {len(rows)} rows")
-
-            data = []
-            for row in rows:
-                try:
-                    pos = row.find_element(By.CSS_SELECTOR, "td.ms-table_field--pos").text
-                    rider = row.find_element(
-                        By.CSS_SELECTOR, "span.name-short"
-                    ).text
-                    team = row.find_element(
-                        By.CSS_SELECTOR, "span.team"
-                    ).text
-                    pts = row.find_element(
-                        By.CSS_SELECTOR, "td.ms-table_field--total_points"
-                    ).text
-
-                    if not pos.isdigit() or not pts.isdigit():
-                        continue
-
-                    data.append(
-                        {
-                            "position": int(pos),
-                            "rider": self.validator.sanitize(rider),
-                            "team": self.validator.sanitize(team),
-                            "points": int(pts),
-                        }
-                    )
-                except Exception:
-                    continue
 
+            data = read_standings_table(driver, self.config.extraction_mode)
             self.logger.info(f"✅ Scraped {len(data)} riders")
             return data
 
@@ -227,63 +1278,1470 @@ class SecureMotoGPScraper:
             self.logger.error(f"Scraping failed: {e}", exc_info=True)
             return []
 
+# ==================== READINESS ====================
+# Resolves once the table has rows and no mutation touched it for quietMs, or at capMs
+WAIT_TABLE_STABLE_JS = """
+const [selector, quietMs, capMs, done] = arguments;
+const start = performance.now();
+let last = start;
+let rows = -1;
+const table = () => document.querySelector(selector);
+const observer = new MutationObserver((records) => {
+    const t = table();
+    if (t && records.some((r) => t.contains(r.target) || r.target.contains(t))) {
+        last = performance.now();
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+const timer = setInterval(() => {
+    const now = performance.now();
+    const t = table();
+    const count = t ? t.querySelectorAll("tbody tr").length : 0;
+    if (count !== rows) {
+        rows = count;
+        last = now;
+    }
+    const settled = rows > 0 && now - last >= quietMs;
+    if (settled || now - start >= capMs) {
+        clearInterval(timer);
+        observer.disconnect();
+        done({rows: rows, settled: settled});
+    }
+}, 50);
+"""
+
+
+class PageReadiness:
+    """Event-driven readiness: returns as soon as the standings table stops changing"""
+
+    def __init__(self, driver, config: Config, selector: str = "table.ms-table--standings"):
+        self.driver = driver
+        self.config = config
+        self.selector = selector
+        self.logger = logging.getLogger(__name__)
+        self.phases: Dict[str, float] = {}
+
+    def _phase(self, name: str, fn):
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def _wait_stable(self, cap_seconds: float) -> Dict:
+        # Pooled drivers are reused: put the caller's script timeout back
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(cap_seconds + 5)
+        try:
+            return self.driver.execute_async_script(
+                WAIT_TABLE_STABLE_JS,
+                self.selector,
+                self.config.readiness_quiet_ms,
+                int(cap_seconds * 1000),
+            ) or {"rows": 0, "settled": False}
+        finally:
+            self.driver.set_script_timeout(previous)
+
+    def wait(self) -> int:
+        """Block until the table is rendered and stable; returns the row count"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        timeout = self.config.page_load_timeout
+
+        self._phase("dom", lambda: WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        ))
+
+        # trigger lazy load, but only wait as long as the table keeps changing
+        scroll_cap = random.uniform(self.config.scroll_delay_min, self.config.scroll_delay_max)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+        result = self._phase("lazy_load", lambda: self._wait_stable(scroll_cap))
+        self.driver.execute_script("window.scrollTo(0, 0)")
+
+        if not result["settled"]:
+            result = self._phase("table", lambda: self._wait_stable(timeout))
+
+        self.logger.info(
+            "⏱️ Readiness: "
+            + " | ".join(f"{name} {secs:.2f}s" for name, secs in self.phases.items())
+            + f" ({result['rows']} rows)"
+        )
+
+        if not result["settled"]:
+            raise TimeoutException("Timeout waiting for table")
+        return result["rows"]
+
+# ==================== TABLE EXTRACTION ====================
+STANDINGS_ROWS_CSS = "table.ms-table--standings tbody tr"
+STANDINGS_CELLS_CSS = (
+    "td.ms-table_field--pos",
+    "span.name-short",
+    "span.team",
+    "td.ms-table_field--total_points",
+)
+
+# One round trip: every row as [pos, rider, team, points], null for a missing cell
+EXTRACT_ROWS_JS = """
+const cells = arguments[1];
+return Array.from(document.querySelectorAll(arguments[0]), (row) =>
+    cells.map((sel) => {
+        const el = row.querySelector(sel);
+        return el ? el.innerText : null;
+    })
+);
+"""
+
+
+def extract_rows_script(driver) -> List[List[Optional[str]]]:
+    return driver.execute_script(
+        EXTRACT_ROWS_JS, STANDINGS_ROWS_CSS, list(STANDINGS_CELLS_CSS)
+    ) or []
+
+
+def extract_rows_elements(driver) -> List[List[Optional[str]]]:
+    """Legacy per-cell WebDriver calls (~8 round trips per row), kept for comparison"""
+    from selenium.webdriver.common.by import By
+
+    raw = []
+    for row in driver.find_elements(By.CSS_SELECTOR, STANDINGS_ROWS_CSS):
+        cells = []
+        for sel in STANDINGS_CELLS_CSS:
+            found = row.find_elements(By.CSS_SELECTOR, sel)
+            cells.append(found[0].text if found else None)
+        raw.append(cells)
+    return raw
+
+
+EXTRACTORS = {
+    "script": extract_rows_script,
+    "elements": extract_rows_elements,
+}
+
+
+def parse_extracted_rows(raw: List[List[Optional[str]]]) -> List[Dict]:
+    """Validate raw rows on the Python side, reporting rows that fail"""
+    logger = logging.getLogger(__name__)
+    data, failures = [], 0
+
+    for i, cells in enumerate(raw, 1):
+        if not isinstance(cells, list) or len(cells) != len(STANDINGS_CELLS_CSS):
+            failures += 1
+            logger.debug(f"Row {i}: malformed extraction result {cells!r}")
+            continue
+
+        missing = [sel for sel, value in zip(STANDINGS_CELLS_CSS, cells) if value is None]
+        if missing:
+            failures += 1
+            logger.debug(f"Row {i}: missing {', '.join(missing)}")
+            continue
+
+        standing = build_standing(*cells)
+        if standing is None:
+            failures += 1
+            logger.debug(f"Row {i}: non-numeric position/points {cells[0]!r}/{cells[3]!r}")
+            continue
+        data.append(standing)
+
+    if failures:
+        logger.warning(f"⚠️ {failures}/{len(raw)} rows failed to parse")
+    return data
+
+
+def read_standings_table(driver, mode: str = "script") -> List[Dict]:
+    """Extract and validate the standings table, logging the parse-phase time"""
+    logger = logging.getLogger(__name__)
+    extractor = EXTRACTORS[mode]  # modes are validated when the config loads
+
+    start = time.perf_counter()
+    raw = extractor(driver)
+    data = parse_extracted_rows(raw)
+    elapsed = time.perf_counter() - start
+    METRICS.observe("row_parse", elapsed, path="chrome")
+
+    logger.info(f"Found {len(raw)} rows, parsed in {elapsed * 1000:.0f}ms ({mode})")
+    return data
+
+# ==================== HTTP FAST PATH ====================
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+STANDINGS_ROWS_XPATH = f"//table[{_has_class('ms-table--standings')}]//tbody/tr"
+_CELL_XPATH = {
+    "pos": f".//td[{_has_class('ms-table_field--pos')}]",
+    "rider": f".//span[{_has_class('name-short')}]",
+    "team": f".//span[{_has_class('team')}]",
+    "points": f".//td[{_has_class('ms-table_field--total_points')}]",
+}
+
+
+def build_standing(pos: str, rider: str, team: str, pts: str) -> Optional[Dict]:
+    """Validate one raw row (same rules as the Chrome path)"""
+    pos, pts = (pos or "").strip(), (pts or "").strip()
+    if not pos.isdigit() or not pts.isdigit():
+        return None
+    return {
+        "position": int(pos),
+        "rider": SecurityValidator.sanitize(rider or ""),
+        "team": SecurityValidator.sanitize(team or ""),
+        "points": int(pts),
+    }
+
+
+def parse_standings_html(content: bytes) -> List[Dict]:
+    """Parse server-rendered standings HTML, falling back to embedded JSON state"""
+    from lxml import html as lxml_html
+
+    doc = lxml_html.fromstring(content)
+
+    data = []
+    for row in doc.xpath(STANDINGS_ROWS_XPATH):
+        cells = {}
+        for key, xpath in _CELL_XPATH.items():
+            found = row.xpath(xpath)
+            cells[key] = found[0].text_content() if found else ""
+        standing = build_standing(cells["pos"], cells["rider"], cells["team"], cells["points"])
+        if standing:
+            data.append(standing)
+
+    if data:
+        return data
+
+    for script in doc.xpath("//script[@type='application/json' or @id='__NEXT_DATA__']"):
+        try:
+            state = json.loads(script.text_content())
+        except ValueError:
+            continue
+        data = _standings_from_state(state)
+        if data:
+            return data
+
+    return []
+
+
+def _standings_from_state(node, depth: int = 0) -> List[Dict]:
+    """Find the first list of rider-like objects in a JSON state blob"""
+    if depth > 12:
+        return []
+
+    if isinstance(node, list):
+        rows = [_standing_from_object(item) for item in node if isinstance(item, dict)]
+        rows = [r for r in rows if r]
+        if len(rows) >= 3:
+            return rows
+        children = node
+    elif isinstance(node, dict):
+        children = node.values()
+    else:
+        return []
+
+    for child in children:
+        found = _standings_from_state(child, depth + 1)
+        if found:
+            return found
+    return []
+
+
+def _standing_from_object(obj: Dict) -> Optional[Dict]:
+    def pick(*keys):
+        for key in keys:
+            value = obj.get(key)
+            if isinstance(value, dict):
+                value = value.get("name") or value.get("shortName")
+            if value not in (None, ""):
+                return str(value)
+        return ""
+
+    return build_standing(
+        pick("position", "pos", "rank"),
+        pick("shortName", "name_short", "rider", "driver", "name"),
+        pick("team", "teamName", "team_name"),
+        pick("points", "totalPoints", "total_points"),
+    )
+
+
+class HttpStandingsFetcher:
+    """
+    Browserless standings fetch over a pooled requests session.
+
+    After a successful parse the ETag/Last-Modified validators are kept
+    (and persisted when a path is given), so the next conditional fetch
+    of an unchanged page is a bodiless 304.
+    """
+
+    def __init__(self, config, validators_path: Optional[Path] = None):
+        self.config = config
+        self.validators_path = validators_path
+        self.logger = logging.getLogger(__name__)
+        self._session = None
+        self.validators: Dict[str, Dict[str, str]] = {}
+        if validators_path and validators_path.exists():
+            try:
+                with open(validators_path, "r", encoding="utf-8") as f:
+                    self.validators = json.load(f)
+            except (OSError, ValueError):
+                self.validators = {}
+
+    @property
+    def session(self):
+        """The pooled requests session, built (and requests imported) on first fetch"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retry = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+            )
+            session.headers.update({
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                    f"(KHTML, like Gecko) Chrome/{self.config.chrome_version}.0.0.0 Safari/537.36"
+                ),
+                "Accept": "text/html,application/xhtml+xml",
+                "Accept-Language": "en-US,en;q=0.9,id;q=0.8",
+            })
+            self._session = session
+        return self._session
+
+    def fetch(self, url: str, conditional: bool = False) -> Optional[List[Dict]]:
+        """Standings, [] when the fast path failed, or None for 304 Not Modified"""
+        headers = {}
+        cached = self.validators.get(url, {}) if conditional else {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            with METRICS.timer("page_load", path="http"):
+                r = self.session.get(url, timeout=self.config.timeout, headers=headers)
+            if r.status_code == 304:
+                self.logger.info("⚡ HTTP 304: standings page not modified")
+                return None
+            r.raise_for_status()
+            with METRICS.timer("row_parse", path="http"):
+                data = parse_standings_html(r.content)
+        except Exception as e:
+            self.logger.warning(f"HTTP fast path failed: {e}")
+            return []
+
+        if data:
+            self.logger.info(f"⚡ HTTP fast path: {len(data)} riders")
+            self._remember(url, r.headers)
+        else:
+            self.logger.info("HTTP fast path found no standings table")
+        return data
+
+    def _remember(self, url: str, headers):
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        if not any(validators.values()) or self.validators.get(url) == validators:
+            return
+        self.validators[url] = validators
+        if self.validators_path:
+            try:
+                with open(self.validators_path, "w", encoding="utf-8") as f:
+                    json.dump(self.validators, f, indent=2)
+            except OSError as e:
+                self.logger.warning(f"Could not save HTTP validators: {e}")
+
+
+# ==================== SCRAPE ENGINE ====================
+def process_tree_rss_mb() -> Optional[float]:
+    """RSS of this process and its children (Chrome included), in MB"""
+    if psutil is None:
+        return None
+    try:
+        proc = psutil.Process()
+        total = 0
+        for p in [proc] + proc.children(recursive=True):
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
+    except psutil.Error:
+        return None
+
+
+class PeakRssSampler:
+    """Samples process-tree RSS in the background; Chrome is gone by the time a path returns"""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_mb: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = process_tree_rss_mb()
+        if rss is not None:
+            self.peak_mb = max(self.peak_mb or 0.0, rss)
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if psutil is not None:
+            self._sample()
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+
+
+class ScrapePathStats:
+    """Per-path latency/memory counters, persisted so one-shot runs accumulate"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self.paths: Dict[str, Dict] = {}
+        if path and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.paths = json.load(f)
+            except (OSError, ValueError):
+                self.paths = {}
+
+    def record(self, name: str, seconds: float, ok: bool, rss_mb: Optional[float]):
+        s = self.paths.setdefault(name, {
+            "attempts": 0, "wins": 0, "total_seconds": 0.0,
+            "peak_rss_mb": 0.0, "total_rss_mb": 0.0, "rss_samples": 0,
+        })
+        s["attempts"] += 1
+        s["wins"] += int(ok)
+        s["total_seconds"] += seconds
+        if rss_mb is not None:
+            s["rss_samples"] += 1
+            s["total_rss_mb"] += rss_mb
+            s["peak_rss_mb"] = max(s["peak_rss_mb"], rss_mb)
+
+        rss = f"{rss_mb:.0f}MB" if rss_mb is not None else "n/a"
+        self.logger.info(f"⏱️ {name} path: {seconds:.2f}s, rss {rss}, {'ok' if ok else 'miss'}")
+
+    def summary(self) -> str:
+        parts = []
+        for name, s in self.paths.items():
+            avg = s["total_seconds"] / max(s["attempts"], 1)
+            mem = (
+                f", avg rss {s['total_rss_mb'] / s['rss_samples']:.0f}MB"
+                if s["rss_samples"] else ""
+            )
+            parts.append(f"{name}: {s['wins']}/{s['attempts']} wins, avg {avg:.2f}s{mem}")
+        return " | ".join(parts)
+
+    def save(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.paths, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not save scrape stats: {e}")
+
+
+class StandingsScrapeEngine:
+    """HTTP fast path first, Chrome only when the fast path finds no table"""
+
+    def __init__(
+        self,
+        config,
+        chrome_scrape: Optional[Callable[[], List[Dict]]] = None,
+        stats: Optional[ScrapePathStats] = None,
+        validators_path: Optional[Path] = None,
+    ):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.http = HttpStandingsFetcher(config, validators_path)
+        self.chrome_scrape = chrome_scrape or self._chrome_scrape
+        self.stats = stats or ScrapePathStats()
+
+    def _chrome_scrape(self) -> List[Dict]:
+        with SecureChromeDriver(self.config) as driver:
+            return SecureMotoGPScraper(self.config).scrape(driver)
+
+    def _run(self, name: str, fn: Callable[[], Optional[List[Dict]]]) -> Optional[List[Dict]]:
+        start = time.perf_counter()
+        with PeakRssSampler() as sampler:
+            data = fn()
+        ok = data is None or bool(data)  # a 304 is a fast-path win
+        self.stats.record(name, time.perf_counter() - start, ok, sampler.peak_mb)
+        return data
+
+    def scrape(self, conditional: bool = False) -> Optional[Standings]:
+        """
+        Standings, or None when a conditional request says the page is unchanged.
+        Only pass conditional=True when the caller still holds the last result.
+        """
+        data = self._run(
+            "http", lambda: self.http.fetch(self.config.motogp_url, conditional=conditional)
+        )
+        if data is None:
+            self.stats.save()
+            return None
+        if not data:
+            self.logger.info("↪️ Falling back to Chrome")
+            data = self._run("chrome", self.chrome_scrape)
+
+        self.logger.info(f"📊 Scrape paths: {self.stats.summary()}")
+        self.stats.save()
+        return Standings.from_dicts(data)
+
 # ==================== DATA ====================
+def snapshot_fingerprint(standings) -> str:
+    """Canonical content hash: row order, key order and whitespace don't matter"""
+    rows = sorted(
+        ([r.position, r.rider, r.team, r.points] for r in Standings.coerce(standings)),
+        key=lambda row: (row[0], row[1]),
+    )
+    canonical = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RunState:
+    """Counters that survive between one-shot runs (data_dir/run_state.json)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self.state = {"runs": 0, "skipped_runs": 0, "unchanged_streak": 0, "last_change": None}
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.state.update(json.load(f))
+            except (OSError, ValueError):
+                pass
+
+    def mark_unchanged(self, reason: str):
+        self.state["runs"] += 1
+        self.state["skipped_runs"] += 1
+        self.state["unchanged_streak"] += 1
+        self.logger.info(
+            f"⏭️ Standings unchanged ({reason}); skipping save and notifications "
+            f"[{self.state['unchanged_streak']} in a row, "
+            f"{self.state['skipped_runs']}/{self.state['runs']} runs skipped]"
+        )
+        self.save()
+
+    def mark_changed(self) -> int:
+        """Record a changed run; returns how many unchanged runs preceded it"""
+        streak = self.state["unchanged_streak"]
+        self.state["runs"] += 1
+        self.state["unchanged_streak"] = 0
+        self.state["last_change"] = datetime.now().isoformat(timespec="seconds")
+        self.save()
+        return streak
+
+    def save(self):
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not save run state: {e}")
+
+
 class SecureDataManager:
     def __init__(self, path: Path):
         self.path = path
         self.path.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
 
-    def save(self, data: List[Dict], name: str):
+    def save(self, data: Standings, name: str):
         file = self.path / name
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        tmp = file.with_suffix(".tmp")
+        with METRICS.timer("disk_save", store="json"):
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(Standings.coerce(data).to_dicts(), f, indent=2, ensure_ascii=False)
+            os.replace(tmp, file)  # atomic: readers (auto02) never see a partial file
         self.logger.info(f"💾 Saved: {file} ({len(data)} riders)")
 
-    def load(self, name: str) -> List[Dict]:
+    def load(self, name: str) -> Standings:
         file = self.path / name
         if not file.exists():
-            return []
+            return Standings()
         with open(file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return Standings.from_dicts(json.load(f))
+
+# ==================== HISTORY ====================
+@lru_cache(maxsize=65536)
+def rider_key(name: str) -> str:
+    """Normalized join key: accents stripped, case-folded, punctuation collapsed"""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w]+", " ", stripped.casefold()).split())
+
+
+@dataclass
+class StoredSnapshot:
+    id: int
+    taken_at: float
+    standings: Standings
+
+
+class SnapshotStore:
+    """
+    Append-only SQLite history of every scrape.
+
+    Snapshots are indexed by time and rows by (rider_key, snapshot), so
+    "latest", "snapshot at T" and "rider series" are B-tree lookups.
+
+    Every snapshot is tagged with its source. Reads only see `sources`:
+    by default auto01's own scrapes and migrated files, so snapshots the
+    bot appends ("bot") never count as the monitor's last known table.
+    """
+
+    MONITOR_SOURCES = ("scrape", "migration")
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        taken_at REAL NOT NULL,
+        source TEXT NOT NULL DEFAULT 'scrape'
+    );
+    CREATE INDEX IF NOT EXISTS idx_snapshots_taken_at ON snapshots(taken_at);
+
+    CREATE TABLE IF NOT EXISTS standings (
+        snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+        rider_key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        rider TEXT NOT NULL,
+        team TEXT NOT NULL,
+        points INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_standings_snapshot ON standings(snapshot_id, position);
+    CREATE INDEX IF NOT EXISTS idx_standings_rider ON standings(rider_key, snapshot_id);
+
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+
+    CREATE TRIGGER IF NOT EXISTS snapshots_no_update BEFORE UPDATE ON snapshots
+    BEGIN SELECT RAISE(ABORT, 'snapshot store is append-only'); END;
+    CREATE TRIGGER IF NOT EXISTS snapshots_no_delete BEFORE DELETE ON snapshots
+    BEGIN SELECT RAISE(ABORT, 'snapshot store is append-only'); END;
+    CREATE TRIGGER IF NOT EXISTS standings_no_update BEFORE UPDATE ON standings
+    BEGIN SELECT RAISE(ABORT, 'snapshot store is append-only'); END;
+    CREATE TRIGGER IF NOT EXISTS standings_no_delete BEFORE DELETE ON standings
+    BEGIN SELECT RAISE(ABORT, 'snapshot store is append-only'); END;
+    """
+
+    def __init__(self, path: Path, sources: Iterable[str] = MONITOR_SOURCES):
+        self.path = path
+        self.sources = tuple(sources)
+        self._where = f"source IN ({', '.join('?' * len(self.sources))})"
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # shared by the bot's event loop and its scrape thread; guarded by _lock
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")  # auto02 reads while auto01 writes
+        self.conn.executescript(self.SCHEMA)
+        self._upgrade()
+
+    def _upgrade(self):
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(snapshots)")}
+        if "fingerprint" not in columns:
+            # older rows keep NULL; latest_fingerprint() hashes them on demand
+            self.conn.execute("ALTER TABLE snapshots ADD COLUMN fingerprint TEXT")
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    # ---------- writes ----------
+    def append(self, standings: Standings, taken_at: Optional[float] = None,
+               source: str = "scrape") -> int:
+        standings = Standings.coerce(standings)
+        taken_at = time.time() if taken_at is None else taken_at
+        fingerprint = snapshot_fingerprint(standings)
+        with METRICS.timer("disk_save", store="history"), self._lock, self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO snapshots (taken_at, source, fingerprint) VALUES (?, ?, ?)",
+                (taken_at, source, fingerprint),
+            )
+            snapshot_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO standings (snapshot_id, rider_key, position, rider, team, points) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (snapshot_id, rider_key(r.rider), r.position, r.rider, r.team, r.points)
+                    for r in standings
+                ],
+            )
+        self.logger.info(f"🗄️ Stored snapshot #{snapshot_id} ({len(standings)} riders)")
+        return snapshot_id
+
+    # ---------- reads ----------
+    def _load(self, row) -> Optional[StoredSnapshot]:
+        if row is None:
+            return None
+        snapshot_id, taken_at = row
+        rows = self.conn.execute(
+            "SELECT position, rider, team, points FROM standings "
+            "WHERE snapshot_id = ? ORDER BY position",
+            (snapshot_id,),
+        ).fetchall()
+        return StoredSnapshot(
+            snapshot_id,
+            taken_at,
+            Standings(RiderStanding(*row) for row in rows),
+        )
+
+    def latest(self) -> Optional[StoredSnapshot]:
+        with self._lock:
+            return self._load(self.conn.execute(
+                f"SELECT id, taken_at FROM snapshots WHERE {self._where} ORDER BY id DESC LIMIT 1",
+                self.sources,
+            ).fetchone())
+
+    def latest_fingerprint(self) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT fingerprint FROM snapshots WHERE {self._where} ORDER BY id DESC LIMIT 1",
+                self.sources,
+            ).fetchone()
+        if row is None:
+            return None
+        if row[0]:
+            return row[0]
+        latest = self.latest()
+        return snapshot_fingerprint(latest.standings)
+
+    def get(self, snapshot_id: int) -> Optional[StoredSnapshot]:
+        with self._lock:
+            return self._load(self.conn.execute(
+                "SELECT id, taken_at FROM snapshots WHERE id = ?", (snapshot_id,)
+            ).fetchone())
+
+    def latest_pair(self) -> Optional[Tuple[Tuple[int, float], Tuple[int, float]]]:
+        """(id, taken_at) of the two newest snapshots, older first, without reading their rows"""
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT id, taken_at FROM snapshots WHERE {self._where} ORDER BY id DESC LIMIT 2",
+                self.sources,
+            ).fetchall()
+        if len(rows) < 2:
+            return None
+        return tuple(rows[1]), tuple(rows[0])
+
+    def before(self, snapshot_id: int) -> Optional[StoredSnapshot]:
+        """The snapshot appended just before snapshot_id"""
+        with self._lock:
+            return self._load(self.conn.execute(
+                f"SELECT id, taken_at FROM snapshots WHERE id < ? AND {self._where} "
+                "ORDER BY id DESC LIMIT 1",
+                (snapshot_id, *self.sources),
+            ).fetchone())
+
+    def at(self, when: float) -> Optional[StoredSnapshot]:
+        """The newest snapshot taken at or before `when` (epoch seconds)"""
+        with self._lock:
+            return self._load(self.conn.execute(
+                f"SELECT id, taken_at FROM snapshots WHERE taken_at <= ? AND {self._where} "
+                "ORDER BY taken_at DESC, id DESC LIMIT 1",
+                (when, *self.sources),
+            ).fetchone())
+
+    def rider_series(self, rider: str) -> List[Dict]:
+        """Every stored (taken_at, position, points, team) for one rider, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT s.taken_at, st.position, st.points, st.team "
+                "FROM standings st JOIN snapshots s ON s.id = st.snapshot_id "
+                f"WHERE st.rider_key = ? AND s.{self._where} ORDER BY st.snapshot_id",
+                (rider_key(rider), *self.sources),
+            ).fetchall()
+        return [
+            {"taken_at": t, "position": p, "points": pts, "team": team}
+            for t, p, pts, team in rows
+        ]
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute(
+                f"SELECT COUNT(*) FROM snapshots WHERE {self._where}", self.sources
+            ).fetchone()[0]
+
+    # ---------- migration ----------
+    def migrate_legacy(self, data_dir: Path, names: List[str]):
+        """One-time import of the old overwrite-only JSON files (oldest first)"""
+        with self._lock:
+            done = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'legacy_migrated'"
+            ).fetchone()
+        if done:
+            return
+
+        files = sorted(
+            (data_dir / name for name in names if (data_dir / name).exists()),
+            key=lambda f: f.stat().st_mtime,
+        )
+        imported, last = 0, None
+        for file in files:
+            try:
+                with open(file, "r", encoding="utf-8") as f:
+                    standings = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Skipping {file} during migration: {e}")
+                continue
+            if standings and standings != last:
+                self.append(standings, taken_at=file.stat().st_mtime, source="migration")
+                imported += 1
+            last = standings
+
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_migrated', ?)",
+                (datetime.now().isoformat(),),
+            )
+        self.logger.info(f"🗄️ Migrated {imported} legacy snapshot(s) into {self.path.name}")
+
+# ==================== DIFF ====================
+@dataclass
+class RiderDelta:
+    rider: str
+    team: str
+    position: int
+    points: int
+    prev_position: Optional[int] = None
+    prev_points: Optional[int] = None
+
+    @property
+    def is_new(self) -> bool:
+        return self.prev_position is None
+
+    @property
+    def position_change(self) -> int:
+        """Places gained (positive) or lost (negative)"""
+        return 0 if self.is_new else self.prev_position - self.position
+
+    @property
+    def points_change(self) -> int:
+        return 0 if self.is_new else self.points - self.prev_points
+
+
+@dataclass
+class StandingsDiff:
+    deltas: List[RiderDelta]
+    dropped: List[RiderStanding]
+    up: int = 0
+    down: int = 0
+    unchanged: int = 0
+    new: int = 0
+
+    @property
+    def changed(self) -> List[RiderDelta]:
+        return [d for d in self.deltas if d.is_new or d.position_change or d.points_change]
+
+
+def diff_standings(previous: Standings, current: Standings) -> StandingsDiff:
+    """Join two snapshots on rider_key in O(n + m)"""
+    before = {rider_key(r.rider): r for r in Standings.coerce(previous)}
+    diff = StandingsDiff(deltas=[], dropped=[])
+
+    for r in Standings.coerce(current):
+        old = before.pop(rider_key(r.rider), None)
+        delta = RiderDelta(
+            rider=r.rider, team=r.team, position=r.position, points=r.points,
+            prev_position=old.position if old else None,
+            prev_points=old.points if old else None,
+        )
+        diff.deltas.append(delta)
+
+        if delta.is_new:
+            diff.new += 1
+        elif delta.position_change > 0:
+            diff.up += 1
+        elif delta.position_change < 0:
+            diff.down += 1
+        else:
+            diff.unchanged += 1
+
+    diff.dropped = list(before.values())
+    return diff
+
+
+class StandingsDiffCache:
+    """Diffs keyed by (older, newer) snapshot id, so each is computed once"""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, StandingsDiff]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, older: StoredSnapshot, newer: StoredSnapshot) -> StandingsDiff:
+        return self.get_by_ids(older.id, newer.id, lambda: (older.standings, newer.standings))
+
+    def get_by_ids(self, older_id: int, newer_id: int,
+                   load: Callable[[], Tuple[Standings, Standings]]) -> StandingsDiff:
+        """Cached diff for the pair; `load` fetches both standings only on a miss"""
+        key = (older_id, newer_id)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        diff = diff_standings(*load())
+        with self._lock:
+            self._entries[key] = diff
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return diff
 
 # ==================== ANALYSIS ====================
 class StandingsAnalyzer:
-    def __init__(self, telegram: SecureTelegramClient):
+    def __init__(self, telegram: TelegramDelivery):
         self.telegram = telegram
 
-    def summary(self, current: List[Dict]):
+    def summary(self, current: Standings, previous: Optional[Standings] = None,
+                skipped_runs: int = 0):
+        with METRICS.timer("render", command="report"):
+            msg = self.render(current, previous, skipped_runs)
+        self.telegram.send(msg)
+
+    @staticmethod
+    def render(current: Standings, previous: Optional[Standings] = None,
+               skipped_runs: int = 0) -> str:
         msg = "<b>MOTOGP 2025 UPDATE</b>\n\n"
+        if skipped_runs:
+            msg += f"⏭️ {skipped_runs} pengecekan tanpa perubahan sejak update terakhir\n\n"
+        if previous:
+            diff = diff_standings(previous, current)
+            msg += (
+                f"👥 Total Pembalap: {len(current)}\n"
+                f"🔺 Naik: {diff.up}\n"
+                f"🔻 Turun: {diff.down}\n"
+                f"➖ Tetap: {diff.unchanged}\n\n"
+            )
         for r in current[:3]:
-            msg += f"🏁 {r['position']}. {r['rider']} - {r['points']} pts\n"
-        self.telegram.send(msg)
+            msg += f"🏁 {r.position}. {r.rider} - {r.points} pts\n"
+        return msg
 
-# ==================== MAIN ====================
-def main():
-    config = Config.from_file()
-    logger = setup_logging(config.logs_dir)
+# ==================== PIPELINE ====================
+TARGET_NAME_RE = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+
+
+@dataclass
+class ScrapeTarget:
+    """One extra standings table: a series, season or classification page"""
+    name: str
+    url: str
 
-    telegram = SecureTelegramClient(config.bot_token, config.chat_id)
-    scraper = SecureMotoGPScraper(config)
-    data = SecureDataManager(config.data_dir)
-    analyzer = StandingsAnalyzer(telegram)
+    @classmethod
+    def from_dict(cls, d: Dict) -> "ScrapeTarget":
+        name = str(d["name"]).lower()
+        if not TARGET_NAME_RE.fullmatch(name):
+            raise ValueError(f"Invalid target name: {d['name']!r}")
+        if not d["url"].startswith("https://"):
+            raise ValueError(f"Target {name} must use HTTPS")
+        return cls(name, d["url"])
 
-    previous = data.load("previous.json")
+    @property
+    def file(self) -> str:
+        return f"{self.name}.json"
 
-    with SecureChromeDriver(config) as driver:
-        current = scraper.scrape(driver)
 
-    if not current:
-        logger.error("❌ No data scraped")
-        return 1
+@dataclass
+class TargetResult:
+    target: ScrapeTarget
+    standings: Optional[Standings]  # None: unchanged (HTTP 304) or failed
+    attempts: int
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ScrapePipeline:
+    """
+    Scrapes many targets concurrently on a bounded worker pool. Every
+    target has its own engine (HTTP session, validators, Chrome fallback
+    through a shared driver pool) and a deadline per attempt; failed or
+    timed-out attempts are retried. Each result is saved to
+    data_dir/targets/ as soon as its target finishes.
+
+    A timed-out attempt cannot be killed: its worker stays busy until the
+    HTTP/page-load timeout fires, and its late result is ignored. The retry
+    waits for that worker to return, so a target's engine (HTTP session,
+    validators, stats) is never used from two threads at once.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        targets: List[ScrapeTarget],
+        workers: int = 4,
+        timeout: float = 90,
+        retries: int = 1,
+        chrome_pool: Optional["ChromeDriverPool"] = None,
+        on_result: Optional[Callable[[TargetResult], None]] = None,
+    ):
+        self.config = config
+        self.targets = targets
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.retries = retries
+        self.logger = logging.getLogger(__name__)
+
+        self.out_dir = config.data_dir / "targets"
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.data = SecureDataManager(self.out_dir)
+        self.on_result = on_result or self._save
+
+        self._owns_pool = chrome_pool is None
+        self.chrome_pool = chrome_pool or ChromeDriverPool.from_config(
+            lambda: SecureChromeDriver(config).__enter__(),
+            {**config.driver_pool, "size": config.pipeline.get("chrome_workers", 2)},
+        )
+        self.engines = {
+            t.name: StandingsScrapeEngine(
+                replace(config, motogp_url=t.url),
+                chrome_scrape=partial(self._chrome_scrape, t),
+                stats=ScrapePathStats(),
+                validators_path=self.out_dir / f"{t.name}.http.json",
+            )
+            for t in targets
+        }
+        self._started: Dict[str, float] = {}
 
-    data.save(current, "current.json")
-    analyzer.summary(current)
-    data.save(current, "previous.json")
+    @classmethod
+    def from_config(cls, config: Config, chrome_pool: Optional["ChromeDriverPool"] = None) -> "ScrapePipeline":
+        settings = config.pipeline
+        return cls(
+            config,
+            [ScrapeTarget.from_dict(t) for t in config.targets],
+            workers=settings.get("workers", 4),
+            timeout=settings.get("target_timeout", 90),
+            retries=settings.get("retries", 1),
+            chrome_pool=chrome_pool,
+        )
+
+    def _chrome_scrape(self, target: ScrapeTarget) -> List[Dict]:
+        try:
+            with self.chrome_pool.lease() as driver:
+                data = SecureMotoGPScraper(replace(self.config, motogp_url=target.url)).scrape(driver)
+                if not data:
+                    raise RuntimeError("no rows scraped")  # don't reuse this driver
+                return data
+        except Exception as e:
+            self.logger.warning(f"{target.name}: Chrome scrape failed: {e}")
+            return []
+
+    def _scrape(self, target: ScrapeTarget) -> Optional[Standings]:
+        self._started[target.name] = time.monotonic()
+        conditional = (self.out_dir / target.file).exists()
+        return self.engines[target.name].scrape(conditional=conditional)
+
+    def _save(self, result: TargetResult):
+        if result.standings:
+            self.data.save(result.standings, result.target.file)
+
+    def run(self) -> List[TargetResult]:
+        start = time.perf_counter()
+        attempts = {t.name: 0 for t in self.targets}
+        results: List[TargetResult] = []
+        pending: Dict = {}
+        running: Dict = {}  # target name -> its latest attempt, even once timed out
+        held: Dict = {}  # timed-out attempt still on a worker -> target whose retry waits for it
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="scrape")
+
+        def submit(target: ScrapeTarget):
+            previous = running.get(target.name)
+            if previous is not None and not previous.done():
+                held[previous] = target
+                return
+            attempts[target.name] += 1
+            self._started.pop(target.name, None)
+            future = running[target.name] = executor.submit(self._scrape, target)
+            pending[future] = target
+
+        def finish(target: ScrapeTarget, standings: Optional[Standings], error: Optional[str]):
+            if error and attempts[target.name] <= self.retries:
+                self.logger.warning(f"🔁 {target.name}: {error}, retrying")
+                submit(target)
+                return
+            result = TargetResult(
+                target, standings, attempts[target.name],
+                time.perf_counter() - start, error,
+            )
+            results.append(result)
+            if result.ok:
+                self.on_result(result)
+            else:
+                self.logger.error(f"❌ {target.name}: {error} after {result.attempts} attempt(s)")
+
+        try:
+            for target in self.targets:
+                submit(target)
+
+            while pending or held:
+                now = time.monotonic()
+                deadlines = [
+                    self._started[t.name] + self.timeout
+                    for t in pending.values() if t.name in self._started
+                ]
+                timeout = max(min(deadlines) - now, 0) if deadlines else self.timeout
+                done, _ = wait([*pending, *held], timeout=min(timeout, 1.0), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future in held:
+                        submit(held.pop(future))  # the stale attempt returned; its result is dropped
+                        continue
+                    target = pending.pop(future)
+                    try:
+                        standings = future.result()
+                    except Exception as e:
+                        finish(target, None, f"{type(e).__name__}: {e}")
+                        continue
+                    if standings is not None and not standings:
+                        finish(target, None, "no standings found")
+                    else:
+                        finish(target, standings, None)
+
+                now = time.monotonic()
+                for future, target in list(pending.items()):
+                    started = self._started.get(target.name)
+                    if started is not None and now - started > self.timeout and not future.done():
+                        del pending[future]
+                        finish(target, None, f"timed out after {self.timeout:g}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        ok = sum(r.ok for r in results)
+        self.logger.info(
+            f"🧵 Pipeline: {ok}/{len(self.targets)} targets in "
+            f"{time.perf_counter() - start:.2f}s with {self.workers} workers"
+        )
+        return results
+
+    def close(self):
+        if self._owns_pool:
+            self.chrome_pool.close()
+
+# ==================== MONITOR ====================
+class StandingsMonitor:
+    """One check: scrape, skip if unchanged, otherwise save, record and report"""
+
+    def __init__(self, config: Config, chrome_scrape: Optional[Callable[[], List[Dict]]] = None,
+                 chrome_pool: Optional[ChromeDriverPool] = None):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+
+        self.telegram = TelegramDelivery.from_config(config)
+        self.data = SecureDataManager(config.data_dir)
+        self.analyzer = StandingsAnalyzer(self.telegram)
+
+        self.engine = StandingsScrapeEngine(
+            config,
+            chrome_scrape=chrome_scrape,
+            stats=ScrapePathStats(config.data_dir / "scrape_paths.json"),
+            validators_path=config.data_dir / "http_validators.json",
+        )
+        self.run_state = RunState(config.data_dir / "run_state.json")
+        self.run_log = RunLog(config.logs_dir / "runs.jsonl")
+
+        self.history = SnapshotStore(config.data_dir / config.history_db)
+        self.history.migrate_legacy(config.data_dir, [config.previous_file, config.current_file])
+
+        self.pipeline = (
+            ScrapePipeline.from_config(config, chrome_pool=chrome_pool) if config.targets else None
+        )
+
+    def run_targets(self) -> List[TargetResult]:
+        """Scrape the extra scraping.targets tables into data_dir/targets/"""
+        return self.pipeline.run() if self.pipeline else []
+
+    def check(self, report: bool = False) -> Optional[bool]:
+        """run_once() plus the extra targets, timed as one line of logs/runs.jsonl"""
+        with self.run_log.run(report=report) as record:
+            changed = self.run_once(report=report)
+            record["result"] = {True: "changed", False: "unchanged", None: "failed"}[changed]
+            results = self.run_targets()
+            if results:
+                record["targets"] = {r.target.name: r.error or "ok" for r in results}
+        return changed
+
+    def run_once(self, report: bool = False) -> Optional[bool]:
+        """
+        True if the standings changed (and were reported), False if unchanged,
+        None if nothing could be scraped. report=True sends the summary even
+        when nothing changed (the daily report).
+        """
+        latest = self.history.latest()
+        previous = latest.standings if latest else Standings()
+
+        current = self.engine.scrape(conditional=latest is not None)
+
+        if current is None:
+            self.run_state.mark_unchanged("HTTP 304")
+        elif not current:
+            self.logger.error("❌ No data scraped")
+            return None
+        elif latest and snapshot_fingerprint(current) == self.history.latest_fingerprint():
+            self.run_state.mark_unchanged(f"fingerprint {snapshot_fingerprint(current)[:12]}")
+        else:
+            skipped = self.run_state.mark_changed()
+            self.data.save(current, self.config.current_file)
+            self.history.append(current)
+            self.analyzer.summary(current, previous, skipped_runs=skipped)
+            return True
+
+        if report and latest:
+            older = self.history.before(latest.id)
+            self.analyzer.summary(
+                latest.standings, older.standings if older else None,
+                skipped_runs=self.run_state.state["unchanged_streak"],
+            )
+        return False
+
+    def close(self):
+        if self.pipeline:
+            self.pipeline.close()
+        self.history.close()
+
+# ==================== DAEMON ====================
+@dataclass
+class Schedule:
+    """
+    When the daemon checks: every interval_hours normally, every
+    race_interval_minutes inside a race weekend, stretched by backoff_factor
+    for each unchanged check in a row (capped at interval_hours inside a
+    race weekend and max_interval_hours outside), plus a report at
+    daily_report_time every day.
+    """
+
+    interval_hours: float = 24
+    daily_report_time: Optional[str] = None
+    race_weekends: List[Tuple[date, date]] = field(default_factory=list)
+    race_interval_minutes: float = 30
+    backoff_factor: float = 2
+    max_interval_hours: float = 48
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "Schedule":
+        return cls(
+            interval_hours=d.get("scrape_interval_hours", 24),
+            daily_report_time=d.get("daily_report_time") or None,
+            race_weekends=[
+                (date.fromisoformat(start), date.fromisoformat(end))
+                for start, end in d.get("race_weekends", [])
+            ],
+            race_interval_minutes=d.get("race_weekend_interval_minutes", 30),
+            backoff_factor=d.get("backoff_factor", 2),
+            max_interval_hours=d.get("max_interval_hours", 48),
+        )
+
+    def in_race_weekend(self, now: datetime) -> bool:
+        return any(start <= now.date() <= end for start, end in self.race_weekends)
+
+    def next_race_weekend(self, now: datetime) -> Optional[datetime]:
+        starts = [datetime.combine(start, datetime.min.time())
+                  for start, _ in self.race_weekends if start > now.date()]
+        return min(starts, default=None)
+
+    def next_report(self, now: datetime) -> Optional[datetime]:
+        if not self.daily_report_time:
+            return None
+        hour, minute = (int(part) for part in self.daily_report_time.split(":"))
+        at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return at if at > now else at + timedelta(days=1)
+
+    def next_delay(self, now: datetime, unchanged_streak: int) -> float:
+        """Seconds until the next check (never sleeping past a report or a race weekend)"""
+        if self.in_race_weekend(now):
+            base, cap = self.race_interval_minutes * 60, self.interval_hours * 3600
+        else:
+            base, cap = self.interval_hours * 3600, max(self.max_interval_hours, self.interval_hours) * 3600
+        delay = min(base * self.backoff_factor ** unchanged_streak, cap)
+
+        for wake in (self.next_report(now), self.next_race_weekend(now)):
+            if wake is not None:
+                delay = min(delay, (wake - now).total_seconds())
+        return max(delay, 1.0)
+
+
+class MemoryReport:
+    """RSS once per cycle, appended to a JSONL file so multi-day growth is visible"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.started = time.monotonic()
+        self.start_mb: Optional[float] = None
+        self.peak_mb: Optional[float] = None
+        self.logger = logging.getLogger(__name__)
+
+    def sample(self, **extra) -> Optional[float]:
+        if psutil is None:
+            return None
+        own_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        tree_mb = process_tree_rss_mb()
+        if self.start_mb is None:
+            self.start_mb = own_mb
+        self.peak_mb = max(self.peak_mb or 0.0, own_mb)
+        hours = (time.monotonic() - self.started) / 3600
+
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "uptime_hours": round(hours, 3),
+            "rss_mb": round(own_mb, 1),
+            "tree_rss_mb": round(tree_mb, 1) if tree_mb is not None else None,
+            **extra,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            self.logger.warning(f"Could not write memory report: {e}")
+
+        self.logger.info(
+            f"🧠 Memory after {hours:.1f}h: {own_mb:.0f}MB "
+            f"(start {self.start_mb:.0f}MB, peak {self.peak_mb:.0f}MB)"
+            + (f", {tree_mb:.0f}MB with Chrome" if tree_mb is not None else "")
+        )
+        return own_mb
+
+
+class MonitorDaemon:
+    """
+    Long-running auto01: one interpreter, one warm HTTP session and a pooled
+    Chrome driver reused across checks, following the configured Schedule.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.schedule = Schedule.from_dict(config.schedule)
+
+        # Keep Chrome warm between race-weekend checks; the reaper still
+        # closes it during the long gaps in between
+        settings = dict(config.driver_pool)
+        settings["idle_timeout"] = max(
+            settings.get("idle_timeout", 600), self.schedule.race_interval_minutes * 60 * 1.5
+        )
+        self.pool = ChromeDriverPool.from_config(self._new_driver, settings)
+        self.monitor = StandingsMonitor(
+            config, chrome_scrape=self._chrome_scrape, chrome_pool=self.pool
+        )
+        self.memory = MemoryReport(config.logs_dir / "daemon_memory.jsonl")
+        self.metrics_server = MetricsServer.from_config(config.metrics)
+        self.stopping = threading.Event()
+
+    def _new_driver(self):
+        return SecureChromeDriver(self.config).__enter__()
+
+    def _chrome_scrape(self) -> List[Dict]:
+        try:
+            with self.pool.lease() as driver:
+                data = SecureMotoGPScraper(self.config).scrape(driver)
+                if not data:
+                    raise RuntimeError("no rows scraped")  # don't reuse this driver
+                return data
+        except Exception as e:
+            self.logger.warning(f"Pooled Chrome scrape failed: {e}")
+            return []
+
+    def stop(self, *_):
+        self.logger.info("👋 Stop requested, finishing current check...")
+        self.stopping.set()
+
+    def run(self) -> int:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                signal.signal(sig, self.stop)
+            except ValueError:
+                pass  # not the main thread: rely on stop()
+
+        now = datetime.now()
+        next_report = self.schedule.next_report(now)
+        in_window = self.schedule.in_race_weekend(now)
+        streak = runs = 0
+        self.logger.info(
+            f"⏰ Daemon started: every {self.schedule.interval_hours}h, "
+            f"{len(self.schedule.race_weekends)} race weekends, "
+            f"daily report {self.schedule.daily_report_time or 'off'}"
+        )
+
+        try:
+            while not self.stopping.is_set():
+                now = datetime.now()
+                report_due = next_report is not None and now >= next_report
+                try:
+                    changed = self.monitor.check(report=report_due)
+                except Exception as e:
+                    self.logger.error(f"Check failed: {e}", exc_info=True)
+                    changed = None
+                runs += 1
+                if report_due:
+                    next_report = self.schedule.next_report(now)
+
+                now = datetime.now()
+                window = self.schedule.in_race_weekend(now)
+                if changed or window != in_window:
+                    streak = 0
+                elif changed is False:
+                    streak += 1
+                in_window = window
+
+                delay = self.schedule.next_delay(now, streak)
+                self.memory.sample(runs=runs, unchanged_streak=streak, race_weekend=window)
+                self.logger.info(
+                    f"💤 Next check in {delay / 60:.0f} min"
+                    f"{' (race weekend)' if window else ''}"
+                    f"{f', backed off x{self.schedule.backoff_factor ** streak:g}' if streak else ''}"
+                )
+                self.stopping.wait(delay)
+        finally:
+            self.pool.close()
+            self.monitor.close()
+            if self.metrics_server:
+                self.metrics_server.close()
+            self.logger.info(
+                f"Daemon stopped after {runs} checks; memory start "
+                f"{self.memory.start_mb or 0:.0f}MB, peak {self.memory.peak_mb or 0:.0f}MB"
+            )
+        return 0
+
+# ==================== MAIN ====================
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="MotoGP standings monitor")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and check on the configured schedule")
+    args = parser.parse_args(argv)
+
+    config = Config.from_file(args.config)
+    logger = setup_logging(config.logs_dir, config.log_settings)
+
+    if args.daemon:
+        return MonitorDaemon(config).run()
+
+    monitor = StandingsMonitor(config)
+    try:
+        changed = monitor.check()
+    finally:
+        monitor.close()
+    if changed is None:
+        return 1
 
-    logger.info("=" * 70)
-    logger.info("✅ AUTO01 SECURE COMPLETED SUCCESSFULLY")
-    logger.info("=" * 70)
+    if changed:
+        logger.info("=" * 70)
+        logger.info("✅ AUTO01 SECURE COMPLETED SUCCESSFULLY")
+        logger.info("=" * 70)
     return 0
 
 
@@ -17,32 +17,66 @@ Commands:
 /team   - Team rankings
 /delta  - Position changes
 /best   - Best performers
+/rider  - Rider search (also inline: @bot name)
 /stats  - Bot statistics
 """
 
 import os
 import sys
 import json
+import hashlib
+import heapq
+import html
+import math
+import zlib
+import base64
+import time
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from collections import defaultdict
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from collections import Counter, OrderedDict, defaultdict
 import asyncio
+import hmac
+import secrets
+import signal
+import argparse
+from bisect import bisect_left
+from itertools import chain
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party imports
 try:
-    from telegram import Update, BotCommand
+    from telegram import Update, BotCommand, InlineQueryResultArticle, InputTextMessageContent
     from telegram.ext import (
         Application,
         CommandHandler,
         ContextTypes,
+        InlineQueryHandler,
         filters
     )
     from telegram.error import TelegramError, NetworkError, TimedOut
-    import undetected_chromedriver as uc
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    # Selenium/undetected_chromedriver load on the first Chrome scrape
+    from auto01 import (
+        METRICS,
+        ChromeDriverPool,
+        MetricsServer,
+        ScrapePathStats,
+        ChromeProfile,
+        EXTRACTORS,
+        page_transfer_stats,
+        start_chrome,
+        SnapshotStore,
+        RiderStanding,
+        Standings,
+        StandingsDiffCache,
+        StandingsScrapeEngine,
+        read_standings_table,
+        rider_key,
+        setup_logging,
+        snapshot_fingerprint,
+    )
 except ImportError as e:
     print(f"❌ Missing dependency: {e}")
     print("Install: pip install python-telegram-bot undetected-chromedriver --break-system-packages")
@@ -58,15 +92,51 @@ class BotConfig:
                 data = json.load(f)
             
             self.bot_token = data['telegram']['bot_token']
+            self.telegram_api_base = data['telegram'].get('api_base', 'https://api.telegram.org')
             self.allowed_chat_ids = data.get('allowed_chat_ids', [])
             self.admin_chat_ids = data.get('admin_chat_ids', [])
             
             self.motogp_url = data['scraping']['motogp_url']
             self.chrome_version = data['chrome'].get('force_version', 145)
             self.headless = data['chrome'].get('headless', True)
+            self.chrome_settings = data['chrome']
+            self.allowed_domains = data.get('security', {}).get('allowed_domains', [])
+            self.timeout = data['scraping'].get('request_timeout', 30)
+            self.extraction_mode = data['scraping'].get('extraction_mode', 'script')
+            self.data_dir = Path(data.get('paths', {}).get('data_dir', 'data'))
+            self.logs_dir = Path(data.get('paths', {}).get('logs_dir', 'logs'))
+            self.log_settings = data.get('logging', {})
+            
+            self.driver_pool = data.get('driver_pool', {})
+            
+            self.current_file = data.get('paths', {}).get('current_file', 'current.json')
+            self.history_db = data.get('paths', {}).get('history_db', 'history.sqlite3')
+            
+            self.standings_source = data.get('bot', {}).get('standings_source', 'scrape')
+            self.snapshot_max_age = data.get('bot', {}).get('snapshot_max_age', 172800)
+            self.snapshot_poll_interval = data.get('bot', {}).get('snapshot_poll_interval', 5)
+            self.record_history = data.get('bot', {}).get('record_history', False)
+            self.cache_fresh_ttl = data.get('bot', {}).get('cache_fresh_ttl', 300)
+            self.cache_stale_ttl = data.get('bot', {}).get('cache_stale_ttl', 3600)
             
             self.rate_limit_window = data.get('bot', {}).get('rate_limit_window', 60)
             self.rate_limit_max_calls = data.get('bot', {}).get('rate_limit_max_calls', 10)
+            self.rate_limit_max_users = data.get('bot', {}).get('rate_limit_max_users', 100000)
+            
+            self.stats_file = data.get('paths', {}).get('bot_stats_file', 'bot_stats.json')
+            self.stats_flush_interval = data.get('bot', {}).get('stats_flush_interval', 60)
+            self.stats_hours_kept = data.get('bot', {}).get('stats_hours_kept', 48)
+            self.stats_days_kept = data.get('bot', {}).get('stats_days_kept', 30)
+            
+            self.mode = data.get('bot', {}).get('mode', 'polling')
+            self.concurrent_updates = data.get('bot', {}).get('concurrent_updates', 32)
+            self.webhook_url = data.get('webhook', {}).get('url', '')
+            self.webhook_listen = data.get('webhook', {}).get('listen', '127.0.0.1')
+            self.webhook_port = data.get('webhook', {}).get('port', 8443)
+            self.webhook_secret = data.get('webhook', {}).get('secret_token', '')
+            self.webhook_max_connections = data.get('webhook', {}).get('max_connections', 40)
+            
+            self.metrics = data.get('metrics', {})
             
             self.validate()
             
@@ -82,15 +152,59 @@ class BotConfig:
         
         if not self.motogp_url.startswith('https://'):
             raise ValueError("URL must use HTTPS")
+        
+        if self.standings_source not in ('scrape', 'files'):
+            raise ValueError("bot.standings_source must be 'scrape' or 'files'")
+        
+        if self.extraction_mode not in EXTRACTORS:
+            raise ValueError(f"scraping.extraction_mode must be one of {sorted(EXTRACTORS)}, got {self.extraction_mode!r}")
+        
+        if self.mode not in ('polling', 'webhook'):
+            raise ValueError("bot.mode must be 'polling' or 'webhook'")
+        
+        if self.mode == 'webhook' and not self.webhook_url.startswith('https://'):
+            raise ValueError("webhook.url must be the public HTTPS URL Telegram posts to")
+        
+        if not self.rate_limit_window > 0:
+            raise ValueError("bot.rate_limit_window must be a positive number of seconds")
+        
+        if not (isinstance(self.rate_limit_max_calls, int) and self.rate_limit_max_calls >= 1):
+            raise ValueError("bot.rate_limit_max_calls must be at least 1")
 
 # ==================== RATE LIMITER ====================
+class _TokenBucket:
+    """Per-user limiter state: two floats and a flag"""
+    
+    __slots__ = ("tokens", "updated", "warned")
+    
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated  # last refill, also the LRU's last use
+        self.warned = False
+
+
 class CommandRateLimiter:
-    """Rate limiting for bot commands per user"""
+    """
+    Rate limiting for bot commands per user.
+    
+    Each user gets a token bucket holding up to max_calls tokens that refills
+    at max_calls per window: a sustained max_calls per window plus a burst of
+    max_calls, so a user starting from a full bucket can get just under
+    2 * max_calls through inside one window. The old timestamp lists capped
+    that at exactly max_calls but cost O(max_calls) per user; a bucket is two
+    floats, so every check is O(1) and every user costs the same. Buckets live
+    in an LRU ordered by last use: a bucket idle for a whole window is full
+    again, so the sweep on each call drops those for free, and max_users caps
+    memory regardless of how many distinct users the bot has seen.
+    """
     
-    def __init__(self, max_calls: int = 10, window: int = 60):
+    def __init__(self, max_calls: int = 10, window: int = 60, max_users: int = 100_000):
         self.max_calls = max_calls
         self.window = window
-        self.user_calls: Dict[int, List[datetime]] = defaultdict(list)
+        self.max_users = max_users
+        self.rate = max_calls / window
+        self.buckets: "OrderedDict[int, _TokenBucket]" = OrderedDict()
+        self.evicted = 0
         self.logger = logging.getLogger(__name__)
     
     def is_allowed(self, user_id: int) -> tuple[bool, Optional[int]]:
@@ -98,30 +212,48 @@ class CommandRateLimiter:
         Check if user is allowed to make request
         Returns: (allowed, wait_time_seconds)
         """
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.window)
+        now = time.monotonic()
+        self._sweep(now)
         
-        # Remove old calls
-        self.user_calls[user_id] = [
-            t for t in self.user_calls[user_id]
-            if t > cutoff
-        ]
+        bucket = self.buckets.get(user_id)
+        if bucket is None:
+            bucket = self.buckets[user_id] = _TokenBucket(self.max_calls, now)
+            if len(self.buckets) > self.max_users:
+                self.buckets.popitem(last=False)
+                self.evicted += 1
+        else:
+            self.buckets.move_to_end(user_id)
+            bucket.tokens = min(self.max_calls, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
         
-        if len(self.user_calls[user_id]) < self.max_calls:
-            self.user_calls[user_id].append(now)
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.warned = False
             return True, None
         
-        # Calculate wait time
-        oldest_call = min(self.user_calls[user_id])
-        wait_time = int((oldest_call + timedelta(seconds=self.window) - now).total_seconds())
-        
-        self.logger.warning(f"Rate limit hit for user {user_id}")
+        # Warn once per burst rather than on every rejected call
+        if not bucket.warned:
+            bucket.warned = True
+            self.logger.warning(f"Rate limit hit for user {user_id}")
+        wait_time = int((1 - bucket.tokens) / self.rate + 0.999)
         return False, max(wait_time, 1)
     
+    def _sweep(self, now: float):
+        """Drop buckets idle for a full window (they have refilled completely)"""
+        cutoff = now - self.window
+        buckets = self.buckets
+        while buckets:
+            user_id, bucket = next(iter(buckets.items()))
+            if bucket.updated > cutoff:
+                break
+            del buckets[user_id]
+    
     def reset_user(self, user_id: int):
         """Reset rate limit for user (admin only)"""
-        if user_id in self.user_calls:
-            del self.user_calls[user_id]
+        self.buckets.pop(user_id, None)
+    
+    def __len__(self) -> int:
+        return len(self.buckets)
 
 # ==================== ACCESS CONTROL ====================
 class AccessControl:
@@ -160,6 +292,375 @@ class AccessControl:
         self.blacklist.add(user_id)
         self.logger.warning(f"User added to blacklist: {user_id}")
 
+# ==================== CACHE ====================
+def _trigrams(key: str) -> frozenset:
+    grams = set()
+    for token in key.split():
+        padded = f"  {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def _initial_form(key: str) -> str:
+    """'marc marquez' -> 'm marquez', the abbreviated form standings pages use"""
+    first, _, rest = key.partition(" ")
+    return f"{first[0]} {rest}" if rest and len(first) > 1 else key
+
+
+class RiderSearchIndex:
+    """
+    Rider name search over standings rows.
+    
+    Each row is filed under its rider_key ("m marquez"), the abbreviated
+    form of a full name and every name token, in one sorted key list, so
+    exact and prefix matches are a bisection. Prefixes of up to
+    SHORT_PREFIX characters, which span large parts of a big corpus, have
+    their best rows precomputed. Full-name queries ("Marc Márquez") are
+    also tried in abbreviated form.
+    
+    Typos ("marqes") go through a trigram index over the distinct name
+    tokens, and fill whatever prefix matches leave of `limit`. Each query
+    word is matched to its closest tokens; a row scores the average of its
+    best token per word, an initial counting almost as much as the word
+    it abbreviates (words before the last only), so "marc marqes" ranks
+    "M. Marquez" highly.
+    """
+    
+    MIN_SCORE = 0.4      # average Dice coefficient per query word
+    INITIAL_SCORE = 0.9  # "m" for "marc"
+    SHORTLIST = 8        # similar tokens kept per query word, per result wanted
+    SHORT_PREFIX = 3
+    MAX_RESULTS = 20
+    
+    def __init__(self, rows: Iterable[RiderStanding]):
+        self.rows = tuple(rows)
+        keys = set()
+        token_ids: Dict[str, int] = {}
+        self._token_rows: List[List[int]] = []
+        self._row_tokens: List[tuple] = []
+        for i, row in enumerate(self.rows):
+            key = rider_key(row.rider)
+            for name in (key, _initial_form(key), *key.split()):
+                keys.add((name, i))
+            ids = []
+            for token in key.split():
+                if token not in token_ids:
+                    token_ids[token] = len(self._token_rows)
+                    self._token_rows.append([])
+                ids.append(token_ids[token])
+                self._token_rows[ids[-1]].append(i)
+            self._row_tokens.append(tuple(ids))
+        self._keys = sorted(keys)  # equal names sort by row, i.e. standings order
+        
+        self._token_names = list(token_ids)
+        self._token_grams = [_trigrams(token) for token in self._token_names]
+        postings = defaultdict(list)
+        for t, grams in enumerate(self._token_grams):
+            if len(self._token_names[t]) == 1:
+                continue  # initials are matched by first letter, not by trigrams
+            for gram in grams:
+                postings[gram].append(t)
+        self._postings = dict(postings)
+        
+        short = defaultdict(set)
+        for name, i in self._keys:
+            for n in range(1, min(len(name), self.SHORT_PREFIX) + 1):
+                short[name[:n]].add(i)
+        self._short = {
+            prefix: heapq.nsmallest(2 * self.MAX_RESULTS, rows) for prefix, rows in short.items()
+        }
+    
+    def search(self, query: str, limit: int = 5) -> List[RiderStanding]:
+        """Best matches first: exact names, then prefixes, in standings order, then fuzzy"""
+        key = rider_key(query)
+        if not key:
+            return []
+        limit = min(limit, self.MAX_RESULTS)
+        forms = {key, _initial_form(key)}
+        
+        exact = sorted({i for form in forms for i in self._exact(form, limit)})[:limit]
+        found = exact + sorted(
+            {i for form in forms for i in self._prefixed(form, 2 * limit)} - set(exact)
+        )
+        if not exact and len(found) < limit:
+            seen = set(found)
+            found += [i for i in self._fuzzy(key, limit) if i not in seen]
+        return [self.rows[i] for i in found[:limit]]
+    
+    def _exact(self, key: str, limit: int) -> List[int]:
+        keys = self._keys
+        start = bisect_left(keys, (key,))
+        found = []
+        for j in range(start, min(start + limit, len(keys))):
+            name, i = keys[j]
+            if name != key:
+                break
+            found.append(i)
+        return found
+    
+    def _prefixed(self, key: str, limit: int) -> List[int]:
+        """The `limit` best rows (by standings order) with a name starting with key"""
+        if len(key) <= self.SHORT_PREFIX:
+            return self._short.get(key, [])[:limit]
+        keys = self._keys
+        start = bisect_left(keys, (key,))
+        end = bisect_left(keys, (key + chr(0x10FFFF),), start)
+        return heapq.nsmallest(limit, {i for _, i in keys[start:end]})
+    
+    def _similar_tokens(self, word: str, count: int) -> Dict[int, float]:
+        """token id -> Dice score for the `count` tokens sharing most trigrams with word"""
+        grams = _trigrams(word)
+        # Grams shared by many tokens ("ez ") cost the most to tally and
+        # rank little, so only the distinctive ones are read; the tally
+        # itself runs in C
+        postings = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        common = max(len(self._token_names) // 16, 64)
+        while len(postings) > 3 and len(postings[-1]) > common:
+            postings.pop()
+        hits = Counter(chain.from_iterable(postings))
+        token_grams = self._token_grams
+        return {
+            t: 2 * len(grams & token_grams[t]) / (len(grams) + len(token_grams[t]))
+            for t, _ in hits.most_common(count)
+        }
+    
+    def _fuzzy(self, key: str, limit: int) -> List[int]:
+        words = key.split()
+        similar = [
+            None if len(word) == 1 else self._similar_tokens(word, limit * self.SHORTLIST)
+            for word in words
+        ]
+        
+        # Candidate rows come from the selective words, usually the surname:
+        # a first name alone may be shared by hundreds of rows
+        token_rows = self._token_rows
+        pools = sorted(
+            ((sum(len(token_rows[t]) for t in scores), scores) for scores in similar if scores),
+            key=lambda pool: pool[0]
+        )
+        if not pools:
+            return []
+        cap = limit * self.SHORTLIST * 4
+        candidates = set()
+        for n, (size, scores) in enumerate(pools):
+            if n and size > cap:
+                break
+            candidates.update(chain.from_iterable(token_rows[t] for t in scores))
+        
+        # Initials stand for first names, so only words before the last match them
+        first_names = [n < len(words) - 1 for n in range(len(words))]
+        names = self._token_names
+        scored = []
+        for i in candidates:
+            total = 0.0
+            for word, scores, first_name in zip(words, similar, first_names):
+                best = 0.0
+                for t in self._row_tokens[i]:
+                    if scores is None or (first_name and len(names[t]) == 1):
+                        score = self.INITIAL_SCORE if names[t][0] == word[0] else 0.0
+                    else:
+                        score = scores.get(t, 0.0)
+                    if score > best:
+                        best = score
+                total += best
+            score = total / len(words)
+            if score >= self.MIN_SCORE:
+                scored.append((-score, i))
+        return [i for _, i in heapq.nsmallest(limit, scored)]
+
+
+class StandingsSnapshot:
+    """
+    One scraped standings table, when it was fetched, and its content
+    version. Derived indexes are built once here, at ingest, so handlers
+    only read them:
+      team_totals   team -> total points
+      team_riders   team -> riders, in standings order
+      rider_index   rider_key -> row
+      team_ranking  [(team, points)] sorted by points
+    The name search index is built on first use, since only /rider and
+    inline queries need it.
+    """
+    
+    __slots__ = (
+        "standings", "fetched_at", "version",
+        "team_totals", "team_riders", "rider_index", "team_ranking", "_search",
+    )
+    
+    def __init__(self, standings: Standings, fetched_at: float):
+        self.standings = standings = Standings.coerce(standings)
+        self.fetched_at = fetched_at
+        self.version = snapshot_fingerprint(standings)
+        
+        team_totals = defaultdict(int)
+        team_riders = defaultdict(list)
+        rider_index = {}
+        for rider in standings:
+            team_totals[rider.team] += rider.points
+            team_riders[rider.team].append(rider)
+            rider_index[rider_key(rider.rider)] = rider
+        
+        self.team_totals = dict(team_totals)
+        self.team_riders = dict(team_riders)
+        self.rider_index = rider_index
+        self.team_ranking = sorted(self.team_totals.items(), key=lambda x: x[1], reverse=True)
+        self._search: Optional[RiderSearchIndex] = None
+    
+    def rider(self, name: str) -> Optional[RiderStanding]:
+        """O(1) lookup by rider name (accent/case-insensitive)"""
+        return self.rider_index.get(rider_key(name))
+    
+    def search(self, query: str, limit: int = 5) -> List[RiderStanding]:
+        """Fuzzy/prefix rider search (full, short or accent-free names)"""
+        if self._search is None:
+            self._search = RiderSearchIndex(self.standings)
+        return self._search.search(query, limit)
+    
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class StandingsCache:
+    """
+    Stale-while-revalidate cache: fresh data is served as-is, stale data is
+    served instantly while the caller refreshes in the background. The latest
+    snapshot is kept on disk so a restarted bot answers from it.
+    """
+    
+    FRESH, STALE, MISS = "fresh", "stale", "miss"
+    
+    def __init__(self, fresh_ttl: int, stale_ttl: int, path: Optional[Path] = None):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = max(stale_ttl, fresh_ttl)
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self.snapshot: Optional[StandingsSnapshot] = self._load()
+        self.counters = {self.FRESH: 0, self.STALE: 0, self.MISS: 0}
+    
+    def lookup(self) -> tuple[Optional[StandingsSnapshot], str]:
+        """Return (snapshot, state) without counting it"""
+        snapshot = self.snapshot
+        if snapshot is None:
+            return None, self.MISS
+        if snapshot.age < self.fresh_ttl:
+            return snapshot, self.FRESH
+        if snapshot.age < self.stale_ttl:
+            return snapshot, self.STALE
+        return snapshot, self.MISS
+    
+    def record(self, state: str):
+        self.counters[state] += 1
+    
+    def store(self, standings: Standings) -> StandingsSnapshot:
+        """
+        Replace the snapshot and persist it (call off the event loop). An
+        unchanged table (HTTP 304 or same content) keeps its snapshot and
+        indexes and only moves fetched_at, since it was revalidated now.
+        """
+        snapshot = self.snapshot
+        if snapshot and (standings is snapshot.standings
+                         or snapshot_fingerprint(standings) == snapshot.version):
+            snapshot.fetched_at = time.time()
+        else:
+            snapshot = self.snapshot = StandingsSnapshot(standings, time.time())
+        self._save(snapshot)
+        return snapshot
+    
+    def _load(self) -> Optional[StandingsSnapshot]:
+        if not self.path or not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            snapshot = StandingsSnapshot(data['standings'], float(data['fetched_at']))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable cache snapshot: {e}")
+            return None
+        
+        self.logger.info(
+            f"Warm start: {len(snapshot.standings)} riders from disk "
+            f"(age: {snapshot.age:.0f}s)"
+        )
+        return snapshot
+    
+    def _save(self, snapshot: StandingsSnapshot):
+        if not self.path:
+            return
+        tmp = self.path.with_suffix('.tmp')
+        try:
+            with METRICS.timer("disk_save", store="cache"):
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        {"fetched_at": snapshot.fetched_at, "standings": snapshot.standings.to_dicts()},
+                        f, ensure_ascii=False
+                    )
+                os.replace(tmp, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not persist cache snapshot: {e}")
+
+class SnapshotFileSource:
+    """
+    Standings written by auto01 (data/current.json). The file is polled by
+    mtime/size and only re-parsed when its content hash changes; a parsed
+    snapshot replaces the previous one in a single assignment, so readers
+    never see a half-loaded table.
+    """
+    
+    def __init__(self, path: Path, max_age: float):
+        self.path = path
+        self.max_age = max_age
+        self.logger = logging.getLogger(__name__)
+        self.snapshot: Optional[StandingsSnapshot] = None
+        self._stat = None
+        self._digest = None
+        self.poll()
+    
+    def poll(self) -> bool:
+        """Reload if the file changed; returns True when a new snapshot was loaded"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if key == self._stat:
+            return False
+        self._stat = key
+        
+        try:
+            raw = self.path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest == self._digest:
+                return False
+            
+            standings = Standings.from_dicts(json.loads(raw))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Skipping unreadable {self.path.name}: {e}")
+            self._stat = None  # retry on the next poll
+            return False
+        
+        self._digest = digest
+        self.snapshot = StandingsSnapshot(standings, st.st_mtime)
+        self.logger.info(f"📂 Loaded {len(standings)} riders from {self.path}")
+        return True
+    
+    def current(self) -> Optional[StandingsSnapshot]:
+        """The file snapshot, unless it is missing or older than max_age"""
+        snapshot = self.snapshot
+        if snapshot and snapshot.standings and snapshot.age < self.max_age:
+            return snapshot
+        return None
+    
+    async def watch(self, interval: float):
+        """Poll for changes until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.poll()
+            except Exception as e:
+                self.logger.error(f"Snapshot watch error: {e}")
+
 # ==================== SCRAPER ====================
 class SecureScraper:
     """Secure MotoGP scraper with caching"""
@@ -167,96 +668,473 @@ class SecureScraper:
     def __init__(self, config: BotConfig):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.cache = None
-        self.cache_time = None
-        self.cache_ttl = 300  # 5 minutes
-    
-    def get_standings(self, force_refresh: bool = False) -> List[Dict]:
-        """Get standings with caching"""
-        # Check cache
-        if not force_refresh and self.cache and self.cache_time:
-            age = (datetime.now() - self.cache_time).total_seconds()
-            if age < self.cache_ttl:
-                self.logger.info(f"Using cache (age: {age:.0f}s)")
-                return self.cache
-        
-        # Scrape fresh data
+        
+        self.config.data_dir.mkdir(exist_ok=True)
+        self.file_source = None
+        if config.standings_source == "files":
+            self.file_source = SnapshotFileSource(
+                config.data_dir / config.current_file,
+                max_age=config.snapshot_max_age
+            )
+        
+        self.cache = StandingsCache(
+            fresh_ttl=config.cache_fresh_ttl,
+            stale_ttl=config.cache_stale_ttl,
+            path=config.data_dir / "bot_cache.json"
+        )
+        
+        # auto01's history. The bot only adds its own scrapes (source "bot",
+        # which auto01 ignores) when record_history says it is the only scraper
+        self.record_history = config.record_history and not self.file_source
+        self.history = SnapshotStore(
+            config.data_dir / config.history_db,
+            sources=SnapshotStore.MONITOR_SOURCES + (("bot",) if self.record_history else ())
+        )
+        self.diff_cache = StandingsDiffCache()
+        self._last_fingerprint = self.history.latest_fingerprint()
+        
+        # One scrape at a time, off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrape")
+        self._inflight: Optional[asyncio.Future] = None
+        
+        self.chrome_profile = ChromeProfile.from_config(config, name="auto02")
+        self.driver_pool = ChromeDriverPool.from_config(self._new_driver, config.driver_pool)
+        
+        self.engine = StandingsScrapeEngine(
+            config,
+            chrome_scrape=self._scrape_chrome,
+            stats=ScrapePathStats(config.data_dir / "scrape_paths_bot.json")
+        )
+    
+    def peek(self) -> Optional[StandingsSnapshot]:
+        """The snapshot get_snapshot_async() would return without waiting, if any"""
+        if self.file_source:
+            snapshot = self.file_source.current()
+            if snapshot:
+                return snapshot
+        snapshot, state = self.cache.lookup()
+        return snapshot if state != StandingsCache.MISS else None
+    
+    def get_standings(self, force_refresh: bool = False) -> Standings:
+        """Get standings with caching (blocking; stale data counts as a miss)"""
+        snapshot = self.get_snapshot(force_refresh)
+        return snapshot.standings if snapshot else Standings()
+    
+    async def get_standings_async(self, force_refresh: bool = False) -> Standings:
+        """Awaitable get_standings (see get_snapshot_async)"""
+        snapshot = await self.get_snapshot_async(force_refresh)
+        return snapshot.standings if snapshot else Standings()
+    
+    def get_snapshot(self, force_refresh: bool = False) -> Optional[StandingsSnapshot]:
+        """Blocking snapshot lookup; stale data counts as a miss"""
+        from_files = self._from_files()
+        if from_files:
+            return from_files
+        
+        snapshot, state = self.cache.lookup()
+        if force_refresh and state == StandingsCache.FRESH:
+            state = StandingsCache.MISS
+        
+        if state == StandingsCache.FRESH:
+            self.cache.record(state)
+            self.logger.info(f"Using cache (age: {snapshot.age:.0f}s)")
+            return snapshot
+        
+        self.cache.record(StandingsCache.MISS)
+        return self._fetch()
+    
+    async def get_snapshot_async(self, force_refresh: bool = False) -> Optional[StandingsSnapshot]:
+        """
+        Scrapes run in a worker thread, concurrent cache misses share one
+        in-flight scrape, and stale data is returned immediately while it
+        is refreshed in the background
+        """
+        from_files = self._from_files()
+        if from_files:
+            return from_files
+        
+        snapshot, state = self.cache.lookup()
+        if force_refresh:
+            state = StandingsCache.MISS
+        self.cache.record(state)
+        
+        if state == StandingsCache.FRESH:
+            self.logger.info(f"Using cache (age: {snapshot.age:.0f}s)")
+            return snapshot
+        
+        refresh = self._start_fetch()
+        if state == StandingsCache.STALE:
+            self.logger.info(f"Serving stale cache (age: {snapshot.age:.0f}s), refreshing")
+            return snapshot
+        
+        # shield: a cancelled handler must not cancel the shared scrape
+        return await asyncio.shield(refresh)
+    
+    def _from_files(self) -> Optional[StandingsSnapshot]:
+        """Snapshot from auto01's data files, if that source is enabled and current"""
+        if not self.file_source:
+            return None
+        snapshot = self.file_source.current()
+        if snapshot is None:
+            self.logger.info("No current snapshot file, falling back to live scrape")
+            return None
+        self.cache.record(StandingsCache.FRESH)
+        return snapshot
+    
+    def _start_fetch(self) -> asyncio.Future:
+        """Start a background scrape unless one is already running"""
+        if self._inflight is None:
+            loop = asyncio.get_running_loop()
+            self._inflight = loop.run_in_executor(self._executor, self._fetch)
+            self._inflight.add_done_callback(self._clear_inflight)
+        else:
+            self.logger.info("Joining in-flight scrape")
+        return self._inflight
+    
+    def _clear_inflight(self, future: asyncio.Future):
+        if self._inflight is future:
+            self._inflight = None
+    
+    def _fetch(self) -> Optional[StandingsSnapshot]:
+        """Scrape and cache; fall back to the last snapshot if scraping fails"""
         self.logger.info("Scraping fresh data...")
         standings = self._scrape()
         
+        if standings is None and self.cache.snapshot:
+            # 304 Not Modified: the cached table is still current
+            standings = self.cache.snapshot.standings
+        
         if standings:
-            self.cache = standings
-            self.cache_time = datetime.now()
+            snapshot = self.cache.store(standings)
+            self._record_history(standings)
+            return snapshot
         
-        return standings
+        snapshot = self.cache.snapshot
+        if snapshot:
+            self.logger.warning(
+                f"Scrape failed, serving last snapshot (age: {snapshot.age:.0f}s)"
+            )
+        return snapshot
     
-    def _scrape(self) -> List[Dict]:
-        """Scrape standings"""
-        driver = None
+    def _record_history(self, standings: Standings):
+        """Append a scrape to the history store when it differs from the last one"""
+        if not self.record_history:
+            return
+        fingerprint = snapshot_fingerprint(standings)
+        if fingerprint == self._last_fingerprint:
+            return
         try:
-            # Setup Chrome
-            options = uc.ChromeOptions()
-            if self.config.headless:
-                options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--window-size=1920,1080')
-            
-            driver = uc.Chrome(
-                version_main=self.config.chrome_version,
-                options=options
-            )
-            driver.set_page_load_timeout(30)
-            
-            # Load page
-            driver.get(self.config.motogp_url)
-            
-            # Wait for table
-            wait = WebDriverWait(driver, 20)
-            wait.until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "table.ms-table--standings")
-                )
-            )
+            self.history.append(standings, source="bot")
+            self._last_fingerprint = fingerprint
+        except Exception as e:
+            self.logger.warning(f"Could not append to history: {e}")
+    
+    def latest_pair(self):
+        """(older, newer) as (id, taken_at) for the two newest stored snapshots, or None"""
+        return self.history.latest_pair()
+    
+    def delta(self, older_id: int, newer_id: int):
+        """Diff between two stored snapshots; their rows are read only on a cache miss"""
+        return self.diff_cache.get_by_ids(
+            older_id, newer_id,
+            lambda: (self.history.get(older_id).standings, self.history.get(newer_id).standings),
+        )
+    
+    def _scrape(self) -> Optional[Standings]:
+        """Scrape standings (HTTP fast path, Chrome fallback); None if unchanged"""
+        return self.engine.scrape(conditional=self.cache.snapshot is not None)
+    
+    def _new_driver(self):
+        """Start a Chrome instance for the driver pool"""
+        driver = start_chrome(self.chrome_profile)
+        driver.set_page_load_timeout(30)
+        return driver
+    
+    def _scrape_chrome(self) -> List[Dict]:
+        """Scrape standings with a pooled Chrome driver"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        try:
+            with self.driver_pool.lease() as driver:
+                # Load page
+                with METRICS.timer("page_load", path="chrome"):
+                    driver.get(self.config.motogp_url)
+                
+                # Wait for table
+                with METRICS.timer("readiness_wait"):
+                    wait = WebDriverWait(driver, 20)
+                    wait.until(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, "table.ms-table--standings")
+                        )
+                    )
+                
+                # Parse data
+                standings = read_standings_table(driver, self.config.extraction_mode)
+                transfer = page_transfer_stats(driver)
             
-            # Parse data
-            standings = []
-            rows = driver.find_elements(
-                By.CSS_SELECTOR,
-                "table.ms-table--standings tbody tr"
+            self.logger.info(
+                f"Scraped {len(standings)} riders"
+                + (f" ({transfer['bytes'] / 1024:.0f}KB transferred)" if transfer else "")
             )
-            
-            for row in rows:
-                try:
-                    pos_elem = row.find_element(By.CSS_SELECTOR, "td.ms-table_field--pos")
-                    name_elem = row.find_element(By.CSS_SELECTOR, "td.ms-table_field--driver span.name-short")
-                    team_elem = row.find_element(By.CSS_SELECTOR, "td.ms-table_field--driver span.team")
-                    points_elem = row.find_element(By.CSS_SELECTOR, "td.ms-table_field--total_points")
-                    
-                    position = int(pos_elem.text.strip())
-                    rider = name_elem.text.strip()
-                    team = team_elem.text.strip()
-                    points = int(points_elem.text.strip())
-                    
-                    standings.append({
-                        "position": position,
-                        "rider": rider,
-                        "team": team,
-                        "points": points
-                    })
-                except Exception as e:
-                    self.logger.debug(f"Row parse error: {e}")
-                    continue
-            
-            self.logger.info(f"Scraped {len(standings)} riders")
             return standings
             
         except Exception as e:
             self.logger.error(f"Scraping error: {e}")
             return []
-        finally:
-            if driver:
-                driver.quit()
+    
+    def close(self):
+        """Stop the scrape worker, quit pooled Chrome drivers, close the history store"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.driver_pool.close()
+        self.history.close()
+
+# ==================== RESPONSES ====================
+class ResponseCache:
+    """Rendered command replies, keyed by command and snapshot version"""
+    
+    def __init__(self):
+        self._entries: Dict[str, tuple] = {}
+        self.renders = 0
+    
+    def get(self, command: str, snapshot: StandingsSnapshot, render) -> str:
+        return self.get_version(command, snapshot.version, lambda: render(snapshot))
+    
+    def get_version(self, command: str, version, render) -> str:
+        """Reply for a version other than the live snapshot's (e.g. a snapshot id pair)"""
+        cached = self._entries.get(command)
+        if cached and cached[0] == version:
+            return cached[1]
+        
+        text = render()
+        self._entries[command] = (version, text)
+        self.renders += 1
+        return text
+
+# ==================== STATISTICS ====================
+_RANK_WEIGHTS = [2.0 ** -r for r in range(65)]
+
+
+def _hash64(item) -> int:
+    return int.from_bytes(hashlib.blake2b(str(item).encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    Approximate distinct count in 2**precision one-byte registers
+    (precision 14: 16KB, ~0.8% standard error) however many ids are added.
+    """
+    
+    __slots__ = ("precision", "registers")
+    
+    def __init__(self, precision: int = 14, registers: Optional[bytes] = None):
+        self.precision = precision
+        self.registers = bytearray(registers) if registers else bytearray(1 << precision)
+    
+    def add_hash(self, h: int):
+        """Add a 64-bit hash (see _hash64); one hash can feed several sketches"""
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def add(self, item):
+        self.add_hash(_hash64(item))
+    
+    def count(self) -> int:
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / sum(_RANK_WEIGHTS[r] for r in self.registers)
+        if estimate <= 2.5 * m:
+            zeros = self.registers.count(0)
+            if zeros:
+                estimate = m * math.log(m / zeros)  # linear counting for small sets
+        return int(round(estimate))
+    
+    def to_text(self) -> str:
+        return base64.b64encode(zlib.compress(bytes(self.registers))).decode("ascii")
+    
+    @classmethod
+    def from_text(cls, precision: int, text: str) -> "HyperLogLog":
+        registers = zlib.decompress(base64.b64decode(text))
+        if len(registers) != 1 << precision:
+            raise ValueError("register count does not match precision")
+        return cls(precision, registers)
+
+
+class StatsBucket:
+    """Exact command counters and approximate unique users for one period"""
+    
+    __slots__ = ("total", "commands", "users")
+    
+    def __init__(self, precision: int):
+        self.total = 0
+        self.commands: Dict[str, int] = {}
+        self.users = HyperLogLog(precision)
+    
+    def add(self, command: str, user_hash: int):
+        self.total += 1
+        self.commands[command] = self.commands.get(command, 0) + 1
+        self.users.add_hash(user_hash)
+    
+    def to_dict(self) -> Dict:
+        return {"total": self.total, "commands": self.commands, "users": self.users.to_text()}
+    
+    @classmethod
+    def from_dict(cls, precision: int, data: Dict) -> "StatsBucket":
+        bucket = cls(precision)
+        bucket.total = int(data["total"])
+        bucket.commands = {str(k): int(v) for k, v in data["commands"].items()}
+        bucket.users = HyperLogLog.from_text(precision, data["users"])
+        return bucket
+
+
+class BotStats:
+    """
+    Bounded-memory command statistics.
+    
+    Counts are exact per command; unique users are HyperLogLog estimates,
+    all time (16KB), per day (4KB) and per hour (1KB). Only hours_kept
+    hours and days_kept days are retained, so memory is fixed no matter
+    how many users the bot sees. flush_loop() persists the lot to
+    data_dir so statistics survive restarts.
+    """
+    
+    TOTAL_PRECISION, DAY_PRECISION, HOUR_PRECISION = 14, 12, 10
+    
+    def __init__(self, path: Optional[Path] = None, hours_kept: int = 48, days_kept: int = 30):
+        self.path = path
+        self.hours_kept = hours_kept
+        self.days_kept = days_kept
+        self.logger = logging.getLogger(__name__)
+        self.start_time = datetime.now()
+        
+        self.since = self.start_time.isoformat(timespec="seconds")
+        self.total = StatsBucket(self.TOTAL_PRECISION)
+        self.hours: "OrderedDict[str, StatsBucket]" = OrderedDict()
+        self.days: "OrderedDict[str, StatsBucket]" = OrderedDict()
+        self.ranking: List[str] = []  # commands by total count, kept sorted on record()
+        self.dirty = False
+        self._load()
+        
+        self._hour_start = self._hour_end = 0.0  # current local hour, epoch seconds
+        self._hour: Optional[StatsBucket] = None
+        self._day: Optional[StatsBucket] = None
+    
+    def record(self, command: str, user_id: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        if not self._hour_start <= now < self._hour_end:
+            self._roll(now)
+        
+        user_hash = _hash64(user_id)
+        self.total.add(command, user_hash)
+        self._hour.add(command, user_hash)
+        self._day.add(command, user_hash)
+        self.dirty = True
+        
+        # One bubble step keeps the ranking sorted: counts only grow by one
+        counts = self.total.commands
+        if counts[command] == 1:
+            self.ranking.append(command)
+        i = self.ranking.index(command)
+        while i > 0 and counts[self.ranking[i - 1]] < counts[command]:
+            self.ranking[i - 1], self.ranking[i] = self.ranking[i], self.ranking[i - 1]
+            i -= 1
+    
+    def _roll(self, now: float):
+        # Hour boundaries come from the local clock, like the bucket keys, so
+        # half-hour offsets and local midnight roll over where the labels do
+        local = time.localtime(now)
+        self._hour_start = now - (local.tm_min * 60 + local.tm_sec + now % 1)
+        self._hour_end = self._hour_start + 3600
+        self._hour = self._bucket(self.hours, time.strftime("%Y-%m-%d %H:00", local),
+                                  self.HOUR_PRECISION, self.hours_kept)
+        self._day = self._bucket(self.days, time.strftime("%Y-%m-%d", local),
+                                 self.DAY_PRECISION, self.days_kept)
+    
+    @staticmethod
+    def _bucket(buckets: "OrderedDict[str, StatsBucket]", key: str,
+                precision: int, kept: int) -> StatsBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = StatsBucket(precision)
+            while len(buckets) > kept:
+                buckets.popitem(last=False)
+        return bucket
+    
+    def current(self, now: Optional[float] = None) -> tuple[StatsBucket, StatsBucket]:
+        """(this hour, today), empty buckets if nothing was recorded yet"""
+        now = time.time() if now is None else now
+        if not self._hour_start <= now < self._hour_end:
+            self._roll(now)
+        return self._hour, self._day
+    
+    # ---------- persistence ----------
+    def to_dict(self) -> Dict:
+        return {
+            "version": 1,
+            "since": self.since,
+            "total": self.total.to_dict(),
+            "hours": {k: b.to_dict() for k, b in self.hours.items()},
+            "days": {k: b.to_dict() for k, b in self.days.items()},
+        }
+    
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            total = StatsBucket.from_dict(self.TOTAL_PRECISION, data["total"])
+            hours = OrderedDict(
+                (k, StatsBucket.from_dict(self.HOUR_PRECISION, b))
+                for k, b in sorted(data["hours"].items())[-self.hours_kept:]
+            )
+            days = OrderedDict(
+                (k, StatsBucket.from_dict(self.DAY_PRECISION, b))
+                for k, b in sorted(data["days"].items())[-self.days_kept:]
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable bot stats: {e}")
+            return
+        
+        self.since = data.get("since", self.since)
+        self.total, self.hours, self.days = total, hours, days
+        self.ranking = sorted(total.commands, key=total.commands.get, reverse=True)
+        self.logger.info(f"Bot stats restored: {total.total} commands since {self.since}")
+    
+    def _write(self, data: Dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+    
+    def save(self):
+        """Blocking flush (shutdown)"""
+        if self.path and self.dirty:
+            self.dirty = False
+            try:
+                self._write(self.to_dict())
+            except OSError as e:
+                self.logger.warning(f"Could not save bot stats: {e}")
+    
+    async def flush_loop(self, interval: float):
+        """Persist every `interval` seconds while something changed, until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            if not (self.path and self.dirty):
+                continue
+            # Serialised on the loop so the snapshot is consistent, written off it
+            self.dirty = False
+            data = self.to_dict()
+            try:
+                await asyncio.to_thread(self._write, data)
+            except OSError as e:
+                self.dirty = True
+                self.logger.warning(f"Could not save bot stats: {e}")
 
 # ==================== BOT HANDLERS ====================
 class MotoGPBot:
@@ -267,33 +1145,40 @@ class MotoGPBot:
         self.scraper = SecureScraper(config)
         self.rate_limiter = CommandRateLimiter(
             max_calls=config.rate_limit_max_calls,
-            window=config.rate_limit_window
+            window=config.rate_limit_window,
+            max_users=config.rate_limit_max_users
         )
         self.access_control = AccessControl(
             config.allowed_chat_ids,
             config.admin_chat_ids
         )
         self.logger = logging.getLogger(__name__)
+        self.responses = ResponseCache()
         
         # Statistics
-        self.stats = {
-            "commands_total": 0,
-            "commands_by_type": defaultdict(int),
-            "users": set(),
-            "start_time": datetime.now()
-        }
+        self.stats = BotStats(
+            config.data_dir / config.stats_file,
+            hours_kept=config.stats_hours_kept,
+            days_kept=config.stats_days_kept
+        )
+        METRICS.gauge("bot_users", lambda: self.stats.total.users.count())
+        METRICS.gauge("rate_limited_users", lambda: len(self.rate_limiter))
+        METRICS.gauge(
+            "snapshot_age_seconds",
+            lambda: getattr(self.scraper.peek(), "age", None)
+        )
     
-    def _check_access(self, update: Update) -> bool:
+    async def _check_access(self, update: Update) -> bool:
         """Check user access"""
         user_id = update.effective_user.id
         
         if not self.access_control.is_allowed(user_id):
-            update.message.reply_text("❌ Access denied")
+            await update.message.reply_text("❌ Access denied")
             return False
         
         allowed, wait_time = self.rate_limiter.is_allowed(user_id)
         if not allowed:
-            update.message.reply_text(
+            await update.message.reply_text(
                 f"⏱️ Rate limit exceeded. Try again in {wait_time}s"
             )
             return False
@@ -303,9 +1188,8 @@ class MotoGPBot:
     def _log_command(self, update: Update, command: str):
         """Log command usage"""
         user = update.effective_user
-        self.stats["commands_total"] += 1
-        self.stats["commands_by_type"][command] += 1
-        self.stats["users"].add(user.id)
+        self.stats.record(command, user.id)
+        METRICS.inc("commands", command=command)
         
         self.logger.info(
             f"Command: /{command} | User: {user.id} ({user.first_name})"
@@ -313,7 +1197,7 @@ class MotoGPBot:
     
     async def cmd_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "start")
@@ -326,7 +1210,8 @@ class MotoGPBot:
             "/top10 - Top 10 klasemen\n"
             "/team - Klasemen per tim\n"
             "/delta - Deteksi perubahan\n"
-            "/best - Best performers\n\n"
+            "/best - Best performers\n"
+            "/rider - Cari pembalap\n\n"
             "🔒 Secure & Fast | Data from motorsport.com"
         )
         
@@ -334,7 +1219,7 @@ class MotoGPBot:
     
     async def cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "help")
@@ -349,6 +1234,8 @@ class MotoGPBot:
             "   Deteksi perubahan posisi\n\n"
             "⭐ <b>/best</b>\n"
             "   Top 3 pembalap terbaik\n\n"
+            "🔎 <b>/rider nama</b>\n"
+            "   Posisi & poin satu pembalap (nama lengkap, singkat, atau typo)\n\n"
             "📈 <b>/stats</b>\n"
             "   Statistik bot\n\n"
             "ℹ️ Data di-cache 5 menit untuk performa optimal"
@@ -356,169 +1243,308 @@ class MotoGPBot:
         
         await update.message.reply_text(message, parse_mode="HTML")
     
-    async def cmd_top10(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /top10 command"""
-        if not self._check_access(update):
-            return
-        
-        self._log_command(update, "top10")
+    async def _reply_standings(self, update: Update, command: str, loading_text: str, render,
+                               cached: bool = True, stamped: bool = False):
+        """
+        Reply with a rendered standings view. Views are rendered once per
+        snapshot version (per call if not `cached`, for views that depend
+        on arguments); when data is already cached the reply is a single
+        API call with no loading placeholder. `stamped` views end with the
+        snapshot's Updated time, added per reply since a revalidated
+        snapshot keeps its version but not its fetch time.
+        """
+        loading_msg = None
+        if self.scraper.peek() is None:
+            loading_msg = await update.message.reply_text(loading_text)
         
-        # Send "loading" message
-        loading_msg = await update.message.reply_text("⏳ Fetching data...")
+        async def send(text: str, **kwargs):
+            if loading_msg:
+                await loading_msg.edit_text(text, **kwargs)
+            else:
+                await update.message.reply_text(text, **kwargs)
         
         try:
-            standings = self.scraper.get_standings()
+            snapshot = await self.scraper.get_snapshot_async()
             
-            if not standings:
-                await loading_msg.edit_text("❌ Failed to fetch data")
+            if not snapshot or not snapshot.standings:
+                await send("❌ Failed to fetch data")
                 return
             
-            message = "🏆 <b>TOP 10 MotoGP 2025</b>\n\n"
-            
-            for i, rider in enumerate(standings[:10], 1):
-                medal = ""
-                if i == 1:
-                    medal = "🥇 "
-                elif i == 2:
-                    medal = "🥈 "
-                elif i == 3:
-                    medal = "🥉 "
-                
-                message += (
-                    f"{medal}<b>{i}. {rider['rider']}</b>\n"
-                    f"   📊 {rider['points']} pts | {rider['team']}\n\n"
+            with METRICS.timer("render", command=command):
+                message = (
+                    self.responses.get(command, snapshot, render) if cached else render(snapshot)
                 )
+                if stamped:
+                    message += self._updated_line(snapshot)
             
-            message += f"📅 Updated: {datetime.now().strftime('%H:%M:%S')}"
-            
-            await loading_msg.edit_text(message, parse_mode="HTML")
+            with METRICS.timer("telegram_send", command=command):
+                await send(message, parse_mode="HTML")
             
         except Exception as e:
-            self.logger.error(f"Error in /top10: {e}")
-            await loading_msg.edit_text("❌ Error occurred")
+            self.logger.error(f"Error in /{command}: {e}")
+            await send("❌ Error occurred")
+    
+    @staticmethod
+    def _render_top10(snapshot: StandingsSnapshot) -> str:
+        medals = {1: "🥇 ", 2: "🥈 ", 3: "🥉 "}
+        parts = ["🏆 <b>TOP 10 MotoGP 2025</b>\n\n"]
+        for i, rider in enumerate(snapshot.standings[:10], 1):
+            parts.append(
+                f"{medals.get(i, '')}<b>{i}. {rider.rider}</b>\n"
+                f"   📊 {rider.points} pts | {rider.team}\n\n"
+            )
+        return "".join(parts)
+    
+    @staticmethod
+    def _updated_line(snapshot: StandingsSnapshot) -> str:
+        updated = datetime.fromtimestamp(snapshot.fetched_at).strftime('%H:%M:%S')
+        return f"📅 Updated: {updated}"
+    
+    @staticmethod
+    def _render_team(snapshot: StandingsSnapshot) -> str:
+        parts = ["🏁 <b>TEAM RANKINGS</b>\n\n"]
+        for i, (team, points) in enumerate(snapshot.team_ranking[:10], 1):
+            riders = snapshot.team_riders[team]
+            rider_names = ", ".join([r.rider for r in riders[:2]])
+            parts.append(
+                f"<b>{i}. {team}</b>\n"
+                f"   📊 {points} pts | {len(riders)} riders\n"
+                f"   👥 {rider_names}\n\n"
+            )
+        return "".join(parts)
+    
+    @staticmethod
+    def _render_best(snapshot: StandingsSnapshot) -> str:
+        parts = ["⭐ <b>BEST PERFORMERS</b>\n\n"]
+        for medal, rider in zip(["🥇", "🥈", "🥉"], snapshot.standings[:3]):
+            parts.append(
+                f"{medal} <b>{rider.rider}</b>\n"
+                f"   Position: #{rider.position}\n"
+                f"   Points: {rider.points}\n"
+                f"   Team: {rider.team}\n\n"
+            )
+        return "".join(parts)
+    
+    async def cmd_top10(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /top10 command"""
+        if not await self._check_access(update):
+            return
+        
+        self._log_command(update, "top10")
+        await self._reply_standings(
+            update, "top10", "⏳ Fetching data...", self._render_top10, stamped=True
+        )
     
     async def cmd_team(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /team command"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "team")
+        await self._reply_standings(
+            update, "team", "⏳ Calculating team rankings...", self._render_team
+        )
+    
+    def _delta_reply(self) -> Optional[str]:
+        """
+        Rendered /delta for the two newest stored snapshots, or None. Only
+        their ids are read up front; rows are loaded, diffed and rendered
+        once per new pair.
+        """
+        pair = self.scraper.latest_pair()
+        if pair is None:
+            return None
+        (older_id, older_at), (newer_id, newer_at) = pair
+        return self.responses.get_version(
+            "delta", (older_id, newer_id),
+            lambda: self._render_delta(older_at, newer_at, self.scraper.delta(older_id, newer_id)),
+        )
+    
+    @staticmethod
+    def _render_delta(older_at: float, newer_at: float, diff) -> str:
+        since = datetime.fromtimestamp(older_at).strftime('%d %b %H:%M')
+        until = datetime.fromtimestamp(newer_at).strftime('%d %b %H:%M')
         
-        loading_msg = await update.message.reply_text("⏳ Calculating team rankings...")
+        message = (
+            "📊 <b>POSITION CHANGES</b>\n"
+            f"🕐 {since} → {until}\n\n"
+            f"🔺 Naik: {diff.up} | 🔻 Turun: {diff.down} | ➖ Tetap: {diff.unchanged}\n\n"
+        )
         
-        try:
-            standings = self.scraper.get_standings()
-            
-            if not standings:
-                await loading_msg.edit_text("❌ Failed to fetch data")
-                return
-            
-            # Calculate team points
-            team_points = defaultdict(int)
-            team_riders = defaultdict(list)
-            
-            for rider in standings:
-                team = rider['team']
-                team_points[team] += rider['points']
-                team_riders[team].append(rider)
+        changed = diff.changed
+        if not changed:
+            message += "✅ Tidak ada perubahan"
+        
+        for d in changed[:15]:
+            if d.is_new:
+                message += f"🆕 <b>{html.escape(d.rider)}</b>: #{d.position} | {d.points} pts\n"
+                continue
             
-            # Sort teams by points
-            sorted_teams = sorted(
-                team_points.items(),
-                key=lambda x: x[1],
-                reverse=True
+            icon = "🔺" if d.position_change > 0 else "🔻" if d.position_change < 0 else "➖"
+            moved = (
+                f"#{d.prev_position} → #{d.position}"
+                if d.position_change else f"#{d.position}"
             )
-            
-            message = "🏁 <b>TEAM RANKINGS</b>\n\n"
-            
-            for i, (team, points) in enumerate(sorted_teams[:10], 1):
-                riders = team_riders[team]
-                rider_names = ", ".join([r['rider'] for r in riders[:2]])
-                
-                message += (
-                    f"<b>{i}. {team}</b>\n"
-                    f"   📊 {points} pts | {len(riders)} riders\n"
-                    f"   👥 {rider_names}\n\n"
-                )
-            
-            await loading_msg.edit_text(message, parse_mode="HTML")
-            
-        except Exception as e:
-            self.logger.error(f"Error in /team: {e}")
-            await loading_msg.edit_text("❌ Error occurred")
+            message += f"{icon} <b>{html.escape(d.rider)}</b>: {moved} | {d.points_change:+d} pts\n"
+        
+        if len(changed) > 15:
+            message += f"\n… and {len(changed) - 15} more"
+        return message
     
     async def cmd_delta(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /delta command - show position changes"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "delta")
         
-        await update.message.reply_text(
-            "📊 Delta detector requires previous data.\n"
-            "This feature tracks position changes over time.\n\n"
-            "Run the monitoring bot (auto01_secure.py) first!"
-        )
+        try:
+            loop = asyncio.get_running_loop()
+            message = await loop.run_in_executor(None, self._delta_reply)
+            
+            if message is None:
+                await update.message.reply_text(
+                    "📊 Delta detector requires previous data.\n"
+                    "This feature tracks position changes over time.\n\n"
+                    "Run the monitoring bot (auto01_secure.py) first!"
+                )
+                return
+            
+            await update.message.reply_text(message, parse_mode="HTML")
+            
+        except Exception as e:
+            self.logger.error(f"Error in /delta: {e}")
+            await update.message.reply_text("❌ Error occurred")
     
     async def cmd_best(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /best command"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "best")
+        await self._reply_standings(update, "best", "⏳ Analyzing...", self._render_best)
+    
+    @staticmethod
+    def _render_rider_card(snapshot: StandingsSnapshot, rider: RiderStanding) -> str:
+        standings = snapshot.standings
+        lines = [
+            f"🏍️ <b>#{rider.position} {html.escape(rider.rider)}</b>\n",
+            f"   📊 {rider.points} pts | {html.escape(rider.team)}\n",
+        ]
+        i = rider.position - 1  # row index, unless positions have gaps
+        if not (0 <= i < len(standings) and standings[i] is rider):
+            i = next(n for n, r in enumerate(standings) if r is rider)
+        if i > 0:
+            leader, ahead = standings[0], standings[i - 1]
+            lines.append(f"   ⬆️ {ahead.points - rider.points} pts to #{ahead.position} {html.escape(ahead.rider)}\n")
+            lines.append(f"   🏆 {leader.points - rider.points} pts behind the leader\n")
+        return "".join(lines)
+    
+    @staticmethod
+    def _render_rider(snapshot: StandingsSnapshot, query: str) -> str:
+        matches = snapshot.search(query, limit=6)
+        if not matches:
+            return f"❌ No rider matching <b>{html.escape(query)}</b>"
+        
+        parts = [MotoGPBot._render_rider_card(snapshot, matches[0])]
+        if len(matches) > 1:
+            parts.append("\n<b>Also matching:</b>\n")
+            parts.extend(
+                f"#{r.position} {html.escape(r.rider)} | {r.points} pts\n" for r in matches[1:]
+            )
+        parts.append("\n" + MotoGPBot._updated_line(snapshot))
+        return "".join(parts)
+    
+    async def cmd_rider(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /rider <name> command"""
+        if not await self._check_access(update):
+            return
         
-        loading_msg = await update.message.reply_text("⏳ Analyzing...")
+        self._log_command(update, "rider")
         
+        query = " ".join(context.args or [])[:64]
+        if not query.strip():
+            await update.message.reply_text(
+                "🔎 Usage: <b>/rider name</b>\n"
+                "Contoh: /rider marquez, /rider Marc Márquez, /rider bagn",
+                parse_mode="HTML"
+            )
+            return
+        
+        await self._reply_standings(
+            update, "rider", "⏳ Searching...",
+            lambda snapshot: self._render_rider(snapshot, query),
+            cached=False
+        )
+    
+    async def inline_rider(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle inline queries (@bot name): rider cards, or the top 10 for an empty query"""
+        inline = update.inline_query
+        if not self.access_control.is_allowed(inline.from_user.id):
+            await inline.answer([], cache_time=300, is_personal=True)
+            return
+        
+        # Not rate limited or added to /stats: clients send one query per keystroke
+        METRICS.inc("inline_queries")
         try:
-            standings = self.scraper.get_standings()
-            
-            if not standings:
-                await loading_msg.edit_text("❌ Failed to fetch data")
+            snapshot = await self.scraper.get_snapshot_async()
+            if not snapshot or not snapshot.standings:
+                await inline.answer([], cache_time=5)
                 return
             
-            message = "⭐ <b>BEST PERFORMERS</b>\n\n"
+            query = inline.query.strip()[:64]
+            with METRICS.timer("render", command="inline"):
+                riders = snapshot.search(query, limit=10) if query else snapshot.standings[:10]
+                results = [
+                    InlineQueryResultArticle(
+                        id=f"{snapshot.version[:16]}-{rider.position}",
+                        title=f"#{rider.position} {rider.rider}",
+                        description=f"{rider.points} pts | {rider.team}",
+                        input_message_content=InputTextMessageContent(
+                            self._render_rider_card(snapshot, rider), parse_mode="HTML"
+                        ),
+                    )
+                    for rider in riders
+                ]
             
-            for i, rider in enumerate(standings[:3], 1):
-                medal = ["🥇", "🥈", "🥉"][i-1]
-                
-                message += (
-                    f"{medal} <b>{rider['rider']}</b>\n"
-                    f"   Position: #{rider['position']}\n"
-                    f"   Points: {rider['points']}\n"
-                    f"   Team: {rider['team']}\n\n"
-                )
-            
-            await loading_msg.edit_text(message, parse_mode="HTML")
+            with METRICS.timer("telegram_send", command="inline"):
+                await inline.answer(results, cache_time=60)
             
         except Exception as e:
-            self.logger.error(f"Error in /best: {e}")
-            await loading_msg.edit_text("❌ Error occurred")
+            self.logger.error(f"Error in inline query: {e}")
     
     async def cmd_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stats command"""
-        if not self._check_access(update):
+        if not await self._check_access(update):
             return
         
         self._log_command(update, "stats")
         
-        uptime = datetime.now() - self.stats["start_time"]
+        stats = self.stats
+        uptime = datetime.now() - stats.start_time
         hours = int(uptime.total_seconds() / 3600)
         minutes = int((uptime.total_seconds() % 3600) / 60)
+        cache = self.scraper.cache.counters
+        hour, today = stats.current()
         
         message = (
             "📈 <b>BOT STATISTICS</b>\n\n"
             f"⏰ Uptime: {hours}h {minutes}m\n"
-            f"📊 Commands: {self.stats['commands_total']}\n"
-            f"👥 Users: {len(self.stats['users'])}\n\n"
+            f"📊 Commands: {stats.total.total} (today {today.total}, last hour {hour.total})\n"
+            f"👥 Users: ~{stats.total.users.count()} "
+            f"(today ~{today.users.count()}, last hour ~{hour.users.count()})\n"
+            f"🗓️ Since: {stats.since}\n"
+            f"💾 Cache: {cache[StandingsCache.FRESH]} hit | "
+            f"{cache[StandingsCache.STALE]} stale | {cache[StandingsCache.MISS]} miss\n\n"
             "<b>Command Usage:</b>\n"
         )
         
-        for cmd, count in sorted(
-            self.stats["commands_by_type"].items(),
-            key=lambda x: x[1],
-            reverse=True
-        ):
-            message += f"/{cmd}: {count}\n"
+        for cmd in stats.ranking:
+            message += f"/{cmd}: {stats.total.commands[cmd]}\n"
+        
+        phases = METRICS.summary_lines()
+        if phases:
+            message += "\n<b>Phases:</b>\n" + "\n".join(phases) + "\n"
         
         await update.message.reply_text(message, parse_mode="HTML")
 
@@ -533,66 +1559,201 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "❌ An error occurred. Please try again later."
         )
 
+# ==================== WEBHOOK ====================
+async def serve_webhook(app: Application, config: BotConfig,
+                        stop: Optional[asyncio.Event] = None):
+    """
+    Serve updates pushed by Telegram instead of long-polling for them.
+    
+    The HTTP handler only checks the secret token and queues the update;
+    the application processes queued updates concurrently. On SIGINT/SIGTERM
+    (or when `stop` is set) the listener closes first, then every queued
+    and in-flight update is finished before the application shuts down.
+    """
+    try:
+        from aiohttp import web
+    except ImportError:  # optional: only needed for bot.mode = "webhook"
+        raise RuntimeError("bot.mode 'webhook' needs aiohttp: pip install aiohttp")
+    
+    logger = logging.getLogger(__name__)
+    secret = config.webhook_secret or secrets.token_urlsafe(32)
+    expected = secret.encode("utf-8")
+    
+    async def receive(request: "web.Request") -> "web.Response":
+        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "").encode("utf-8")
+        if not hmac.compare_digest(token, expected):
+            logger.warning(f"Webhook call with bad secret token from {request.remote}")
+            return web.Response(status=403)
+        try:
+            update = Update.de_json(await request.json(), app.bot)
+        except (ValueError, TypeError, KeyError):
+            return web.Response(status=400)
+        await app.update_queue.put(update)
+        return web.Response()
+    
+    server = web.Application()
+    server.router.add_post(urlparse(config.webhook_url).path or "/", receive)
+    runner = web.AppRunner(server, handle_signals=False)
+    
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: Ctrl+C cancels the wait below instead
+    
+    await app.initialize()
+    try:
+        if app.post_init:
+            await app.post_init(app)
+        await app.start()
+        await runner.setup()
+        await web.TCPSite(runner, config.webhook_listen, config.webhook_port).start()
+        await app.bot.set_webhook(
+            url=config.webhook_url,
+            secret_token=secret,
+            allowed_updates=Update.ALL_TYPES,
+            max_connections=config.webhook_max_connections,
+        )
+        logger.info(
+            f"Webhook listening on {config.webhook_listen}:{config.webhook_port} "
+            f"for {config.webhook_url}"
+        )
+        try:
+            await stop.wait()
+        except asyncio.CancelledError:
+            pass
+    finally:
+        logger.info("👋 Shutting down gracefully...")
+        await runner.cleanup()
+        if app.running:
+            await app.stop()
+        if app.post_stop:
+            await app.post_stop(app)
+        await app.shutdown()
+        if app.post_shutdown:
+            await app.post_shutdown(app)
+
 # ==================== MAIN ====================
-def main():
-    """Main entry point"""
-    # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+BOT_COMMANDS = [
+    ("start", "Start bot"),
+    ("help", "Show help"),
+    ("top10", "Top 10 standings"),
+    ("team", "Team rankings"),
+    ("delta", "Position changes"),
+    ("best", "Best performers"),
+    ("rider", "Search a rider"),
+    ("stats", "Bot statistics"),
+]
+
+
+def build_application(config: BotConfig, bot: MotoGPBot,
+                      base_url: Optional[str] = None) -> Application:
+    """Application with every handler and lifecycle hook registered"""
+    builder = (
+        Application.builder()
+        .token(config.bot_token)
+        .concurrent_updates(config.concurrent_updates)
     )
+    if base_url:
+        builder = builder.base_url(base_url)
+    app = builder.build()
+    
+    # Register command handlers
+    for command, _ in BOT_COMMANDS:
+        app.add_handler(CommandHandler(command, getattr(bot, f"cmd_{command}")))
+    app.add_handler(InlineQueryHandler(bot.inline_rider))
+    
+    # Register error handler
+    app.add_error_handler(error_handler)
+    
+    # Set bot commands (for UI)
+    async def set_commands(application: Application):
+        try:
+            await application.bot.set_my_commands(
+                [BotCommand(command, description) for command, description in BOT_COMMANDS]
+            )
+        except TelegramError as e:
+            logging.getLogger(__name__).warning(f"Could not set bot commands: {e}")
+    
+    async def post_init(application: Application):
+        # Not awaited: the command menu is cosmetic and polling can start
+        # one Bot API round trip sooner
+        application.bot_data["set_commands"] = asyncio.get_running_loop().create_task(
+            set_commands(application)
+        )
+        
+        # A plain task, not application.create_task(): stop() waits for
+        # those, and the watcher never returns on its own
+        if bot.scraper.file_source:
+            application.bot_data["file_watch"] = asyncio.get_running_loop().create_task(
+                bot.scraper.file_source.watch(config.snapshot_poll_interval)
+            )
+        application.bot_data["stats_flush"] = asyncio.get_running_loop().create_task(
+            bot.stats.flush_loop(config.stats_flush_interval)
+        )
+        
+        application.bot_data["metrics"] = MetricsServer.from_config(config.metrics)
+    
+    async def post_shutdown(application: Application):
+        for name in ("file_watch", "stats_flush"):
+            task = application.bot_data.pop(name, None)
+            if task:
+                task.cancel()
+        pending = application.bot_data.pop("set_commands", None)
+        if pending:
+            pending.cancel()
+        metrics = application.bot_data.pop("metrics", None)
+        if metrics:
+            metrics.close()
+        bot.stats.save()
+        bot.scraper.close()
+    
+    app.post_init = post_init
+    app.post_shutdown = post_shutdown
+    return app
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="MotoGP interactive Telegram bot")
+    parser.add_argument("--config", default="config.json")
+    args = parser.parse_args(argv)
+    
+    # Load config (it also holds the logging settings)
+    try:
+        config = BotConfig(args.config)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Invalid configuration: {e}")
+        return 1
+    
+    # Setup logging: queued, so handlers never wait on disk or console
+    setup_logging(config.logs_dir, config.log_settings, name="auto02", banner=None)
     logger = logging.getLogger(__name__)
     
     try:
-        # Load config
-        logger.info("Loading configuration...")
-        config = BotConfig("config.json")
-        
         # Create bot
         logger.info("Initializing bot...")
         bot = MotoGPBot(config)
-        
-        # Build application
-        app = Application.builder().token(config.bot_token).build()
-        
-        # Register command handlers
-        app.add_handler(CommandHandler("start", bot.cmd_start))
-        app.add_handler(CommandHandler("help", bot.cmd_help))
-        app.add_handler(CommandHandler("top10", bot.cmd_top10))
-        app.add_handler(CommandHandler("team", bot.cmd_team))
-        app.add_handler(CommandHandler("delta", bot.cmd_delta))
-        app.add_handler(CommandHandler("best", bot.cmd_best))
-        app.add_handler(CommandHandler("stats", bot.cmd_stats))
-        
-        # Register error handler
-        app.add_error_handler(error_handler)
-        
-        # Set bot commands (for UI)
-        async def post_init(application: Application):
-            commands = [
-                BotCommand("start", "Start bot"),
-                BotCommand("help", "Show help"),
-                BotCommand("top10", "Top 10 standings"),
-                BotCommand("team", "Team rankings"),
-                BotCommand("delta", "Position changes"),
-                BotCommand("best", "Best performers"),
-                BotCommand("stats", "Bot statistics"),
-            ]
-            await application.bot.set_my_commands(commands)
-        
-        app.post_init = post_init
+        app = build_application(
+            config, bot, base_url=f"{config.telegram_api_base.rstrip('/')}/bot"
+        )
         
         # Start bot
         logger.info("=" * 70)
-        logger.info("🏍️  MotoGP Bot Started Successfully!")
+        logger.info(f"🏍️  MotoGP Bot Started Successfully! ({config.mode})")
         logger.info("=" * 70)
         logger.info("Bot is running... Press Ctrl+C to stop")
         
-        app.run_polling(allowed_updates=Update.ALL_TYPES)
+        # Both modes drain queued and in-flight updates on Ctrl+C/SIGTERM
+        if config.mode == 'webhook':
+            asyncio.run(serve_webhook(app, config))
+        else:
+            app.run_polling(allowed_updates=Update.ALL_TYPES)
         
     except KeyboardInterrupt:
-        logger.info("\n👋 Shutting down gracefully...")
+        pass  # Windows: updates were already drained on the way out
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         return 1
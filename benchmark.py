@@ -0,0 +1,1543 @@
+"""
+BENCHMARK.PY - Offline performance checks for the MotoGP bots
+
+Runs against local fixtures only, never motorsport.com or api.telegram.org.
+
+Usage:
+    python benchmark.py extract --rows 29 --repeat 5
+    python benchmark.py bot-load --scrape-seconds 5 --concurrency 10
+    python benchmark.py diff --rows 5000 --repeat 20
+    python benchmark.py handlers-cpu --repeat 200
+    python benchmark.py memory --rows 29 --repeat 2000
+    python benchmark.py rider-search --repeat 50
+    python benchmark.py rate-limit --users 100000
+    python benchmark.py bot-stats --users 2000000
+    python benchmark.py metrics --users 100000
+    python benchmark.py logging --concurrency 50 --repeat 20
+    python benchmark.py startup --repeat 5
+    python benchmark.py telegram-fanout --chats 100
+    python benchmark.py webhook --concurrency 20 --repeat 10 --rtt 0.05
+    python benchmark.py pipeline --targets 16 --workers 1,2,4,8 --delay 250
+    python benchmark.py scrape --rows 29 --repeat 5
+    python benchmark.py chrome-blocking --rows 29 --repeat 5
+    python benchmark.py parse --rows 29 --repeat 50
+    python benchmark.py get-standings --repeat 20
+    python benchmark.py commands --repeat 50 --rtt 0.05
+    python benchmark.py suite --output before.json
+    python benchmark.py suite --output after.json --compare before.json
+
+Pages come from a local fixture server (generated tables, or a saved
+motorsport.com page via --fixture page.html); Telegram is a local fake
+Bot API. Every scenario prints p50/p95 and throughput; --output keeps the
+numbers as JSON and --compare prints the change against an earlier file.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import itertools
+import json
+import math
+import random
+import argparse
+import logging
+import platform
+import subprocess
+import tempfile
+import threading
+import tracemalloc
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from datetime import datetime
+from types import SimpleNamespace
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+# ==================== FIXTURES ====================
+TEAMS = [
+    "Ducati Team", "Gresini Racing", "Team VR46", "Aprilia Racing Team",
+    "Red Bull KTM Factory Racing", "Yamaha Factory Racing", "Trackhouse Racing Team",
+    "LCR Honda", "Honda HRC Castrol", "Red Bull KTM Tech3", "Prima Pramac Yamaha",
+]
+
+
+def synthetic_standings(rows: int, seed: int = 1) -> List[Dict]:
+    rng = random.Random(seed)
+    points = sorted((rng.randint(0, 600) for _ in range(rows)), reverse=True)
+    return [
+        {
+            "position": i,
+            "rider": f"{chr(65 + i % 26)}. Rider{i}",
+            "team": TEAMS[i % len(TEAMS)],
+            "points": pts,
+        }
+        for i, pts in enumerate(points, 1)
+    ]
+
+
+FIRST_NAMES = [
+    "Marc", "Álex", "Francesco", "Marco", "Pedro", "Fabio", "Jorge", "Enea", "Johann",
+    "Brad", "Maverick", "Aleix", "Joan", "Raúl", "Fermín", "Luca", "Franco", "Miguel",
+    "Jack", "Takaaki", "Ai", "Somkiat", "Augusto", "Celestino", "Dani", "Andrea", "Pol",
+]
+SURNAME_SYLLABLES = [
+    "mar", "quez", "ba", "gna", "ia", "bez", "zec", "chi", "a", "cos", "ta", "quar",
+    "ra", "ro", "tin", "zar", "co", "vi", "ña", "lez", "gar", "cí", "rí", "ol", "ver",
+]
+
+
+def rider_corpus(size: int, seed: int = 4) -> List[Dict]:
+    """
+    A multi-season rider table of `size` distinct names, half abbreviated
+    ("M. Marquez", like the standings page) and half in full, with accents.
+    Returns standings rows plus the full name of each rider.
+    """
+    rng = random.Random(seed)
+    seen, rows = set(), []
+    while len(rows) < size:
+        first = rng.choice(FIRST_NAMES)
+        surname = "".join(rng.choice(SURNAME_SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        if (first, surname) in seen:
+            continue
+        seen.add((first, surname))
+        shown = f"{first[0]}. {surname}" if len(rows) % 2 == 0 else f"{first} {surname}"
+        rows.append({
+            "position": len(rows) + 1, "rider": shown, "team": TEAMS[len(rows) % len(TEAMS)],
+            "points": max(0, 600 - len(rows) // 10), "full_name": f"{first} {surname}",
+        })
+    return rows
+
+
+@lru_cache(maxsize=16)
+def fixture_html(rows: int, assets: int = 0, third_party: str = "") -> bytes:
+    """
+    A page shaped like the motorsport.com standings table. With `assets`,
+    it also pulls that many images plus a web font, a video and scripts
+    from `third_party` (another origin), like the real page's ads/trackers.
+    """
+    body = "".join(
+        "<tr>"
+        f'<td class="ms-table_cell ms-table_field--pos">{r["position"]}</td>'
+        '<td class="ms-table_cell ms-table_field--driver">'
+        f'<span class="name-short">{r["rider"]}</span>'
+        f'<span class="name-full">{r["rider"]}</span>'
+        f'<span class="team">{r["team"]}</span></td>'
+        f'<td class="ms-table_cell ms-table_field--total_points">{r["points"]}</td>'
+        "</tr>"
+        for r in synthetic_standings(rows)
+    )
+    head = extra = ""
+    if assets:
+        head = (
+            "<style>@font-face{font-family:F;src:url(/asset/font.woff2)}body{font-family:F}</style>"
+            + "".join(f"<script src='{third_party}/asset/tracker{i}.js'></script>" for i in range(3))
+        )
+        extra = (
+            "".join(f"<img src='/asset/photo{i}.jpg' width=64>" for i in range(assets))
+            + "<video src='/asset/clip.mp4' autoplay muted></video>"
+        )
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>Standings</title>{head}</head>"
+        "<body><table class='ms-table ms-table--standings'>"
+        "<thead><tr><th>Pos</th><th>Rider</th><th>Pts</th></tr></thead>"
+        f"<tbody>{body}</tbody></table>{extra}</body></html>"
+    ).encode("utf-8")
+
+
+ASSET_TYPES = {
+    ".jpg": "image/jpeg", ".woff2": "font/woff2", ".mp4": "video/mp4", ".js": "text/javascript",
+}
+
+
+def fixture_asset(name: str) -> tuple:
+    """(content type, body) for /asset/<name>: 64KB of filler, scripts are valid no-ops"""
+    ext = os.path.splitext(name)[1]
+    if ext == ".js":
+        return ASSET_TYPES[ext], b"/*" + b"x" * 65536 + b"*/ void 0;"
+    return ASSET_TYPES.get(ext, "application/octet-stream"), bytes(65536)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    GET /standings?rows=N&delay=MS serves a generated table with N riders
+    after MS ms (&assets=K&third_party=ORIGIN adds images, font, video and
+    scripts); GET /recorded?delay=MS serves the page given by --fixture
+    (a standings page saved from motorsport.com); GET /asset/NAME serves
+    the filler those pages reference.
+    """
+
+    recorded: Optional[bytes] = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        time.sleep(int(query.get("delay", ["0"])[0]) / 1000)
+        ctype = "text/html; charset=utf-8"
+        if url.path == "/recorded":
+            page = self.recorded
+            if page is None:
+                self.send_error(404, "start with --fixture to serve a recorded page")
+                return
+        elif url.path.startswith("/asset/"):
+            ctype, page = fixture_asset(url.path.rsplit("/", 1)[-1])
+        else:
+            page = fixture_html(
+                int(query.get("rows", ["29"])[0]),
+                int(query.get("assets", ["0"])[0]),
+                query.get("third_party", [""])[0],
+            )
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def fixture_url(server: "LocalServer", args) -> str:
+    """The standings page a scenario should load: recorded if given, else generated"""
+    if FixtureHandler.recorded is not None:
+        return f"{server.url}/recorded?delay={args.delay}"
+    return f"{server.url}/standings?rows={args.rows}&delay={args.delay}"
+
+
+class _BacklogHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs under bursts (1s retransmit stalls)
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class LocalServer:
+    """Threaded HTTP server on an ephemeral localhost port"""
+
+    def __init__(self, handler):
+        self.httpd = _BacklogHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class TelegramApiError(Exception):
+    def __init__(self, status: int, description: str, retry_after: Optional[int] = None):
+        super().__init__(description)
+        self.status = status
+        self.body = {"ok": False, "error_code": status, "description": description}
+        if retry_after is not None:
+            self.body["parameters"] = {"retry_after": retry_after}
+
+
+class FakeTelegramHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for api.telegram.org. Updates reach the bot either through
+    getUpdates long polling or, once setWebhook was called, as POSTs to the
+    webhook. Every API call and push costs `rtt` of simulated network time.
+    sendMessage records when each chat was answered; with flood_control on,
+    it answers like Telegram under load: more than GLOBAL_LIMIT sends in a
+    second, or two to one chat within a second, get 429 with retry_after,
+    and chats listed in `down` answer 502.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    GLOBAL_LIMIT = 30
+    rtt = 0.0
+    flood_control = False
+    lock = threading.Condition()
+    pusher = ThreadPoolExecutor(max_workers=40)
+    pending: List[Dict] = []
+    webhook: Dict = {}
+    pushed: Dict[int, float] = {}
+    replied: Dict[int, float] = {}
+    delivered: Dict[int, int] = {}
+    recent: List[float] = []
+    last_by_chat: Dict[int, float] = {}
+    down: set = set()
+    next_id = 1
+
+    @classmethod
+    def reset(cls, rtt: float = 0.0, flood_control: bool = False):
+        with cls.lock:
+            cls.rtt, cls.flood_control = rtt, flood_control
+            cls.pending, cls.webhook, cls.pushed, cls.replied = [], {}, {}, {}
+            cls.delivered, cls.recent, cls.last_by_chat, cls.down = {}, [], {}, set()
+
+    @classmethod
+    def make_update(cls, chat_id: int, text: str = "/help") -> Dict:
+        with cls.lock:
+            update_id = cls.next_id
+            cls.next_id += 1
+        command = text.split()[0]
+        return {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "bench"},
+                "text": text,
+                "entities": [{"type": "bot_command", "offset": 0, "length": len(command)}],
+            },
+        }
+
+    @classmethod
+    def make_inline_query(cls, user_id: int, query: str) -> Dict:
+        with cls.lock:
+            update_id = cls.next_id
+            cls.next_id += 1
+        return {
+            "update_id": update_id,
+            "inline_query": {
+                "id": str(user_id),
+                "from": {"id": user_id, "is_bot": False, "first_name": "bench"},
+                "query": query,
+                "offset": "",
+            },
+        }
+
+    @classmethod
+    def push_update(cls, chat_id: int, text: str = "/help"):
+        update = cls.make_update(chat_id, text)
+        with cls.lock:
+            cls.pushed[chat_id] = time.perf_counter()
+            if cls.webhook:
+                cls.pusher.submit(cls._push, dict(cls.webhook), update)
+            else:
+                cls.pending.append(update)
+                cls.lock.notify_all()
+
+    @classmethod
+    def _push(cls, webhook: Dict, update: Dict) -> int:
+        time.sleep(cls.rtt / 2)
+        request = urllib.request.Request(
+            webhook["url"], data=json.dumps(update).encode("utf-8"), method="POST",
+            headers={"Content-Type": "application/json",
+                     "X-Telegram-Bot-Api-Secret-Token": webhook.get("secret_token", "")},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        if "json" in self.headers.get("Content-Type", ""):
+            params = json.loads(raw or "{}")
+        else:
+            params = {}
+            for key, values in parse_qs(raw).items():
+                try:
+                    params[key] = json.loads(values[0])
+                except ValueError:
+                    params[key] = values[0]
+
+        time.sleep(self.rtt / 2)
+        api = getattr(self, f"api_{self.path.rsplit('/', 1)[-1]}", None)
+        try:
+            status, body = 200, {"ok": True, "result": api(params) if api else True}
+        except TelegramApiError as e:
+            status, body = e.status, e.body
+        data = json.dumps(body).encode("utf-8")
+        time.sleep(self.rtt / 2)
+
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # a long poll abandoned by a stopping updater
+
+    def api_getMe(self, params):
+        return {"id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+
+    def api_setWebhook(self, params):
+        with self.lock:
+            type(self).webhook = params
+        return True
+
+    def api_deleteWebhook(self, params):
+        with self.lock:
+            type(self).webhook = {}
+        return True
+
+    def api_getUpdates(self, params):
+        cls = type(self)
+        deadline = time.monotonic() + min(params.get("timeout", 0), 1)
+        with cls.lock:
+            cls.pending = [u for u in cls.pending if u["update_id"] >= params.get("offset", 0)]
+            while not cls.pending and time.monotonic() < deadline:
+                cls.lock.wait(deadline - time.monotonic())
+            return cls.pending[:params.get("limit", 100)]
+
+    def api_sendMessage(self, params):
+        cls = type(self)
+        chat_id = int(params["chat_id"])
+        now = time.monotonic()
+        with cls.lock:
+            if cls.flood_control:
+                cls.recent = [t for t in cls.recent if now - t < 1]
+                if chat_id in cls.down:
+                    raise TelegramApiError(502, "Bad Gateway")
+                if len(cls.recent) >= cls.GLOBAL_LIMIT or now - cls.last_by_chat.get(chat_id, -1) < 1:
+                    raise TelegramApiError(429, "Too Many Requests: retry after 1", retry_after=1)
+                cls.recent.append(now)
+                cls.last_by_chat[chat_id] = now
+            cls.replied[chat_id] = time.perf_counter()
+            cls.delivered[chat_id] = cls.delivered.get(chat_id, 0) + 1
+        return self._message(chat_id, params.get("text", ""))
+
+    def api_answerInlineQuery(self, params):
+        with self.lock:
+            type(self).replied[int(params["inline_query_id"])] = time.perf_counter()
+        return True
+
+    def api_editMessageText(self, params):
+        return self._message(int(params["chat_id"]), params.get("text", ""))
+
+    @staticmethod
+    def _message(chat_id: int, text: str) -> Dict:
+        return {"message_id": 1, "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"}, "text": text}
+
+    def log_message(self, format, *args):
+        pass
+
+# ==================== FAKE TELEGRAM OBJECTS ====================
+class FakeMessage:
+    """Stands in for telegram.Message: replies resolve immediately"""
+
+    def __init__(self, text: str = ""):
+        self.text = text
+
+    async def reply_text(self, text: str, **kwargs) -> "FakeMessage":
+        return FakeMessage(text)
+
+    async def edit_text(self, text: str, **kwargs) -> "FakeMessage":
+        self.text = text
+        return self
+
+
+_user_ids = itertools.count(1)
+
+
+def fake_update(text: str = "") -> SimpleNamespace:
+    """A minimal Update from a fresh user (so rate limits never interfere)"""
+    user_id = next(_user_ids)
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id, first_name="bench"),
+        message=FakeMessage(text),
+    )
+
+# ==================== REPORTING ====================
+RESULTS: List[Dict] = []
+
+
+def timed(fn: Callable, repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty sample"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def report(name: str, samples: List[float], elapsed: Optional[float] = None):
+    """
+    Print p50/p95 and throughput for one timing series and keep it for
+    --output. Throughput is samples per second of wall time when `elapsed`
+    is given (concurrent runs), otherwise per second of summed latency.
+    """
+    if not samples:
+        print(f"{name:<32} no samples")
+        return
+    seconds = elapsed if elapsed is not None else sum(samples) / 1000
+    row = {
+        "name": name,
+        "n": len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "throughput_per_s": len(samples) / seconds if seconds > 0 else None,
+    }
+    RESULTS.append(row)
+    throughput = f"{row['throughput_per_s']:10.1f}/s" if row["throughput_per_s"] else f"{'-':>10}  "
+    print(
+        f"{name:<32} p50 {row['p50_ms']:9.2f}ms   p95 {row['p95_ms']:9.2f}ms"
+        f"   max {row['max_ms']:9.2f}ms   {throughput}   n={row['n']}"
+    )
+
+
+def metric(name: str, value: float, unit: str = ""):
+    """Keep a single figure (memory, counts, rates) for --output"""
+    RESULTS.append({"name": name, "value": value, "unit": unit})
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def save_results(path: Path, args, status: int):
+    document = {
+        "scenario": args.scenario,
+        "status": status,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "args": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "results": RESULTS,
+    }
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    print(f"\nresults saved to {path}")
+
+
+def compare_results(path: Path):
+    """Print each result against the same name in an earlier --output file"""
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    before = {row["name"]: row for row in baseline.get("results", [])}
+    print(f"\ncompared with {path} ({baseline.get('revision') or 'unknown revision'}):")
+    for row in RESULTS:
+        old = before.get(row["name"])
+        if not old:
+            continue
+        key = "p50_ms" if "p50_ms" in row else "value"
+        if not old.get(key):
+            continue
+        change = (row[key] - old[key]) / old[key] * 100
+        print(f"  {row['name']:<32} {key} {old[key]:10.2f} -> {row[key]:10.2f}  ({change:+6.1f}%)")
+
+# ==================== SCENARIOS ====================
+def bench_extract(args) -> int:
+    """Parse phase: per-cell WebDriver calls vs one execute_script round trip"""
+    from auto01 import Config, SecureChromeDriver, EXTRACTORS, parse_extracted_rows
+
+    config = replace(Config.from_file(args.config), headless=True)
+
+    with LocalServer(FixtureHandler) as server, SecureChromeDriver(config) as driver:
+        driver.get(fixture_url(server, args))
+        for mode, extractor in EXTRACTORS.items():
+            rows = len(parse_extracted_rows(extractor(driver)))
+            samples = timed(lambda: parse_extracted_rows(extractor(driver)), args.repeat)
+            report(f"extract[{mode}] {rows} rows", samples)
+    return 0
+
+
+def bench_scrape(args) -> int:
+    """SecureMotoGPScraper.scrape end to end (navigation, readiness, extraction) in Chrome"""
+    from auto01 import Config, SecureChromeDriver, SecureMotoGPScraper
+
+    with LocalServer(FixtureHandler) as server:
+        config = replace(
+            Config.from_file(args.config), headless=True, motogp_url=fixture_url(server, args)
+        )
+        scraper = SecureMotoGPScraper(config)
+        with SecureChromeDriver(config) as driver:
+            rows = len(scraper.scrape(driver))
+            samples = timed(lambda: scraper.scrape(driver), args.repeat)
+        report(f"scrape chrome {rows} rows", samples)
+    return 0 if rows else 1
+
+
+def bench_parse(args) -> int:
+    """HTTP fast path: parse alone, and fetch + parse from the fixture server"""
+    from auto01 import Config, HttpStandingsFetcher, parse_standings_html
+
+    with LocalServer(FixtureHandler) as server:
+        url = fixture_url(server, args)
+        config = Config.from_file(args.config)
+        fetcher = HttpStandingsFetcher(config)
+        page = fetcher.session.get(url).content
+
+        rows = len(parse_standings_html(page))
+        report(f"parse html {rows} rows", timed(lambda: parse_standings_html(page), args.repeat))
+        report(f"http fetch+parse {rows} rows", timed(lambda: fetcher.fetch(url), args.repeat))
+    return 0 if rows else 1
+
+
+def _bench_bot_config(args, motogp_url: Optional[str] = None):
+    """BotConfig from --config with a throwaway data_dir (and a fixture URL if given)"""
+    from auto02 import BotConfig
+
+    config = BotConfig(args.config)
+    config.bot_token = "123456:BENCHMARK"
+    config.data_dir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+    config.standings_source = "scrape"
+    if motogp_url:
+        config.motogp_url = motogp_url
+    return config
+
+
+def bench_get_standings(args) -> int:
+    """SecureScraper.get_standings: cold fetch, cache hits and forced refreshes"""
+    from auto02 import SecureScraper
+
+    logging.getLogger("auto01").setLevel(logging.WARNING)
+    with LocalServer(FixtureHandler) as server:
+        scraper = SecureScraper(_bench_bot_config(args, fixture_url(server, args)))
+        try:
+            cold = timed(lambda: scraper.get_standings(), 1)
+            rows = len(scraper.get_standings())
+            report(f"get_standings cold {rows} rows", cold)
+            report("get_standings cached", timed(lambda: scraper.get_standings(), args.repeat * 10))
+            report(
+                "get_standings force_refresh",
+                timed(lambda: scraper.get_standings(force_refresh=True), args.repeat),
+            )
+        finally:
+            scraper.close()
+    return 0 if rows else 1
+
+
+def bench_commands(args) -> int:
+    """Every MotoGPBot.cmd_* through python-telegram-bot and the fake Bot API"""
+    from telegram import Update
+    from auto02 import BOT_COMMANDS, MotoGPBot, build_application
+
+    logging.getLogger("auto01").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    chat_ids = itertools.count(50_000)
+    command_args = {"rider": " rider7"}
+
+    with LocalServer(FixtureHandler) as pages, LocalServer(FakeTelegramHandler) as telegram:
+        FakeTelegramHandler.reset(rtt=args.rtt)
+        bot = MotoGPBot(_bench_bot_config(args, fixture_url(pages, args)))
+        # Two stored snapshots so /delta has something to compare
+        bot.scraper.history.append(synthetic_standings(args.rows, seed=2), taken_at=time.time() - 3600)
+        app = build_application(bot.scraper.config, bot, base_url=f"{telegram.url}/bot")
+
+        async def send(command: str):
+            chat_id = next(chat_ids)
+            update = Update.de_json(FakeTelegramHandler.make_update(chat_id, f"/{command}"), app.bot)
+            start = time.perf_counter()
+            await app.process_update(update)
+            if chat_id not in FakeTelegramHandler.replied:
+                raise RuntimeError(f"/{command} sent no reply")
+            return (time.perf_counter() - start) * 1000
+
+        async def inline(query: str):
+            user_id = next(chat_ids)
+            update = Update.de_json(FakeTelegramHandler.make_inline_query(user_id, query), app.bot)
+            start = time.perf_counter()
+            await app.process_update(update)
+            if user_id not in FakeTelegramHandler.replied:
+                raise RuntimeError("inline query got no answer")
+            return (time.perf_counter() - start) * 1000
+
+        async def run():
+            async with app:
+                report("/top10 cold (scrape)", [await send("top10")])
+                for command, _ in BOT_COMMANDS:
+                    start = time.perf_counter()
+                    samples = [await send(command + command_args.get(command, "")) for _ in range(args.repeat)]
+                    report(f"/{command}", samples, elapsed=time.perf_counter() - start)
+                start = time.perf_counter()
+                samples = [await inline("rider1") for _ in range(args.repeat)]
+                report("inline query", samples, elapsed=time.perf_counter() - start)
+
+        try:
+            asyncio.run(run())
+        finally:
+            bot.scraper.close()
+    return 0
+
+
+def bench_bot_load(args) -> int:
+    """Light commands must keep answering while a slow scrape is in flight"""
+    from auto02 import BotConfig, MotoGPBot
+
+    config = BotConfig(args.config)
+    config.data_dir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+    bot = MotoGPBot(config)
+    scrapes = []
+
+    def slow_scrape():
+        scrapes.append(time.perf_counter())
+        time.sleep(args.scrape_seconds)
+        return synthetic_standings(args.rows)
+
+    bot.scraper._scrape = slow_scrape
+
+    async def run():
+        heavy_cmds = [bot.cmd_top10, bot.cmd_team, bot.cmd_best]
+        light_cmds = {"start": bot.cmd_start, "help": bot.cmd_help, "stats": bot.cmd_stats}
+        light = {name: [] for name in light_cmds}
+
+        async def heavy(cmd):
+            start = time.perf_counter()
+            await cmd(fake_update(), None)
+            return (time.perf_counter() - start) * 1000
+
+        tasks = [
+            asyncio.create_task(heavy(heavy_cmds[i % len(heavy_cmds)]))
+            for i in range(args.concurrency)
+        ]
+        while not all(t.done() for t in tasks):
+            for name, cmd in light_cmds.items():
+                start = time.perf_counter()
+                await cmd(fake_update(), None)
+                light[name].append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.05)
+
+        report(f"heavy x{args.concurrency} (cache miss)", await asyncio.gather(*tasks))
+        for name, samples in light.items():
+            report(f"/{name} during scrape", samples)
+
+    try:
+        asyncio.run(run())
+    finally:
+        bot.scraper.close()
+
+    print(f"scrapes started: {len(scrapes)} (expected 1)")
+    return 0 if len(scrapes) == 1 else 1
+
+
+def bench_diff(args) -> int:
+    """Diff engine on large synthetic snapshots (cold compute vs cached)"""
+    from auto01 import Standings, StandingsDiffCache, StoredSnapshot, diff_standings
+
+    rng = random.Random(2)
+    previous = synthetic_standings(args.rows)
+    current = [dict(r, points=r["points"] + rng.randint(0, 25)) for r in previous]
+    current.sort(key=lambda r: r["points"], reverse=True)
+    for i, r in enumerate(current, 1):
+        r["position"] = i
+
+    previous, current = Standings.from_dicts(previous), Standings.from_dicts(current)
+    report(f"diff {args.rows} riders", timed(lambda: diff_standings(previous, current), args.repeat))
+
+    cache = StandingsDiffCache()
+    older, newer = StoredSnapshot(1, 0.0, previous), StoredSnapshot(2, 1.0, current)
+    cache.get(older, newer)
+    report(f"diff {args.rows} riders (cached)", timed(lambda: cache.get(older, newer), args.repeat))
+
+    diff = diff_standings(previous, current)
+    print(f"up {diff.up}, down {diff.down}, unchanged {diff.unchanged}, new {diff.new}")
+    return 0
+
+
+def _legacy_team_render(standings: List[Dict]) -> str:
+    """/team as it was before snapshot indexes: aggregate and sort per call"""
+    from collections import defaultdict
+
+    team_points = defaultdict(int)
+    team_riders = defaultdict(list)
+    for rider in standings:
+        team_points[rider["team"]] += rider["points"]
+        team_riders[rider["team"]].append(rider)
+    sorted_teams = sorted(team_points.items(), key=lambda x: x[1], reverse=True)
+
+    message = "🏁 <b>TEAM RANKINGS</b>\n\n"
+    for i, (team, points) in enumerate(sorted_teams[:10], 1):
+        riders = team_riders[team]
+        names = ", ".join([r["rider"] for r in riders[:2]])
+        message += f"<b>{i}. {team}</b>\n   📊 {points} pts | {len(riders)} riders\n   👥 {names}\n\n"
+    return message
+
+
+def bench_handlers_cpu(args) -> int:
+    """Handler CPU per call: per-request aggregation vs indexes built at ingest"""
+    from auto02 import MotoGPBot, StandingsSnapshot
+
+    for rows in (29, 10_000):
+        standings = synthetic_standings(rows)
+        if rows > len(TEAMS) * 10:
+            for i, r in enumerate(standings):  # many small teams, like a multi-season table
+                r["team"] = f"Team {i % (rows // 2)}"
+
+        snapshot = StandingsSnapshot(standings, time.time())
+        report(f"ingest indexes {rows} rows", timed(lambda: StandingsSnapshot(standings, 0), 5))
+        report(f"/team before {rows} rows", timed(lambda: _legacy_team_render(standings), args.repeat))
+        report(f"/team after  {rows} rows", timed(lambda: MotoGPBot._render_team(snapshot), args.repeat))
+        report(f"/best after  {rows} rows", timed(lambda: MotoGPBot._render_best(snapshot), args.repeat))
+        key = standings[-1]["rider"]
+        report(f"rider lookup {rows} rows", timed(lambda: snapshot.rider(key), args.repeat))
+    return 0
+
+
+def bench_rider_search(args) -> int:
+    """/rider lookups: exact, prefix, full-name, accent-free and typo queries on big corpora"""
+    from auto02 import RiderSearchIndex, StandingsSnapshot
+
+    # Contract on a real-looking table
+    snapshot = StandingsSnapshot([
+        {"position": i, "rider": name, "team": "Team", "points": 600 - i}
+        for i, name in enumerate(["M. Marquez", "A. Marquez", "F. Bagnaia", "M. Bezzecchi",
+                                  "F. Di Giannantonio", "Á. Espargaró"], 1)
+    ], time.time())
+    expect = {
+        "Marc Márquez": "M. Marquez", "marquez": "M. Marquez", "bagn": "F. Bagnaia",
+        "espargaro": "Á. Espargaró", "Aleix Espargaró": "Á. Espargaró", "bezecchi": "M. Bezzecchi",
+        "giannantonio": "F. Di Giannantonio",
+    }
+    ok = True
+    for query, rider in expect.items():
+        found = [r.rider for r in snapshot.search(query)]
+        ok &= bool(found) and found[0] == rider
+        print(f"  {query!r:>18} -> {found}")
+    ok &= snapshot.search("zzzz") == []
+
+    for size in (29, 20_000):
+        corpus = rider_corpus(size)
+        rows = StandingsSnapshot(corpus, 0).standings
+        report(f"index build {size} riders", timed(lambda: RiderSearchIndex(rows), max(1, args.repeat // 10)))
+        index = RiderSearchIndex(rows)
+
+        rng = random.Random(size)
+        targets = [rng.choice(corpus) for _ in range(200)]
+        queries = {
+            "exact": [t["rider"] for t in targets],
+            "prefix": [t["full_name"].split()[-1][:4] for t in targets],
+            "full name": [t["full_name"] for t in targets],
+            "accent-free": [t["full_name"].replace("á", "a").replace("í", "i").replace("ñ", "n") for t in targets],
+            "typo": [t["full_name"][:-2] + t["full_name"][-1] for t in targets],
+        }
+        for kind, batch in queries.items():
+            it = itertools.cycle(batch)
+            samples = timed(lambda: index.search(next(it)), args.repeat * 20)
+            report(f"{kind} lookup {size} riders", samples)
+            if kind != "prefix":
+                found = sum(
+                    any(r.rider == t["rider"] for r in index.search(q)) for q, t in zip(batch, targets)
+                )
+                print(f"    target in top 5: {found}/{len(batch)}")
+                metric(f"{kind} recall {size} riders", found / len(batch) * 100, "%")
+                # One dropped letter can turn a surname into a prefix of, or
+                # a near-twin to, another rider's: typos only need 80%
+                ok &= found >= (0.8 if kind == "typo" else 1.0) * len(batch)
+    print(f"search contract ok={ok}")
+    return 0 if ok else 1
+
+
+def bench_memory(args) -> int:
+    """Resident size of --repeat historical snapshots: JSON dicts vs Standings"""
+    from auto01 import Standings
+
+    # Distinct JSON documents, as loaded from disk or SQLite one snapshot at a time
+    documents = [json.dumps(synthetic_standings(args.rows, seed=i)) for i in range(args.repeat)]
+
+    def footprint(load) -> float:
+        tracemalloc.start()
+        held = [load(doc) for doc in documents]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del held
+        return size / 1024 / 1024
+
+    as_dicts = footprint(json.loads)
+    as_standings = footprint(lambda doc: Standings.from_dicts(json.loads(doc)))
+    print(f"{args.repeat} snapshots x {args.rows} rows")
+    print(f"  list of dicts   {as_dicts:8.2f} MB")
+    print(f"  Standings       {as_standings:8.2f} MB ({as_standings / as_dicts:.0%})")
+    metric(f"memory {args.repeat}x{args.rows} dicts", as_dicts, "MB")
+    metric(f"memory {args.repeat}x{args.rows} standings", as_standings, "MB")
+
+    lossless = all(
+        Standings.from_dicts(json.loads(doc)).to_dicts() == json.loads(doc) for doc in documents
+    )
+    print(f"round trip lossless: {lossless}")
+    return 0 if lossless else 1
+
+
+def bench_rate_limit(args) -> int:
+    """Limiter cost and memory with many distinct users and bursty traffic"""
+    from auto02 import CommandRateLimiter
+
+    logging.getLogger("auto02").setLevel(logging.ERROR)
+    limiter = CommandRateLimiter(max_calls=10, window=60, max_users=args.users // 2)
+    rng = random.Random(3)
+
+    # Mostly one-off users, plus a hot set that bursts well past the limit
+    hot = [rng.randrange(args.users) for _ in range(50)]
+    calls = []
+    for user_id in range(args.users):
+        calls.append(user_id)
+        if user_id % 100 == 0:
+            calls.extend([rng.choice(hot)] * 30)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    denied = sum(not limiter.is_allowed(user_id)[0] for user_id in calls)
+    elapsed = time.perf_counter() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(calls)} calls from {args.users} users: {denied} denied")
+    print(f"  {elapsed / len(calls) * 1e6:.2f}us per call   {len(calls) / elapsed:,.0f} calls/s")
+    print(f"  buckets held {len(limiter)} (cap {limiter.max_users}), evicted {limiter.evicted}")
+    print(f"  memory {size / 1024 / 1024:.2f} MB (peak {peak / 1024 / 1024:.2f} MB)")
+    metric("rate limiter per call", elapsed / len(calls) * 1e6, "us")
+    metric("rate limiter memory", size / 1024 / 1024, "MB")
+
+    # Contract: the 11th call inside the window is refused with a positive wait
+    probe = CommandRateLimiter(max_calls=10, window=60)
+    results = [probe.is_allowed(1) for _ in range(11)]
+    ok = all(allowed for allowed, _ in results[:10]) and results[10][0] is False and results[10][1] >= 1
+    print(f"(allowed, wait_time) contract: {ok} -> {results[10]}")
+    return 0 if ok and len(limiter) <= limiter.max_users else 1
+
+
+def bench_bot_stats(args) -> int:
+    """Bot statistics memory, cost per command and accuracy with many users"""
+    from auto02 import BotStats
+
+    logging.getLogger("auto02").setLevel(logging.ERROR)
+    commands = ("top10", "team", "delta", "best", "stats", "help")
+    rng = random.Random(5)
+    users = args.users
+    # Two records per user, spread over ten days so hour/day buckets roll over
+    calls = [(commands[rng.randrange(len(commands))], rng.randrange(users)) for _ in range(users * 2)]
+    start_ts = time.time() - 10 * 86400
+    step = 10 * 86400 / len(calls)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bot_stats.json"
+        stats = BotStats(path)
+        start = time.perf_counter()
+        for i, (command, user_id) in enumerate(calls):
+            stats.record(command, user_id, now=start_ts + i * step)
+        elapsed = time.perf_counter() - start
+
+        # Second pass under tracemalloc (which slows it down) for the retained size
+        tracemalloc.start()
+        traced = BotStats(None)
+        for i, (command, user_id) in enumerate(calls):
+            traced.record(command, user_id, now=start_ts + i * step)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del traced
+
+        tracemalloc.start()
+        legacy = set(user_id for _, user_id in calls)
+        legacy_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        estimate = stats.total.users.count()
+        error = abs(estimate - len(legacy)) / len(legacy) * 100
+        print(f"{len(calls)} commands from {len(legacy)} users")
+        print(f"  {elapsed / len(calls) * 1e6:.2f}us per record   {len(calls) / elapsed:,.0f} records/s")
+        print(f"  users ~{estimate} ({error:.2f}% error)   "
+              f"{len(stats.hours)} hours, {len(stats.days)} days kept")
+        print(f"  memory {size / 1024 / 1024:.2f} MB   (user id set: {legacy_size / 1024 / 1024:.2f} MB)")
+        metric("bot stats per record", elapsed / len(calls) * 1e6, "us")
+        metric("bot stats memory", size / 1024 / 1024, "MB")
+        metric("bot stats user error", error, "%")
+        report("bot stats ranking", timed(lambda: [stats.total.commands[c] for c in stats.ranking], args.repeat * 20))
+
+        stats.save()
+        report("bot stats save", timed(lambda: stats._write(stats.to_dict()), args.repeat))
+        restored = BotStats(path)
+        ok = (restored.total.total == len(calls)
+              and restored.total.users.count() == estimate
+              and restored.ranking == stats.ranking
+              and sorted(restored.ranking) == sorted(commands))
+        print(f"save/load round trip: {path.stat().st_size / 1024:.0f} KB on disk, ok={ok}")
+    return 0 if ok and error < 5 else 1
+
+
+def _legacy_fanout(api_url: str, chat_ids: List[str], text: str) -> int:
+    """The old client: one blocking POST per chat, no pacing, errors dropped"""
+    import requests
+
+    session = requests.Session()
+    sent = 0
+    for chat_id in chat_ids:
+        try:
+            r = session.post(api_url, json={"chat_id": chat_id, "text": text}, timeout=10)
+            r.raise_for_status()
+            sent += 1
+        except requests.RequestException:
+            pass
+    return sent
+
+
+def bench_telegram_fanout(args) -> int:
+    """Report fan-out against a local fake Bot API enforcing flood limits"""
+    from auto01 import TelegramDelivery
+
+    chat_ids = [str(1000 + i) for i in range(args.chats)]
+    text = "<b>MOTOGP 2025 UPDATE</b>\n\n🏁 1. M. Marquez - 545 pts\n"
+    retry_path = Path(tempfile.mkdtemp(prefix="motogp-bench-")) / "telegram_retry.jsonl"
+
+    with LocalServer(FakeTelegramHandler) as server:
+        FakeTelegramHandler.reset(rtt=0.02, flood_control=True)
+        start = time.perf_counter()
+        sent = _legacy_fanout(f"{server.url}/botTOKEN/sendMessage", chat_ids, text)
+        elapsed = time.perf_counter() - start
+        print(f"legacy sequential   {sent}/{len(chat_ids)} delivered in {elapsed:.2f}s")
+        metric("fanout legacy delivered", sent, "messages")
+
+        time.sleep(1)
+        FakeTelegramHandler.reset(rtt=0.02, flood_control=True)
+        FakeTelegramHandler.down = {int(chat_ids[-1])}
+        delivery = TelegramDelivery("TOKEN", chat_ids, api_base=server.url, retry_path=retry_path,
+                                    global_rate=args.rate, max_attempts=2)
+        result = delivery.send(text)
+        delivered = len(FakeTelegramHandler.delivered)
+        print(f"paced fan-out       {delivered}/{len(chat_ids)} delivered "
+              f"({result}); {len(chat_ids) / result.elapsed:.1f} msg/s")
+        metric("fanout paced delivered", delivered, "messages")
+        metric("fanout paced throughput", len(chat_ids) / result.elapsed, "msg/s")
+
+        queued = retry_path.exists() and len(retry_path.read_text(encoding="utf-8").splitlines())
+        FakeTelegramHandler.down = set()
+        delivery.chat_ids = []
+        drained = delivery.send(text)
+        print(f"retry queue         {queued} queued, next run re-sent {drained.sent}, "
+              f"left {drained.queued}")
+        delivered = len(FakeTelegramHandler.delivered)  # chats reached over both runs
+
+    ok = delivered == len(chat_ids) and not retry_path.exists()
+    return 0 if ok else 1
+
+
+def bench_webhook(args) -> int:
+    """Update-to-reply latency: long polling vs webhook, against a fake Telegram"""
+    import socket
+    from auto02 import BotConfig, MotoGPBot, build_application, serve_webhook
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    chat_ids = itertools.count(10_000)
+
+    async def drive() -> List[float]:
+        """Bursts of --concurrency updates, --repeat times; wait for every reply"""
+        chats = []
+        for _ in range(args.repeat):
+            burst = [next(chat_ids) for _ in range(args.concurrency)]
+            for chat_id in burst:
+                FakeTelegramHandler.push_update(chat_id)
+            chats += burst
+            await asyncio.sleep(0.2)
+        deadline = time.monotonic() + 30
+        while len(FakeTelegramHandler.replied) < len(chats) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return [
+            (FakeTelegramHandler.replied[c] - FakeTelegramHandler.pushed[c]) * 1000
+            for c in chats if c in FakeTelegramHandler.replied
+        ]
+
+    async def polling(app) -> List[float]:
+        async with app:
+            await app.start()
+            await app.updater.start_polling(poll_interval=0, timeout=1)
+            samples = await drive()
+            await app.updater.stop()
+            await app.stop()
+        return samples
+
+    async def webhook(app, config) -> List[float]:
+        stop = asyncio.Event()
+        server = asyncio.create_task(serve_webhook(app, config, stop))
+        while not FakeTelegramHandler.webhook:
+            await asyncio.sleep(0.01)
+        samples = await drive()
+        forged = await asyncio.to_thread(
+            FakeTelegramHandler._push,
+            dict(FakeTelegramHandler.webhook, secret_token="forged"), {"update_id": 0},
+        )
+        print(f"forged secret token answered HTTP {forged}")
+        stop.set()
+        await server
+        return samples
+
+    expected = args.concurrency * args.repeat
+    ok = True
+    with LocalServer(FakeTelegramHandler) as telegram:
+        for mode in ("polling", "webhook"):
+            FakeTelegramHandler.reset(rtt=args.rtt)
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+
+            config = BotConfig(args.config)
+            config.bot_token = "123456:BENCHMARK"
+            config.data_dir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+            config.mode = mode
+            config.webhook_url = f"http://127.0.0.1:{port}/telegram"
+            config.webhook_listen, config.webhook_port = "127.0.0.1", port
+            bot = MotoGPBot(config)
+            app = build_application(config, bot, base_url=f"{telegram.url}/bot")
+
+            start = time.perf_counter()
+            if mode == "polling":
+                samples = asyncio.run(polling(app))
+                bot.scraper.close()
+            else:
+                samples = asyncio.run(webhook(app, config))
+            elapsed = time.perf_counter() - start
+
+            report(f"{mode} update->reply", samples, elapsed=elapsed)
+            ok = ok and len(samples) == expected
+    return 0 if ok else 1
+
+
+def bench_pipeline(args) -> int:
+    """Multi-target scraping: wall time vs worker count on delayed fixture pages"""
+    from auto01 import Config, ScrapePipeline, ScrapeTarget
+
+    logging.getLogger("auto01").setLevel(logging.ERROR)
+    base = Config.from_file(args.config)
+    ok = True
+
+    with LocalServer(FixtureHandler) as server:
+        delay = args.delay or 250  # pages need some latency for workers to overlap
+        targets = [
+            ScrapeTarget(f"target-{i}", f"{server.url}/standings?rows={args.rows}&delay={delay}&t={i}")
+            for i in range(args.targets)
+        ]
+        baseline = None
+        for workers in (int(w) for w in args.workers.split(",")):
+            config = replace(base, data_dir=Path(tempfile.mkdtemp(prefix="motogp-bench-")))
+            pipeline = ScrapePipeline(config, targets, workers=workers, timeout=30, retries=0)
+            start = time.perf_counter()
+            results = pipeline.run()
+            elapsed = time.perf_counter() - start
+            pipeline.close()
+
+            saved = len(list(pipeline.out_dir.glob("target-*.json")))
+            baseline = baseline or elapsed
+            print(f"workers {workers:<3} {elapsed:6.2f}s   {len(targets) / elapsed:6.1f} targets/s"
+                  f"   speedup x{baseline / elapsed:4.1f}   saved {saved}/{len(targets)}")
+            metric(f"pipeline {workers} workers throughput", len(targets) / elapsed, "targets/s")
+            ok = ok and saved == len(targets) and all(r.ok for r in results)
+
+        # A target slower than its deadline fails after its retries; the rest still land
+        config = replace(base, data_dir=Path(tempfile.mkdtemp(prefix="motogp-bench-")))
+        slow = ScrapeTarget("slow", f"{server.url}/standings?rows={args.rows}&delay=1500")
+        pipeline = ScrapePipeline(config, targets[:3] + [slow], workers=4, timeout=0.5, retries=1)
+        results = {r.target.name: r for r in pipeline.run()}
+        pipeline.close()
+        print(f"timeout check: slow -> {results['slow'].error} "
+              f"({results['slow'].attempts} attempts), others ok: "
+              f"{all(r.ok for name, r in results.items() if name != 'slow')}")
+        ok = ok and not results["slow"].ok and results["slow"].attempts == 2
+    return 0 if ok else 1
+
+
+def bench_metrics(args) -> int:
+    """Phase timer overhead per call, export cost and the /metrics endpoint"""
+    from auto01 import MetricsServer, PhaseMetrics
+
+    metrics = PhaseMetrics()
+    calls = args.users
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        pass
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(calls):
+        with metrics.timer("render", command="top10"):
+            pass
+    timed_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(calls):
+        metrics.observe("telegram_send", 0.02)
+    observe_loop = time.perf_counter() - start
+
+    per_timer = (timed_loop - baseline) / calls * 1e6
+    print(f"{calls} observations")
+    print(f"  timer() {per_timer:.2f}us per call   observe() {observe_loop / calls * 1e6:.2f}us per call")
+    metric("metrics timer overhead", per_timer, "us")
+
+    # A realistic registry: every phase, a few label values each
+    for phase in ("driver_start", "page_load", "readiness_wait", "row_parse",
+                  "disk_save", "render", "telegram_send"):
+        for label in ("a", "b", "c"):
+            metrics.observe(phase, random.random(), path=label)
+    report("metrics prometheus export", timed(metrics.prometheus, args.repeat * 20))
+    report("metrics json export", timed(lambda: json.dumps(metrics.snapshot()), args.repeat * 20))
+
+    server = MetricsServer(metrics, port=0)
+    server.start()
+    try:
+        url = f"http://127.0.0.1:{server.port}"
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as r:
+            text = r.read().decode("utf-8")
+        with urllib.request.urlopen(f"{url}/metrics.json", timeout=5) as r:
+            snapshot = json.loads(r.read())
+    finally:
+        server.close()
+
+    count_line = f'motogp_phase_seconds_count{{phase="render",command="top10"}} {calls}'
+    ok = count_line in text and any(p["phase"] == "telegram_send" for p in snapshot["phases"])
+    print(f"endpoint: {len(text.splitlines())} Prometheus lines, {len(snapshot['phases'])} JSON phases, ok={ok}")
+    return 0 if ok else 1
+
+
+def bench_chrome_blocking(args) -> int:
+    """Chrome with and without the lean profile: bytes over the wire, load time, peak RSS"""
+    from auto01 import (
+        ChromeProfile, Config, PageReadiness, PeakRssSampler, page_transfer_stats, start_chrome,
+    )
+
+    config = replace(Config.from_file(args.config), headless=True)
+    status = 0
+    with LocalServer(FixtureHandler) as server:
+        # Trackers come from "localhost", the page from 127.0.0.1: a different
+        # host, which the allow-list below must keep from resolving
+        third_party = server.url.replace("127.0.0.1", "localhost")
+        url = f"{server.url}/standings?rows={args.rows}&assets=40&third_party={third_party}"
+        profiles = {
+            "full": ChromeProfile(
+                headless=True, chrome_version=config.chrome_version, lean=False,
+                window_size="1920,1080", load_images=True, block_resources=False,
+                restrict_hosts=False,
+            ),
+            "lean+blocking": ChromeProfile(
+                headless=True, chrome_version=config.chrome_version,
+                allowed_domains=["127.0.0.1"],
+            ),
+        }
+        for name, profile in profiles.items():
+            driver = start_chrome(profile)
+            try:
+                loads, transferred, rows = [], [], 0
+                with PeakRssSampler() as sampler:
+                    for _ in range(args.repeat):
+                        start = time.perf_counter()
+                        driver.get(url)
+                        rows = PageReadiness(driver, config).wait()
+                        loads.append((time.perf_counter() - start) * 1000)
+                        transferred.append(page_transfer_stats(driver).get("bytes", 0))
+            finally:
+                driver.quit()
+            report(f"chrome page load [{name}]", loads)
+            kb = sum(transferred) / len(transferred) / 1024
+            print(f"  {kb:.0f}KB transferred per load, {rows} rows, "
+                  f"peak rss {sampler.peak_mb or 0:.0f}MB")
+            metric(f"chrome transfer [{name}]", kb, "KB")
+            if sampler.peak_mb is not None:
+                metric(f"chrome peak rss [{name}]", sampler.peak_mb, "MB")
+            status = max(status, 0 if rows else 1)
+    return status
+
+
+class _SlowStream:
+    """A log stream whose writes take `delay` seconds (busy disk, slow console)"""
+
+    def __init__(self, path: Path, delay: float):
+        self.file = open(path, "a", encoding="utf-8")
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        return self.file.write(text)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def bench_logging(args) -> int:
+    """Handler latency under a command burst: direct file+console logging vs the queue"""
+    from auto01 import LOG_DATEFMT, LOG_FORMAT, setup_logging, stop_logging
+    from auto02 import MotoGPBot
+
+    bot = MotoGPBot(_bench_bot_config(args))
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    # The /help INFO records are what is being measured: other scenarios
+    # quieten these loggers, so set them explicitly
+    loggers = [logging.getLogger(name) for name in ("auto01", "auto02")]
+    saved_levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.INFO)
+    workdir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+    burst = args.concurrency * args.repeat
+
+    async def handle(samples: List[float]):
+        start = time.perf_counter()
+        await bot.cmd_help(fake_update("/help"), None)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    async def run_burst() -> tuple:
+        samples: List[float] = []
+        start = time.perf_counter()
+        await asyncio.gather(*(handle(samples) for _ in range(burst)))
+        return samples, time.perf_counter() - start
+
+    try:
+        for disk, delay in (("fast", 0.0), ("slow", 0.001)):
+            # Before: a FileHandler and a console handler on the calling thread
+            stream = _SlowStream(workdir / "console.log", delay)
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+            formatter = logging.Formatter(LOG_FORMAT, LOG_DATEFMT)
+            for handler in (logging.FileHandler(workdir / "direct.log", encoding="utf-8"),
+                            logging.StreamHandler(stream)):
+                handler.setFormatter(formatter)
+                root.addHandler(handler)
+            root.setLevel(logging.INFO)
+            samples, elapsed = asyncio.run(run_burst())
+            report(f"/help burst, direct log [{disk}]", samples, elapsed)
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+                handler.close()
+
+            # After: setup_logging's queue, the console stream swapped for the slow one
+            stdout, sys.stdout = sys.stdout, _SlowStream(workdir / "console.log", delay)
+            try:
+                setup_logging(workdir, {"max_bytes": 1024 * 1024}, name="queued", banner=None)
+            finally:
+                stream, sys.stdout = sys.stdout, stdout
+            samples, elapsed = asyncio.run(run_burst())
+            report(f"/help burst, queued log [{disk}]", samples, elapsed)
+            start = time.perf_counter()
+            stop_logging()
+            print(f"  queue drained {(time.perf_counter() - start) * 1000:.0f}ms after the burst")
+            stream.close()
+    finally:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+        for logger, level in zip(loggers, saved_levels):
+            logger.setLevel(level)
+        bot.scraper.close()
+    return 0
+
+
+# Imported lazily by the entry points; seeing one at start-up is a regression
+HEAVY_MODULES = ("selenium", "undetected_chromedriver", "requests", "lxml", "aiohttp")
+
+
+def _run_importtime(argv: List[str], timeout: float = 60) -> tuple:
+    """
+    Run `python -X importtime <argv>` from the repo root. Returns wall ms,
+    the exit code and cumulative import ms per top-level package.
+    """
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv], cwd=Path(__file__).parent,
+        capture_output=True, text=True, timeout=timeout,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    packages: Dict[str, float] = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        root = name.strip().split(".")[0]
+        packages[root] = max(packages.get(root, 0.0), int(cumulative) / 1000)
+    return wall, out.returncode, packages
+
+
+def _write_config(args, **overrides) -> Path:
+    """--config with nested overrides ({"telegram": {...}}) in a temp directory"""
+    with open(args.config, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    for section, values in overrides.items():
+        document.setdefault(section, {}).update(values)
+    path = Path(tempfile.mkdtemp(prefix="motogp-bench-")) / "config.json"
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+def bench_startup(args) -> int:
+    """Import cost per module, an unchanged auto01 run and the bot's first reply after a restart"""
+    status = 0
+    for module in ("auto01", "auto02"):
+        wall, _, packages = _run_importtime(["-c", f"import {module}"])
+        metric(f"import {module}", packages.get(module, 0.0), "ms")
+        heavy = [name for name in HEAVY_MODULES if name in packages]
+        top = sorted(
+            ((ms, name) for name, ms in packages.items() if name not in (module, "site")),
+            reverse=True,
+        )[:6]
+        print(f"import {module}: {packages.get(module, 0.0):.0f}ms ({wall:.0f}ms process)")
+        print("  " + " | ".join(f"{name} {ms:.0f}ms" for ms, name in top))
+        if heavy:
+            print(f"  heavy modules loaded at import: {', '.join(heavy)}")
+            status = 1
+        report(f"python -c 'import {module}'",
+               [_run_importtime(["-c", f"import {module}"])[0] for _ in range(args.repeat)])
+
+    # auto01 against the fixture page: the first run reports, the rest find it unchanged
+    with LocalServer(FixtureHandler) as pages, LocalServer(FakeTelegramHandler) as api:
+        FakeTelegramHandler.reset()
+        workdir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+        config = _write_config(
+            args,
+            telegram={"bot_token": "123456:BENCHMARK", "chat_id": "1",
+                      "subscriber_chat_ids": [], "api_base": api.url},
+            scraping={"motogp_url": fixture_url(pages, args), "targets": []},
+            paths={"data_dir": str(workdir / "data"), "logs_dir": str(workdir / "logs")},
+        )
+        first = _run_importtime(["auto01.py", "--config", str(config)], timeout=120)
+        samples, heavy = [], set()
+        for _ in range(args.repeat):
+            wall, code, packages = _run_importtime(["auto01.py", "--config", str(config)], timeout=120)
+            samples.append(wall)
+            # requests/lxml are the HTTP fast path itself; Chrome and aiohttp must stay out
+            heavy.update(name for name in ("selenium", "undetected_chromedriver", "aiohttp")
+                         if name in packages)
+            status = max(status, code)
+        print(f"auto01 first run {first[0]:.0f}ms (exit {first[1]})")
+        report("auto01 unchanged run (exit)", samples)
+        if heavy:
+            print(f"  unchanged run loaded: {', '.join(sorted(heavy))}")
+            status = 1
+
+    # auto02 restarts: spawn, push /help at once, time until the reply arrives
+    with LocalServer(FakeTelegramHandler) as api:
+        FakeTelegramHandler.reset(rtt=args.rtt)
+        workdir = Path(tempfile.mkdtemp(prefix="motogp-bench-"))
+        config = _write_config(
+            args,
+            telegram={"bot_token": "123456:BENCHMARK-BENCHMARK", "api_base": api.url},
+            bot={"mode": "polling", "standings_source": "files"},
+            paths={"data_dir": str(workdir / "data"), "logs_dir": str(workdir / "logs")},
+            metrics={"enabled": False},
+        )
+        samples = []
+        for i in range(args.repeat):
+            chat_id = 9_000_000 + i
+            start = time.perf_counter()
+            proc = subprocess.Popen(
+                [sys.executable, "auto02.py", "--config", str(config)],
+                cwd=Path(__file__).parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            FakeTelegramHandler.push_update(chat_id, "/help")
+            deadline = time.monotonic() + 60
+            while chat_id not in FakeTelegramHandler.replied and time.monotonic() < deadline:
+                if proc.poll() is not None:
+                    break
+                time.sleep(0.005)
+            replied = FakeTelegramHandler.replied.get(chat_id)
+            if replied is None:
+                status = 1
+            else:
+                samples.append((replied - start) * 1000)
+            proc.terminate()
+            try:
+                proc.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        report("auto02 restart to first reply", samples)
+    return status
+
+
+# Chrome-free scenarios, run in this order by `suite`
+SUITE = [
+    "parse", "get-standings", "commands", "diff", "handlers-cpu",
+    "rider-search", "memory", "rate-limit", "bot-stats", "pipeline", "telegram-fanout", "bot-load", "metrics",
+    "logging",
+]
+
+
+def bench_suite(args) -> int:
+    """Every offline scenario in one run (for --output / --compare)"""
+    status = 0
+    for name in SUITE:
+        print(f"\n=== {name} ===")
+        # Scenarios quieten loggers for their own runs; don't let that leak
+        levels = {
+            logger: logger.level
+            for logger in [logging.getLogger(), *logging.Logger.manager.loggerDict.values()]
+            if isinstance(logger, logging.Logger)
+        }
+        try:
+            status = max(status, SCENARIOS[name](args))
+        finally:
+            for logger, level in levels.items():
+                logger.setLevel(level)
+    return status
+
+
+SCENARIOS = {
+    "scrape": bench_scrape,
+    "parse": bench_parse,
+    "get-standings": bench_get_standings,
+    "commands": bench_commands,
+    "suite": bench_suite,
+    "extract": bench_extract,
+    "bot-load": bench_bot_load,
+    "diff": bench_diff,
+    "handlers-cpu": bench_handlers_cpu,
+    "rider-search": bench_rider_search,
+    "memory": bench_memory,
+    "rate-limit": bench_rate_limit,
+    "bot-stats": bench_bot_stats,
+    "telegram-fanout": bench_telegram_fanout,
+    "webhook": bench_webhook,
+    "pipeline": bench_pipeline,
+    "metrics": bench_metrics,
+    "startup": bench_startup,
+    "chrome-blocking": bench_chrome_blocking,
+    "logging": bench_logging,
+}
+
+# ==================== MAIN ====================
+def main() -> int:
+    parser = argparse.ArgumentParser(description="MotoGP bot benchmarks")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--rows", type=int, default=29)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scrape-seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--chats", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=25.0)
+    parser.add_argument("--rtt", type=float, default=0.0, help="fake Telegram round trip in s")
+    parser.add_argument("--targets", type=int, default=16)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--delay", type=int, default=0, help="fixture page delay in ms")
+    parser.add_argument("--fixture", type=Path, help="saved standings page to serve")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="earlier --output file to compare with")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.fixture:
+        FixtureHandler.recorded = args.fixture.read_bytes()
+
+    status = SCENARIOS[args.scenario](args)
+    if args.compare:
+        compare_results(args.compare)
+    if args.output:
+        save_results(args.output, args, status)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())